@@ -0,0 +1,50 @@
+"""
+Benchmark read_file_lines_count against the lines iteration implementation
+on a synthetic file, run it with: python benchmarks/read_file_lines_count.py
+"""
+
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from functools import partial
+
+import fsutil
+
+LINES_COUNT = 2_000_000
+REPEAT = 3
+
+
+def read_file_lines_count_by_lines_iteration(path: str) -> int:
+    with open(path, "rb") as file:
+        return sum(1 for line in file)
+
+
+def measure(func: Callable[[str], int], path: str) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        lines_count = func(path)
+        timings.append(time.perf_counter() - start)
+    assert lines_count == LINES_COUNT
+    return min(timings)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "lines.txt")
+        fsutil.write_file(path, "".join(f"{index}\n" for index in range(LINES_COUNT)))
+        funcs = {
+            "lines iteration": read_file_lines_count_by_lines_iteration,
+            "chunked": partial(fsutil.read_file_lines_count, workers=1),
+            "parallel (4 workers)": partial(fsutil.read_file_lines_count, workers=4),
+        }
+        print(
+            f"read_file_lines_count benchmark ({LINES_COUNT} lines, best of {REPEAT})"
+        )
+        for name, func in funcs.items():
+            print(f"{name}: {measure(func, path):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,9 @@ from fsutil.checks import (
     is_file,
 )
 from fsutil.converters import convert_size_bytes_to_string, convert_size_string_to_bytes
+from fsutil.index import (
+    update_dir_index,
+)
 from fsutil.info import (
     get_dir_creation_date,
     get_dir_creation_date_formatted,
@@ -38,14 +41,22 @@ from fsutil.info import (
     get_file_size_formatted,
 )
 from fsutil.io import (
+    iter_file_lines,
+    open_file_mmap,
     read_file,
+    read_file_bytes,
     read_file_from_url,
     read_file_json,
     read_file_lines,
     read_file_lines_count,
+    read_file_tail,
+    read_file_view,
     write_file,
     write_file_json,
 )
+from fsutil.lineindex import (
+    update_file_lines_index,
+)
 from fsutil.metadata import (
     __author__,
     __copyright__,
@@ -68,6 +79,12 @@ from fsutil.operations import (
     delete_file,
     delete_files,
     download_file,
+    download_files,
+    iter_dirs,
+    iter_files,
+    iter_search_dirs,
+    iter_search_entries,
+    iter_search_files,
     list_dirs,
     list_files,
     make_dirs,
@@ -87,6 +104,10 @@ from fsutil.operations import (
     replace_file,
     search_dirs,
     search_files,
+    sync_dir,
+)
+from fsutil.pathinfo import (
+    get_path_info,
 )
 from fsutil.paths import (
     get_file_basename,
@@ -134,6 +155,7 @@ __all__ = [
     "delete_file",
     "delete_files",
     "download_file",
+    "download_files",
     "exists",
     "extract_tar_file",
     "extract_zip_file",
@@ -155,6 +177,7 @@ __all__ = [
     "get_file_size_formatted",
     "get_filename",
     "get_parent_dir",
+    "get_path_info",
     "get_permissions",
     "get_unique_name",
     "is_dir",
@@ -162,6 +185,12 @@ __all__ = [
     "is_empty_dir",
     "is_empty_file",
     "is_file",
+    "iter_dirs",
+    "iter_file_lines",
+    "iter_files",
+    "iter_search_dirs",
+    "iter_search_entries",
+    "iter_search_files",
     "join_filename",
     "join_filepath",
     "join_path",
@@ -171,11 +200,15 @@ __all__ = [
     "make_dirs_for_file",
     "move_dir",
     "move_file",
+    "open_file_mmap",
     "read_file",
+    "read_file_bytes",
     "read_file_from_url",
     "read_file_json",
     "read_file_lines",
     "read_file_lines_count",
+    "read_file_tail",
+    "read_file_view",
     "remove_dir",
     "remove_dir_content",
     "remove_dirs",
@@ -193,7 +226,10 @@ __all__ = [
     "split_filename",
     "split_filepath",
     "split_path",
+    "sync_dir",
     "transform_filepath",
+    "update_dir_index",
+    "update_file_lines_index",
     "write_file",
     "write_file_json",
 ]
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Executor
+from contextlib import (
+    AbstractAsyncContextManager,
+    AbstractContextManager,
+    asynccontextmanager,
+)
+from functools import partial, wraps
+from itertools import islice
+from typing import Any, ParamSpec, TypeVar
+from weakref import WeakKeyDictionary
+
+import fsutil
+
+AIO_MAX_CONCURRENCY = 32
+AIO_ITER_BATCH_SIZE = 256
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+_executor: Executor | None = None
+_max_concurrency = AIO_MAX_CONCURRENCY
+_semaphores: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    WeakKeyDictionary()
+)
+_semaphores_lock = threading.Lock()
+
+
+def set_executor(
+    executor: Executor | None = None, *, max_concurrency: int | None = None
+) -> None:
+    """
+    Set the executor used to run the blocking calls, if None the event loop
+    default executor is used, and the max number of concurrent calls
+    per event loop (the other calls wait without using threads).
+    """
+    global _executor, _max_concurrency
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError(
+            f"Invalid max_concurrency: {max_concurrency!r}, expected a value >= 1."
+        )
+    with _semaphores_lock:
+        _executor = executor
+        _max_concurrency = max_concurrency or AIO_MAX_CONCURRENCY
+        _semaphores.clear()
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    with _semaphores_lock:
+        semaphore = _semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(_max_concurrency)
+            _semaphores[loop] = semaphore
+        return semaphore
+
+
+async def run(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """
+    Run the given blocking function in the executor and await its result,
+    waiting for a free slot if the max number of concurrent calls is reached.
+    """
+    async with _get_semaphore():
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_executor, partial(func, *args, **kwargs))
+
+
+def _next_batch(iterator: Iterator[T], size: int) -> list[T]:
+    return list(islice(iterator, size))
+
+
+async def iterate(
+    func: Callable[..., Iterator[T]], /, *args: Any, **kwargs: Any
+) -> AsyncGenerator[T]:
+    """
+    Iterate asynchronously over the iterator returned by the given function,
+    items are fetched in batches in the executor (one batch at a time).
+    """
+    iterator = await run(func, *args, **kwargs)
+    try:
+        while batch := await run(_next_batch, iterator, AIO_ITER_BATCH_SIZE):
+            for item in batch:
+                yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            await run(close)
+
+
+def _wrap(func: Callable[P, T]) -> Callable[P, Awaitable[T]]:
+    @wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> Awaitable[T]:
+        return run(func, *args, **kwargs)
+
+    return wrapper
+
+
+def _wrap_context_manager(
+    func: Callable[P, AbstractContextManager[T]],
+) -> Callable[P, AbstractAsyncContextManager[T]]:
+    """
+    Wrap the given context manager function, the context is entered
+    and exited in the executor.
+    """
+
+    @asynccontextmanager
+    async def context_manager_wrapper(
+        *args: P.args, **kwargs: P.kwargs
+    ) -> AsyncIterator[T]:
+        manager = func(*args, **kwargs)
+        value = await run(manager.__enter__)
+        try:
+            yield value
+        except BaseException as error:
+            exc_info = (type(error), error, error.__traceback__)
+            if not await run(manager.__exit__, *exc_info):
+                raise
+        else:
+            await run(manager.__exit__, None, None, None)
+
+    return wraps(func)(context_manager_wrapper)
+
+
+def _wrap_iter(func: Callable[P, Iterator[T]]) -> Callable[P, AsyncGenerator[T]]:
+    @wraps(func)
+    def iter_wrapper(*args: P.args, **kwargs: P.kwargs) -> AsyncGenerator[T]:
+        return iterate(func, *args, **kwargs)
+
+    return iter_wrapper
+
+
+assert_dir = _wrap(fsutil.assert_dir)
+assert_exists = _wrap(fsutil.assert_exists)
+assert_file = _wrap(fsutil.assert_file)
+assert_not_dir = _wrap(fsutil.assert_not_dir)
+assert_not_exists = _wrap(fsutil.assert_not_exists)
+assert_not_file = _wrap(fsutil.assert_not_file)
+clean_dir = _wrap(fsutil.clean_dir)
+convert_size_bytes_to_string = _wrap(fsutil.convert_size_bytes_to_string)
+convert_size_string_to_bytes = _wrap(fsutil.convert_size_string_to_bytes)
+copy_dir = _wrap(fsutil.copy_dir)
+copy_dir_content = _wrap(fsutil.copy_dir_content)
+copy_file = _wrap(fsutil.copy_file)
+create_dir = _wrap(fsutil.create_dir)
+create_file = _wrap(fsutil.create_file)
+create_tar_file = _wrap(fsutil.create_tar_file)
+create_zip_file = _wrap(fsutil.create_zip_file)
+delete_dir = _wrap(fsutil.delete_dir)
+delete_dir_content = _wrap(fsutil.delete_dir_content)
+delete_dirs = _wrap(fsutil.delete_dirs)
+delete_file = _wrap(fsutil.delete_file)
+delete_files = _wrap(fsutil.delete_files)
+download_file = _wrap(fsutil.download_file)
+download_files = _wrap(fsutil.download_files)
+exists = _wrap(fsutil.exists)
+extract_tar_file = _wrap(fsutil.extract_tar_file)
+extract_zip_file = _wrap(fsutil.extract_zip_file)
+get_dir_creation_date = _wrap(fsutil.get_dir_creation_date)
+get_dir_creation_date_formatted = _wrap(fsutil.get_dir_creation_date_formatted)
+get_dir_hash = _wrap(fsutil.get_dir_hash)
+get_dir_last_modified_date = _wrap(fsutil.get_dir_last_modified_date)
+get_dir_last_modified_date_formatted = _wrap(
+    fsutil.get_dir_last_modified_date_formatted
+)
+get_dir_size = _wrap(fsutil.get_dir_size)
+get_dir_size_formatted = _wrap(fsutil.get_dir_size_formatted)
+get_file_basename = _wrap(fsutil.get_file_basename)
+get_file_creation_date = _wrap(fsutil.get_file_creation_date)
+get_file_creation_date_formatted = _wrap(fsutil.get_file_creation_date_formatted)
+get_file_extension = _wrap(fsutil.get_file_extension)
+get_file_hash = _wrap(fsutil.get_file_hash)
+get_file_last_modified_date = _wrap(fsutil.get_file_last_modified_date)
+get_file_last_modified_date_formatted = _wrap(
+    fsutil.get_file_last_modified_date_formatted
+)
+get_file_size = _wrap(fsutil.get_file_size)
+get_file_size_formatted = _wrap(fsutil.get_file_size_formatted)
+get_filename = _wrap(fsutil.get_filename)
+get_parent_dir = _wrap(fsutil.get_parent_dir)
+get_path_info = _wrap(fsutil.get_path_info)
+get_permissions = _wrap(fsutil.get_permissions)
+get_unique_name = _wrap(fsutil.get_unique_name)
+is_dir = _wrap(fsutil.is_dir)
+is_empty = _wrap(fsutil.is_empty)
+is_empty_dir = _wrap(fsutil.is_empty_dir)
+is_empty_file = _wrap(fsutil.is_empty_file)
+is_file = _wrap(fsutil.is_file)
+iter_dirs = _wrap_iter(fsutil.iter_dirs)
+iter_file_lines = _wrap_iter(fsutil.iter_file_lines)
+iter_files = _wrap_iter(fsutil.iter_files)
+iter_search_dirs = _wrap_iter(fsutil.iter_search_dirs)
+iter_search_entries = _wrap_iter(fsutil.iter_search_entries)
+iter_search_files = _wrap_iter(fsutil.iter_search_files)
+join_filename = _wrap(fsutil.join_filename)
+join_filepath = _wrap(fsutil.join_filepath)
+join_path = _wrap(fsutil.join_path)
+list_dirs = _wrap(fsutil.list_dirs)
+list_files = _wrap(fsutil.list_files)
+make_dirs = _wrap(fsutil.make_dirs)
+make_dirs_for_file = _wrap(fsutil.make_dirs_for_file)
+move_dir = _wrap(fsutil.move_dir)
+move_file = _wrap(fsutil.move_file)
+open_file_mmap = _wrap_context_manager(fsutil.open_file_mmap)
+read_file = _wrap(fsutil.read_file)
+read_file_bytes = _wrap(fsutil.read_file_bytes)
+read_file_from_url = _wrap(fsutil.read_file_from_url)
+read_file_json = _wrap(fsutil.read_file_json)
+read_file_lines = _wrap(fsutil.read_file_lines)
+read_file_lines_count = _wrap(fsutil.read_file_lines_count)
+read_file_tail = _wrap(fsutil.read_file_tail)
+read_file_view = _wrap_context_manager(fsutil.read_file_view)
+remove_dir = _wrap(fsutil.remove_dir)
+remove_dir_content = _wrap(fsutil.remove_dir_content)
+remove_dirs = _wrap(fsutil.remove_dirs)
+remove_file = _wrap(fsutil.remove_file)
+remove_files = _wrap(fsutil.remove_files)
+rename_dir = _wrap(fsutil.rename_dir)
+rename_file = _wrap(fsutil.rename_file)
+rename_file_basename = _wrap(fsutil.rename_file_basename)
+rename_file_extension = _wrap(fsutil.rename_file_extension)
+replace_dir = _wrap(fsutil.replace_dir)
+replace_file = _wrap(fsutil.replace_file)
+search_dirs = _wrap(fsutil.search_dirs)
+search_files = _wrap(fsutil.search_files)
+set_permissions = _wrap(fsutil.set_permissions)
+split_filename = _wrap(fsutil.split_filename)
+split_filepath = _wrap(fsutil.split_filepath)
+split_path = _wrap(fsutil.split_path)
+sync_dir = _wrap(fsutil.sync_dir)
+transform_filepath = _wrap(fsutil.transform_filepath)
+update_dir_index = _wrap(fsutil.update_dir_index)
+update_file_lines_index = _wrap(fsutil.update_file_lines_index)
+write_file = _wrap(fsutil.write_file)
+write_file_json = _wrap(fsutil.write_file_json)
@@ -4,7 +4,7 @@ import os
 import sys
 import tarfile
 import zipfile
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Generator, Iterable
 from typing import Literal
 
 from fsutil.args import get_path as _get_path
@@ -19,6 +19,7 @@ from fsutil.checks import (
 )
 from fsutil.operations import make_dirs, make_dirs_for_file, remove_file
 from fsutil.paths import get_filename, join_path
+from fsutil.progress import ProgressCallback, ProgressTracker
 from fsutil.types import PathIn
 
 
@@ -28,10 +29,12 @@ def create_tar_file(
     *,
     overwrite: bool = True,
     compression: str = "",  # literal: gz, bz2, xz
+    progress: ProgressCallback | None = None,
 ) -> None:
     """
     Create tar file at path compressing directories/files listed in content_paths.
     If overwrite is allowed and dest tar already exists, it will be overwritten.
+    If progress is defined, it is called (rate-limited) with the progress.
     """
     path = _get_path(path)
     assert_not_dir(path)
@@ -48,6 +51,7 @@ def create_tar_file(
             filename = get_filename(path)
             filepath = join_path(basedir, filename)
             file.add(path, filepath)
+            tracker.add_file(path)
         elif is_dir(path):
             for item_name in os.listdir(path):
                 item_path = join_path(path, item_name)
@@ -56,10 +60,12 @@ def create_tar_file(
                 )
                 _write_content_to_tar_file(file, item_path, item_basedir)
 
+    tracker = ProgressTracker(progress, paths=map(_get_path, content_paths))
     mode = f"w:{compression}" if compression else "w"
     with tarfile.open(path, mode=mode) as file:  # type: ignore
         for content_path in content_paths:
             _write_content_to_tar_file(file, content_path)
+    tracker.finish(path=path)
 
 
 def create_zip_file(
@@ -68,10 +74,12 @@ def create_zip_file(
     *,
     overwrite: bool = True,
     compression: int = zipfile.ZIP_DEFLATED,
+    progress: ProgressCallback | None = None,
 ) -> None:
     """
     Create zip file at path compressing directories/files listed in content_paths.
     If overwrite is allowed and dest zip already exists, it will be overwritten.
+    If progress is defined, it is called (rate-limited) with the progress.
     """
     path = _get_path(path)
     assert_not_dir(path)
@@ -88,6 +96,7 @@ def create_zip_file(
             filename = get_filename(path)
             filepath = join_path(basedir, filename)
             file.write(path, filepath)
+            tracker.add_file(path)
         elif is_dir(path):
             for item_name in os.listdir(path):
                 item_path = join_path(path, item_name)
@@ -96,9 +105,21 @@ def create_zip_file(
                 )
                 _write_content_to_zip_file(file, item_path, item_basedir)
 
+    tracker = ProgressTracker(progress, paths=map(_get_path, content_paths))
     with zipfile.ZipFile(path, "w", compression) as file:
         for content_path in content_paths:
             _write_content_to_zip_file(file, content_path)
+    tracker.finish(path=path)
+
+
+def _iter_tar_members_with_progress(
+    members: Iterable[tarfile.TarInfo], tracker: ProgressTracker
+) -> Generator[tarfile.TarInfo]:
+    # members are reported as done when the next one is requested
+    for member in members:
+        yield member
+        if member.isfile():
+            tracker.update(bytes=member.size, files=1, path=member.name)
 
 
 def extract_tar_file(
@@ -112,12 +133,14 @@ def extract_tar_file(
         | Literal["fully_trusted", "tar", "data"]
     )
     | None = None,
+    progress: ProgressCallback | None = None,
 ) -> None:
     """
     Extract tar file at path to dest path.
     If autodelete, the archive will be deleted after extraction.
     If content_paths list is defined,
     only listed items will be extracted, otherwise all.
+    If progress is defined, it is called (rate-limited) with the progress.
     """
     path = _get_path(path)
     dest = _get_path(dest)
@@ -125,6 +148,14 @@ def extract_tar_file(
     assert_not_file(dest)
     make_dirs(dest)
     with tarfile.TarFile(path, "r") as file:
+        if progress is not None:
+            members = list(content_paths or file.getmembers())
+            tracker = ProgressTracker(
+                progress,
+                bytes_total=sum(member.size for member in members if member.isfile()),
+                files_total=sum(1 for member in members if member.isfile()),
+            )
+            content_paths = _iter_tar_members_with_progress(members, tracker)
         if sys.version_info < (3, 12):
             file.extractall(dest, members=content_paths)
         else:
@@ -135,22 +166,49 @@ def extract_tar_file(
                 numeric_owner=False,
                 filter=(filter or "data"),
             )
+    if progress is not None:
+        tracker.finish(path=dest)
     if autodelete:
         remove_file(path)
 
 
+def _extract_zip_file_with_progress(
+    file: zipfile.ZipFile,
+    dest: str,
+    content_paths: Iterable[str | zipfile.ZipInfo] | None,
+    progress: ProgressCallback,
+) -> None:
+    members = [
+        member if isinstance(member, zipfile.ZipInfo) else file.getinfo(member)
+        for member in (content_paths or file.infolist())
+    ]
+    files = [member for member in members if not member.is_dir()]
+    tracker = ProgressTracker(
+        progress,
+        bytes_total=sum(member.file_size for member in files),
+        files_total=len(files),
+    )
+    for member in members:
+        file.extract(member, dest)
+        if not member.is_dir():
+            tracker.update(bytes=member.file_size, files=1, path=member.filename)
+    tracker.finish(path=dest)
+
+
 def extract_zip_file(
     path: PathIn,
     dest: PathIn,
     *,
     autodelete: bool = False,
     content_paths: Iterable[str | zipfile.ZipInfo] | None = None,
+    progress: ProgressCallback | None = None,
 ) -> None:
     """
     Extract zip file at path to dest path.
     If autodelete, the archive will be deleted after extraction.
     If content_paths list is defined,
     only listed items will be extracted, otherwise all.
+    If progress is defined, it is called (rate-limited) with the progress.
     """
     path = _get_path(path)
     dest = _get_path(dest)
@@ -158,6 +216,9 @@ def extract_zip_file(
     assert_not_file(dest)
     make_dirs(dest)
     with zipfile.ZipFile(path, "r") as file:
-        file.extractall(dest, members=content_paths)
+        if progress is None:
+            file.extractall(dest, members=content_paths)
+        else:
+            _extract_zip_file_with_progress(file, dest, content_paths, progress)
     if autodelete:
         remove_file(path)
@@ -5,9 +5,9 @@ import os
 from fsutil.types import PathIn
 
 
-def get_path(path: PathIn) -> str:
+def get_path(path: PathIn | os.PathLike[str]) -> str:
     if path is None:
         return None
     if isinstance(path, str):
         return os.path.normpath(path)
-    return str(path)
+    return os.fspath(path)
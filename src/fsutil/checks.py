@@ -2,113 +2,110 @@ from __future__ import annotations
 
 import os
 
-from fsutil.args import get_path as _get_path
+from fsutil.pathinfo import PathInfo, get_path_info
 from fsutil.types import PathIn
 
 
-def assert_dir(path: PathIn) -> None:
+def assert_dir(path: PathIn | PathInfo) -> None:
     """
     Raise an OSError if the given path doesn't exist or it is not a directory.
     """
-    path = _get_path(path)
-    if not is_dir(path):
-        raise OSError(f"Invalid directory path: {path}")
+    info = get_path_info(path)
+    if not info.is_dir:
+        raise OSError(f"Invalid directory path: {info.path}")
 
 
-def assert_exists(path: PathIn) -> None:
+def assert_exists(path: PathIn | PathInfo) -> None:
     """
     Raise an OSError if the given path doesn't exist.
     """
-    path = _get_path(path)
-    if not exists(path):
-        raise OSError(f"Invalid item path: {path}")
+    info = get_path_info(path)
+    if not info.exists:
+        raise OSError(f"Invalid item path: {info.path}")
 
 
-def assert_file(path: PathIn) -> None:
+def assert_file(path: PathIn | PathInfo) -> None:
     """
     Raise an OSError if the given path doesn't exist or it is not a file.
     """
-    path = _get_path(path)
-    if not is_file(path):
-        raise OSError(f"Invalid file path: {path}")
+    info = get_path_info(path)
+    if not info.is_file:
+        raise OSError(f"Invalid file path: {info.path}")
 
 
-def assert_not_dir(path: PathIn) -> None:
+def assert_not_dir(path: PathIn | PathInfo) -> None:
     """
     Raise an OSError if the given path is an existing directory.
     """
-    path = _get_path(path)
-    if is_dir(path):
-        raise OSError(f"Invalid path, directory already exists: {path}")
+    info = get_path_info(path)
+    if info.is_dir:
+        raise OSError(f"Invalid path, directory already exists: {info.path}")
 
 
-def assert_not_exists(path: PathIn) -> None:
+def assert_not_exists(path: PathIn | PathInfo) -> None:
     """
     Raise an OSError if the given path already exists.
     """
-    path = _get_path(path)
-    if exists(path):
-        raise OSError(f"Invalid path, item already exists: {path}")
+    info = get_path_info(path)
+    if info.exists:
+        raise OSError(f"Invalid path, item already exists: {info.path}")
 
 
-def assert_not_file(path: PathIn) -> None:
+def assert_not_file(path: PathIn | PathInfo) -> None:
     """
     Raise an OSError if the given path is an existing file.
     """
-    path = _get_path(path)
-    if is_file(path):
-        raise OSError(f"Invalid path, file already exists: {path}")
+    info = get_path_info(path)
+    if info.is_file:
+        raise OSError(f"Invalid path, file already exists: {info.path}")
 
 
-def exists(path: PathIn) -> bool:
+def exists(path: PathIn | PathInfo) -> bool:
     """
     Check if a directory of a file exists at the given path.
     """
-    path = _get_path(path)
-    return os.path.exists(path)
+    return get_path_info(path).exists
 
 
-def is_dir(path: PathIn) -> bool:
+def is_dir(path: PathIn | PathInfo) -> bool:
     """
     Determine whether the specified path represents an existing directory.
     """
-    path = _get_path(path)
-    return os.path.isdir(path)
+    return get_path_info(path).is_dir
 
 
-def is_empty(path: PathIn) -> bool:
+def is_empty(path: PathIn | PathInfo) -> bool:
     """
     Determine whether the specified path represents an empty directory or an empty file.
     """
-    path = _get_path(path)
-    assert_exists(path)
-    if is_dir(path):
-        return is_empty_dir(path)
-    return is_empty_file(path)
+    info = get_path_info(path)
+    assert_exists(info)
+    if info.is_dir:
+        return is_empty_dir(info)
+    return is_empty_file(info)
 
 
-def is_empty_dir(path: PathIn) -> bool:
+def is_empty_dir(path: PathIn | PathInfo) -> bool:
     """
     Determine whether the specified path represents an empty directory.
     """
-    path = _get_path(path)
-    assert_dir(path)
-    return len(os.listdir(path)) == 0
+    info = get_path_info(path)
+    assert_dir(info)
+    with os.scandir(info.path) as entries:
+        return next(entries, None) is None
 
 
-def is_empty_file(path: PathIn) -> bool:
+def is_empty_file(path: PathIn | PathInfo) -> bool:
     """
     Determine whether the specified path represents an empty file.
     """
     from fsutil.info import get_file_size
 
-    path = _get_path(path)
-    return get_file_size(path) == 0
+    return get_file_size(get_path_info(path)) == 0
 
 
-def is_file(path: PathIn) -> bool:
+def is_file(path: PathIn | PathInfo) -> bool:
     """
     Determine whether the specified path represents an existing file.
     """
-    path = _get_path(path)
-    return os.path.isfile(path)
+    return get_path_info(path).is_file
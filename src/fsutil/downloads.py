@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from typing import Any
+
+from fsutil.args import get_path as _get_path
+from fsutil.deps import require_requests
+from fsutil.progress import ProgressCallback, ProgressTracker
+from fsutil.types import PathIn
+
+DOWNLOAD_SEGMENT_SIZE = 8 * 1024 * 1024
+DOWNLOAD_PART_EXTENSION = ".part"
+DOWNLOAD_PART_STATE_EXTENSION = ".part.json"
+DOWNLOAD_RETRY_STATUSES = (408, 429, 500, 502, 503, 504)
+
+_Range = tuple[int, int]
+
+
+def create_download_session(
+    *, pool_size: int = 10, retries: int = 0, backoff: float = 0.0
+) -> Any:
+    """
+    Create a requests session with a connection pool of the given size
+    (per host) that retries failed requests (connection errors
+    and retryable statuses) with exponential backoff.
+    """
+    requests = require_requests()
+    from urllib3.util.retry import Retry
+
+    max_retries = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=DOWNLOAD_RETRY_STATUSES,
+        allowed_methods=["GET", "HEAD"],
+        raise_on_status=False,
+    )
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=max_retries,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_download_size(headers: Any) -> int | None:
+    """
+    Get the size of the resource described by the given response headers
+    if it can be downloaded in ranges, otherwise None.
+    """
+    if (headers.get("accept-ranges") or "").lower() != "bytes":
+        return None
+    if (headers.get("content-encoding") or "identity").lower() != "identity":
+        return None
+    try:
+        size = int(headers.get("content-length") or 0)
+    except ValueError:
+        return None
+    return size or None
+
+
+def _get_download_validators(url: str, size: int, headers: Any) -> dict[str, Any]:
+    return {
+        "url": url,
+        "size": size,
+        "etag": headers.get("etag"),
+        "last_modified": headers.get("last-modified"),
+    }
+
+
+def _merge_ranges(ranges: list[_Range]) -> list[_Range]:
+    merged: list[_Range] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _get_missing_ranges(
+    size: int, completed: list[_Range], segment_size: int
+) -> list[_Range]:
+    """
+    Get the ranges (start included, end excluded) not yet completed,
+    splitted in segments of at most segment_size bytes.
+    """
+    missing = []
+    offset = 0
+    for start, end in [*_merge_ranges(completed), (size, size)]:
+        for segment_start in range(offset, start, segment_size):
+            missing.append((segment_start, min(segment_start + segment_size, start)))
+        offset = max(offset, end)
+    return missing
+
+
+def _load_download_state(
+    state_path: str, validators: dict[str, Any]
+) -> list[_Range] | None:
+    from fsutil.io import read_file_json
+
+    try:
+        state = read_file_json(state_path)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get("validators") != validators:
+        return None
+    return [(int(start), int(end)) for start, end in state.get("ranges", [])]
+
+
+def _save_download_state(
+    state_path: str, validators: dict[str, Any], ranges: list[_Range]
+) -> None:
+    from fsutil.io import write_file_json
+
+    state = {"validators": validators, "ranges": _merge_ranges(ranges)}
+    write_file_json(state_path, state, atomic=True)
+
+
+def _create_part_file(path: str, size: int) -> None:
+    with open(path, "wb") as file:
+        file.truncate(size)
+        if hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(file.fileno(), 0, size)
+            except OSError:
+                pass
+
+
+def _write_at(fd: int, data: bytes, offset: int, lock: threading.Lock) -> None:
+    view = memoryview(data)
+    while view:
+        if hasattr(os, "pwrite"):
+            written = os.pwrite(fd, view, offset)
+        else:
+            with lock:
+                os.lseek(fd, offset, os.SEEK_SET)
+                written = os.write(fd, view)
+        view = view[written:]
+        offset += written
+
+
+def _download_range(
+    get: Any,
+    url: str,
+    fd: int,
+    lock: threading.Lock,
+    byte_range: _Range,
+    *,
+    etag: str | None,
+    chunk_size: int,
+    tracker: ProgressTracker,
+    **kwargs: Any,
+) -> None:
+    start, end = byte_range
+    headers = dict(kwargs.pop("headers", None) or {})
+    headers["Range"] = f"bytes={start}-{end - 1}"
+    headers["Accept-Encoding"] = "identity"
+    if etag:
+        headers["If-Range"] = etag
+    with get(url, headers=headers, stream=True, **kwargs) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise OSError(f"Invalid range response ({response.status_code}): {url}")
+        offset = start
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            chunk = chunk[: end - offset]
+            _write_at(fd, chunk, offset, lock)
+            offset += len(chunk)
+            tracker.update(bytes=len(chunk))
+            if offset >= end:
+                break
+    if offset != end:
+        raise OSError(f"Incomplete range download ({start}-{end - 1}): {url}")
+
+
+def download_file_ranges(
+    url: str,
+    path: PathIn,
+    *,
+    size: int,
+    headers: Any = None,
+    workers: int | None = None,
+    resume: bool = False,
+    chunk_size: int = 8192,
+    session: Any = None,
+    progress: ProgressCallback | None = None,
+    **kwargs: Any,
+) -> None:
+    """
+    Download the resource of the given size at url to path
+    using http range requests, in parallel if workers is defined.
+    Data is written to a preallocated ".part" file and the completed ranges
+    are tracked in a ".part.json" sidecar file, if resume and they exist
+    (and the resource didn't change) only the missing ranges are downloaded.
+    The headers of a previous response of the same url are used
+    to detect resource changes.
+    If session is not provided, a new one is created for the download.
+    If progress is defined, it is called (rate-limited) with the progress.
+    """
+    path = _get_path(path)
+    part_path = path + DOWNLOAD_PART_EXTENSION
+    state_path = path + DOWNLOAD_PART_STATE_EXTENSION
+    validators = _get_download_validators(url, size, headers or {})
+    completed = None
+    if resume and os.path.isfile(part_path):
+        completed = _load_download_state(state_path, validators)
+    if completed is None:
+        completed = []
+        _create_part_file(part_path, size)
+        _save_download_state(state_path, validators, completed)
+    workers = max(workers or 1, 1)
+    segment_size = max(min(DOWNLOAD_SEGMENT_SIZE, -(-size // workers)), 1)
+    missing = _get_missing_ranges(size, completed, segment_size)
+    tracker = ProgressTracker(progress, bytes_total=size, files_total=1)
+    tracker.update(bytes=size - sum(end - start for start, end in missing), path=path)
+    errors: list[BaseException] = []
+    lock = threading.Lock()
+    fd = os.open(part_path, os.O_RDWR | getattr(os, "O_BINARY", 0))
+    try:
+        with (
+            (
+                nullcontext(session)
+                if session is not None
+                else create_download_session(pool_size=workers)
+            ) as session,
+            ThreadPoolExecutor(workers) as executor,
+        ):
+            futures = {
+                executor.submit(
+                    _download_range,
+                    session.get,
+                    url,
+                    fd,
+                    lock,
+                    byte_range,
+                    etag=validators["etag"],
+                    chunk_size=chunk_size,
+                    tracker=tracker,
+                    **kwargs,
+                ): byte_range
+                for byte_range in missing
+            }
+            for future in as_completed(futures):
+                error = future.exception()
+                if error is not None:
+                    errors.append(error)
+                    continue
+                completed.append(futures[future])
+                _save_download_state(state_path, validators, completed)
+    finally:
+        os.close(fd)
+    if errors:
+        raise errors[0]
+    os.replace(part_path, path)
+    os.remove(state_path)
+    tracker.update(files=1, path=path)
+    tracker.finish(path=path)
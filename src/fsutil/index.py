@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+from collections.abc import Generator, Iterable, Iterator
+from contextlib import closing
+
+from fsutil.args import get_path as _get_path
+from fsutil.checks import assert_dir, assert_file, assert_not_dir
+from fsutil.types import PathIn
+from fsutil.walk import PathFilter, PathMatcher, compile_matcher
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    relpath TEXT PRIMARY KEY,
+    parent TEXT,
+    type TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime INTEGER,
+    symlink INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS entries_parent ON entries (parent);
+"""
+
+INDEX_TYPE_DIR = "d"
+INDEX_TYPE_FILE = "f"
+INDEX_TYPE_OTHER = "o"
+
+_IndexEntry = tuple[str, str, str, int, int | None, int]
+
+
+def _connect(index_path: str) -> sqlite3.Connection:
+    connection = sqlite3.connect(index_path)
+    connection.executescript(INDEX_SCHEMA)
+    return connection
+
+
+def _get_index_root(connection: sqlite3.Connection) -> str | None:
+    row = connection.execute("SELECT value FROM meta WHERE key = 'root'").fetchone()
+    return str(row[0]) if row else None
+
+
+def _set_index_root(connection: sqlite3.Connection, root: str) -> None:
+    connection.execute("DELETE FROM entries")
+    connection.execute(
+        "INSERT OR REPLACE INTO meta (key, value) VALUES ('root', ?)", (root,)
+    )
+    connection.execute(
+        "INSERT INTO entries (relpath, parent, type, size, mtime) "
+        "VALUES ('', NULL, ?, 0, NULL)",
+        (INDEX_TYPE_DIR,),
+    )
+
+
+def _get_index_relpath(connection: sqlite3.Connection, path: str) -> str:
+    """
+    Get the path relative to the index root using "/" as separator,
+    the index root relative path is an empty string.
+    """
+    root = _get_index_root(connection)
+    relpath = os.path.relpath(os.path.abspath(path), root) if root else os.pardir
+    if relpath == os.pardir or relpath.startswith(os.pardir + os.sep):
+        raise ValueError(f"Invalid path, it is not contained in the index: {path}")
+    if relpath == os.curdir:
+        return ""
+    return relpath.replace(os.sep, "/")
+
+
+def _get_entry_type(entry: os.DirEntry[str]) -> str:
+    # symlinks have the type of their target (as for the walker)
+    try:
+        if entry.is_dir():
+            return INDEX_TYPE_DIR
+        if entry.is_file():
+            return INDEX_TYPE_FILE
+    except OSError:
+        pass
+    return INDEX_TYPE_OTHER
+
+
+def _get_entry_stat(entry: os.DirEntry[str]) -> os.stat_result:
+    try:
+        return entry.stat()
+    except OSError:
+        return entry.stat(follow_symlinks=False)
+
+
+def _scan_index_dir(dirpath: str, relpath: str) -> dict[str, _IndexEntry]:
+    entries: dict[str, _IndexEntry] = {}
+    with os.scandir(dirpath) as entries_iter:
+        for entry in entries_iter:
+            entry_relpath = f"{relpath}/{entry.name}" if relpath else entry.name
+            entry_type = _get_entry_type(entry)
+            entry_stat = _get_entry_stat(entry)
+            entry_symlink = int(entry.is_symlink())
+            # directories mtime is set only once they have been scanned
+            # (symlinked directories are never scanned)
+            entry_mtime = (
+                entry_stat.st_mtime_ns
+                if entry_type != INDEX_TYPE_DIR or entry_symlink
+                else None
+            )
+            entries[entry_relpath] = (
+                entry_relpath,
+                relpath,
+                entry_type,
+                entry_stat.st_size,
+                entry_mtime,
+                entry_symlink,
+            )
+    return entries
+
+
+def _remove_index_entries(
+    connection: sqlite3.Connection, relpaths: Iterable[str]
+) -> None:
+    for relpath in relpaths:
+        prefix = f"{relpath}/"
+        connection.execute(
+            "DELETE FROM entries WHERE relpath = ? OR substr(relpath, 1, ?) = ?",
+            (relpath, len(prefix), prefix),
+        )
+
+
+def _update_index_dir(
+    connection: sqlite3.Connection, dirpath: str, relpath: str
+) -> list[str]:
+    """
+    Update the index entries of the directory at the given path
+    only if its mtime changed since the last update,
+    and return the relative paths of its sub-directories.
+    """
+    dir_mtime = os.stat(dirpath).st_mtime_ns
+    row = connection.execute(
+        "SELECT mtime FROM entries WHERE relpath = ?", (relpath,)
+    ).fetchone()
+    if row is None or row[0] != dir_mtime:
+        entries = _scan_index_dir(dirpath, relpath)
+        indexed_entries = connection.execute(
+            "SELECT relpath, type, symlink FROM entries WHERE parent = ?", (relpath,)
+        ).fetchall()
+        _remove_index_entries(
+            connection,
+            [
+                entry_relpath
+                for entry_relpath, entry_type, entry_symlink in indexed_entries
+                if entry_relpath not in entries
+                or entries[entry_relpath][2] != entry_type
+                or entries[entry_relpath][5] != entry_symlink
+            ],
+        )
+        connection.executemany(
+            "INSERT INTO entries (relpath, parent, type, size, mtime, symlink) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (relpath) DO UPDATE SET "
+            "size = excluded.size, mtime = coalesce(excluded.mtime, mtime)",
+            entries.values(),
+        )
+        connection.execute(
+            "UPDATE entries SET mtime = ? WHERE relpath = ?", (dir_mtime, relpath)
+        )
+    rows = connection.execute(
+        "SELECT relpath FROM entries WHERE parent = ? AND type = ? AND symlink = 0",
+        (relpath, INDEX_TYPE_DIR),
+    )
+    return [str(row[0]) for row in rows]
+
+
+def update_dir_index(path: PathIn, index_path: PathIn) -> None:
+    """
+    Create or update the index (sqlite database) at index_path of the directory
+    tree at the given path, storing paths, types, sizes and mtimes.
+    The index is updated incrementally, only directories whose mtime changed
+    are scanned again (files modified in place are updated only when
+    their directory changes).
+    Symlinks are stored with the type, size and mtime of their target,
+    but the content of symlinked directories is never indexed.
+    """
+    path = _get_path(path)
+    index_path = _get_path(index_path)
+    assert_dir(path)
+    assert_not_dir(index_path)
+    index_dirpath = os.path.dirname(index_path)
+    if index_dirpath:
+        os.makedirs(index_dirpath, exist_ok=True)
+    root = os.path.abspath(path)
+    with closing(_connect(index_path)) as connection, connection:
+        if _get_index_root(connection) != root:
+            _set_index_root(connection, root)
+        stack = [""]
+        while stack:
+            relpath = stack.pop()
+            dirpath = os.path.join(root, *relpath.split("/")) if relpath else root
+            try:
+                stack.extend(_update_index_dir(connection, dirpath, relpath))
+            except FileNotFoundError:
+                _remove_index_entries(connection, [relpath])
+
+
+_IndexRow = tuple[str, str, int, int | None, int]
+
+
+def _query_index_entries(
+    connection: sqlite3.Connection, relpath: str
+) -> Iterable[_IndexRow]:
+    if not relpath:
+        return connection.execute(
+            "SELECT relpath, type, size, mtime, symlink FROM entries "
+            "WHERE relpath != '' ORDER BY relpath"
+        )
+    prefix = f"{relpath}/"
+    return connection.execute(
+        "SELECT relpath, type, size, mtime, symlink FROM entries "
+        "WHERE substr(relpath, 1, ?) = ? ORDER BY relpath",
+        (len(prefix), prefix),
+    )
+
+
+def _iter_index_entries(
+    connection: sqlite3.Connection, relpath: str, matcher: PathMatcher
+) -> Generator[_IndexRow]:
+    """
+    Iterate over the index entries contained at relpath (with paths relative
+    to it) skipping the excluded ones and the content of excluded directories.
+    """
+    excluded_dirs: set[str] = set()
+    for entry_relpath, entry_type, size, mtime, symlink in _query_index_entries(
+        connection, relpath
+    ):
+        subpath = entry_relpath[len(relpath) + 1 :] if relpath else entry_relpath
+        is_dir = entry_type == INDEX_TYPE_DIR
+        # entries are sorted, so parent directories come before their content
+        parent, _, _ = subpath.rpartition("/")
+        if (parent and parent in excluded_dirs) or (
+            matcher.excludes and matcher.exclude(subpath, is_dir=is_dir)
+        ):
+            if is_dir:
+                excluded_dirs.add(subpath)
+            continue
+        yield (subpath, entry_type, size, mtime, symlink)
+
+
+def _get_index_followed_dirs(
+    connection: sqlite3.Connection,
+    relpath: str,
+    matcher: PathMatcher,
+    max_depth: int | None,
+) -> list[str]:
+    """
+    Get the symlinked directories contained at relpath (with paths relative
+    to it) that the walker would follow searching for the given matcher.
+    """
+    query = "SELECT relpath FROM entries WHERE type = ? AND symlink = 1"
+    params: tuple[str | int, ...] = (INDEX_TYPE_DIR,)
+    if relpath:
+        prefix = f"{relpath}/"
+        query += " AND substr(relpath, 1, ?) = ?"
+        params += (len(prefix), prefix)
+    followed_dirs = []
+    for (entry_relpath,) in connection.execute(query, params):
+        subpath = entry_relpath[len(relpath) + 1 :] if relpath else entry_relpath
+        parts = subpath.split("/")
+        if max_depth is not None and len(parts) >= max_depth:
+            continue
+        if not matcher.match_walk(subpath):
+            continue
+        if matcher.excludes and any(
+            matcher.exclude("/".join(parts[:index]), is_dir=True)
+            for index in range(1, len(parts) + 1)
+        ):
+            continue
+        followed_dirs.append(subpath)
+    return followed_dirs
+
+
+def _iter_dir_index_paths(
+    index_path: str,
+    path: str,
+    matcher: PathMatcher,
+    *,
+    dirs: bool,
+    max_depth: int | None,
+    path_filter: PathFilter | None,
+) -> Generator[str]:
+    search_type = INDEX_TYPE_DIR if dirs else INDEX_TYPE_FILE
+    with closing(_connect(index_path)) as connection:
+        relpath = _get_index_relpath(connection, path)
+        entries = _iter_index_entries(connection, relpath, matcher)
+        for subpath, entry_type, size, mtime, symlink in entries:
+            if entry_type != search_type:
+                continue
+            if max_depth is not None and subpath.count("/") >= max_depth:
+                continue
+            if not matcher.match(subpath, is_dir=dirs):
+                continue
+            if path_filter is not None and not (
+                path_filter.match_name(subpath, is_symlink=bool(symlink))
+                and path_filter.match_stat(size=size, mtime=(mtime or 0) / 1e9)
+            ):
+                continue
+            yield os.path.join(path, *subpath.split("/"))
+
+
+def search_dir_index(
+    index_path: PathIn,
+    path: PathIn,
+    pattern: str | Iterable[str],
+    *,
+    dirs: bool = False,
+    exclude: str | Iterable[str] | None = None,
+    max_depth: int | None = None,
+    follow_symlinks: bool = False,
+    path_filter: PathFilter | None = None,
+) -> Iterator[str]:
+    """
+    Search the index at index_path for files (or directories if dirs)
+    at path matching the given pattern(s) and the optional path filter,
+    without walking the file-system.
+    The content of symlinked directories is not indexed, so if follow_symlinks
+    and the search would descend into a symlinked directory, a ValueError
+    is raised (before searching) instead of returning partial results.
+    """
+    index_path = _get_path(index_path)
+    path = _get_path(path)
+    assert_file(index_path)
+    matcher = compile_matcher(pattern, exclude=exclude)
+    with closing(_connect(index_path)) as connection:
+        relpath = _get_index_relpath(connection, path)
+        if follow_symlinks:
+            followed_dirs = _get_index_followed_dirs(
+                connection, relpath, matcher, max_depth
+            )
+            if followed_dirs:
+                raise ValueError(
+                    "Invalid follow_symlinks: the content of symlinked directories "
+                    f"is not indexed ({followed_dirs[0]!r}), "
+                    "search with follow_symlinks=False or without index."
+                )
+    return _iter_dir_index_paths(
+        index_path,
+        path,
+        matcher,
+        dirs=dirs,
+        max_depth=max_depth,
+        path_filter=path_filter,
+    )
+
+
+def get_dir_index_size(index_path: PathIn, path: PathIn) -> int:
+    """
+    Get the size in bytes of the directory at path using the index at index_path.
+    """
+    index_path = _get_path(index_path)
+    path = _get_path(path)
+    assert_file(index_path)
+    with closing(_connect(index_path)) as connection:
+        relpath = _get_index_relpath(connection, path)
+        query = (
+            "SELECT coalesce(sum(size), 0) FROM entries WHERE type = ? AND symlink = 0"
+        )
+        params: tuple[str | int, ...] = (INDEX_TYPE_FILE,)
+        if relpath:
+            prefix = f"{relpath}/"
+            query += " AND substr(relpath, 1, ?) = ?"
+            params += (len(prefix), prefix)
+        row = connection.execute(query, params).fetchone()
+    return int(row[0])
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
 import hashlib
+import mmap
 import os
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from typing import IO
 
 from fsutil.args import get_path as _get_path
 from fsutil.checks import assert_dir, assert_file
 from fsutil.converters import convert_size_bytes_to_string
+from fsutil.index import get_dir_index_size
 from fsutil.operations import search_files
+from fsutil.pathinfo import PathInfo, get_path_info
+from fsutil.progress import ProgressCallback, ProgressTracker
 from fsutil.types import PathIn
+from fsutil.walk import walk_entries
 
 
 def get_dir_creation_date(path: PathIn) -> datetime:
@@ -35,41 +42,58 @@ def get_dir_creation_date_formatted(
     return date.strftime(format)
 
 
-def get_dir_hash(path: PathIn, *, func: str = "md5") -> str:
+def _get_file_hash_with_progress(
+    path: str, *, func: str, tracker: ProgressTracker
+) -> str:
+    file_hash = get_file_hash(path, func=func)
+    tracker.add_file(path)
+    return file_hash
+
+
+def get_dir_hash(
+    path: PathIn,
+    *,
+    func: str = "md5",
+    workers: int | None = None,
+    progress: ProgressCallback | None = None,
+) -> str:
     """
     Get the hash of the directory at the given path using
     the specified algorithm function (md5 by default).
+    If workers is defined, the directory is walked and its files
+    are hashed in parallel using a pool of workers threads.
+    If progress is defined, it is called (rate-limited) with the progress.
     """
     path = _get_path(path)
     assert_dir(path)
     hash_ = hashlib.new(func)
-    files = search_files(path)
-    for file in sorted(files):
-        file_hash = get_file_hash(file, func=func)
+    files = sorted(search_files(path, workers=workers))
+    tracker = ProgressTracker(progress, paths=files)
+    hash_file = partial(_get_file_hash_with_progress, func=func, tracker=tracker)
+    if workers is not None and workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            files_hashes = list(executor.map(hash_file, files))
+    else:
+        files_hashes = [hash_file(file) for file in files]
+    for file_hash in files_hashes:
         file_hash_b = bytes(file_hash, "utf-8")
         hash_.update(file_hash_b)
+    tracker.finish(path=path)
     hash_hex = hash_.hexdigest()
     return hash_hex
 
 
-def get_dir_last_modified_date(path: PathIn) -> datetime:
+def get_dir_last_modified_date(path: PathIn, *, workers: int | None = None) -> datetime:
     """
     Get the directory last modification date.
+    If workers is defined, the directory is walked in parallel
+    using a pool of workers threads.
     """
     path = _get_path(path)
     assert_dir(path)
     last_modified_timestamp = os.path.getmtime(path)
-    for basepath, dirnames, filenames in os.walk(path):
-        for dirname in dirnames:
-            dirpath = os.path.join(basepath, dirname)
-            last_modified_timestamp = max(
-                last_modified_timestamp, os.path.getmtime(dirpath)
-            )
-        for filename in filenames:
-            filepath = os.path.join(basepath, filename)
-            last_modified_timestamp = max(
-                last_modified_timestamp, os.path.getmtime(filepath)
-            )
+    for entry in walk_entries(path, follow_symlinks=False, workers=workers):
+        last_modified_timestamp = max(last_modified_timestamp, entry.stat().st_mtime)
     last_modified_date = datetime.fromtimestamp(last_modified_timestamp)
     return last_modified_date
 
@@ -85,18 +109,24 @@ def get_dir_last_modified_date_formatted(
     return date.strftime(format)
 
 
-def get_dir_size(path: PathIn) -> int:
+def get_dir_size(
+    path: PathIn, *, workers: int | None = None, index: PathIn | None = None
+) -> int:
     """
     Get the directory size in bytes.
+    If workers is defined, the directory is walked in parallel
+    using a pool of workers threads.
+    If index is defined, the size is computed using the index
+    at the given path (see update_dir_index) without walking the file-system.
     """
     path = _get_path(path)
+    if index is not None:
+        return get_dir_index_size(index, path)
     assert_dir(path)
     size = 0
-    for basepath, _, filenames in os.walk(path):
-        for filename in filenames:
-            filepath = os.path.join(basepath, filename)
-            if not os.path.islink(filepath):
-                size += get_file_size(filepath)
+    for entry in walk_entries(path, follow_symlinks=False, workers=workers):
+        if entry.is_file(follow_symlinks=False):
+            size += entry.stat(follow_symlinks=False).st_size
     return size
 
 
@@ -109,13 +139,13 @@ def get_dir_size_formatted(path: PathIn) -> str:
     return size_formatted
 
 
-def get_file_creation_date(path: PathIn) -> datetime:
+def get_file_creation_date(path: PathIn | PathInfo) -> datetime:
     """
     Get the file creation date.
     """
-    path = _get_path(path)
-    assert_file(path)
-    creation_timestamp = os.path.getctime(path)
+    info = get_path_info(path)
+    assert_file(info)
+    creation_timestamp = info.ctime
     creation_date = datetime.fromtimestamp(creation_timestamp)
     return creation_date
 
@@ -131,19 +161,33 @@ def get_file_creation_date_formatted(
     return date.strftime(format)
 
 
-def get_file_hash(path: PathIn | IO[bytes], *, func: str = "md5") -> str:
+def get_file_hash(
+    path: PathIn | IO[bytes] | bytes | bytearray | memoryview | mmap.mmap,
+    *,
+    func: str = "md5",
+    use_mmap: bool = False,
+) -> str:
     """
     Get the hash of the file at the given path (or of the given
-    binary file-like object) using the specified algorithm
-    function (md5 by default).
+    binary file-like object or buffer, eg. a read_file_view memoryview)
+    using the specified algorithm function (md5 by default).
+    If use_mmap, the file is hashed through a memory map (see read_file_view)
+    without reading it on the heap, otherwise it is read in chunks.
     """
     hash = hashlib.new(func)
-    if isinstance(path, (str, pathlib.Path)):
+    if isinstance(path, (str, pathlib.Path)) and use_mmap:
+        from fsutil.io import read_file_view
+
+        with read_file_view(path) as view:
+            hash.update(view)
+    elif isinstance(path, (str, pathlib.Path)):
         path = _get_path(path)
         assert_file(path)
         with open(path, "rb") as file:
             for chunk in iter(lambda: file.read(4096), b""):
                 hash.update(chunk)
+    elif isinstance(path, (bytes, bytearray, memoryview, mmap.mmap)):
+        hash.update(path)
     else:
         fileobj = path
         position = None
@@ -158,13 +202,13 @@ def get_file_hash(path: PathIn | IO[bytes], *, func: str = "md5") -> str:
     return hash_hex
 
 
-def get_file_last_modified_date(path: PathIn) -> datetime:
+def get_file_last_modified_date(path: PathIn | PathInfo) -> datetime:
     """
     Get the file last modification date.
     """
-    path = _get_path(path)
-    assert_file(path)
-    last_modified_timestamp = os.path.getmtime(path)
+    info = get_path_info(path)
+    assert_file(info)
+    last_modified_timestamp = info.mtime
     last_modified_date = datetime.fromtimestamp(last_modified_timestamp)
     return last_modified_date
 
@@ -180,15 +224,13 @@ def get_file_last_modified_date_formatted(
     return date.strftime(format)
 
 
-def get_file_size(path: PathIn) -> int:
+def get_file_size(path: PathIn | PathInfo) -> int:
     """
     Get the directory size in bytes.
     """
-    path = _get_path(path)
-    assert_file(path)
-    # size = os.stat(path).st_size
-    size = os.path.getsize(path)
-    return size
+    info = get_path_info(path)
+    assert_file(info)
+    return info.size
 
 
 def get_file_size_formatted(path: PathIn) -> str:
@@ -1,19 +1,100 @@
 from __future__ import annotations
 
 import json
+import mmap
 import os
 import tempfile
-from collections.abc import Generator
+from collections import deque
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import islice
 from typing import Any
 
 from fsutil.args import get_path as _get_path
 from fsutil.checks import assert_file, assert_not_dir, exists
 from fsutil.deps import require_requests
+from fsutil.lineindex import FileLinesIndex, load_file_lines_index
 from fsutil.operations import make_dirs_for_file, remove_file
+from fsutil.pathinfo import PathInfo, get_path_info
 from fsutil.paths import split_filepath
 from fsutil.perms import get_permissions, set_permissions
+from fsutil.syscalls import rename_noreplace
 from fsutil.types import PathIn
+from fsutil.urlcache import get_url_cached
+
+
+def _iter_file_lines(
+    path: str,
+    *,
+    line_start: int,
+    line_end: int,
+    strip_white: bool,
+    skip_empty: bool,
+    encoding: str,
+    use_index: bool,
+) -> Generator[str]:
+    if line_start == 0 and line_end == -1:
+        lines = _iter_file_splitlines(path, encoding=encoding)
+    else:
+        lines = _read_file_lines_in_range(
+            path,
+            line_start=line_start,
+            line_end=line_end,
+            encoding=encoding,
+            use_index=use_index,
+        )
+    for line in lines:
+        if strip_white:
+            line = line.strip()
+        if skip_empty and not line:
+            continue
+        yield line
+
+
+def iter_file_lines(
+    path: PathIn,
+    *,
+    line_start: int = 0,
+    line_end: int = -1,
+    strip_white: bool = True,
+    skip_empty: bool = True,
+    encoding: str = "utf-8",
+    use_index: bool = False,
+) -> Iterator[str]:
+    """
+    Iterate over the file content lines (same options of read_file_lines),
+    lines are read, stripped and skipped lazily one at a time,
+    without reading the whole file in memory.
+    """
+    path = _get_path(path)
+    assert_file(path)
+    return _iter_file_lines(
+        path,
+        line_start=line_start,
+        line_end=line_end,
+        strip_white=strip_white,
+        skip_empty=skip_empty,
+        encoding=encoding,
+        use_index=use_index,
+    )
+
+
+@contextmanager
+def open_file_mmap(path: PathIn) -> Iterator[mmap.mmap]:
+    """
+    Open the file at the given path as a read-only memory map (context manager),
+    its content is paged in lazily by the os instead of being read on the heap.
+    Empty files can't be memory mapped, a ValueError is raised.
+    """
+    path = _get_path(path)
+    assert_file(path)
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise ValueError(f"Empty file can't be memory mapped: {path!r}")
+        file_mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    with file_mmap:
+        yield file_mmap
 
 
 def read_file(path: PathIn, *, encoding: str = "utf-8") -> str:
@@ -28,11 +109,39 @@ def read_file(path: PathIn, *, encoding: str = "utf-8") -> str:
     return content
 
 
-def read_file_from_url(url: str, **kwargs: Any) -> str:
+def read_file_bytes(path: PathIn) -> bytes:
+    """
+    Read the content of the file at the given path as bytes (without decoding it).
+    """
+    path = _get_path(path)
+    assert_file(path)
+    with open(path, "rb") as file:
+        content = file.read()
+    return content
+
+
+def read_file_from_url(
+    url: str,
+    *,
+    cache_dir: PathIn | None = None,
+    cache_max_size: int | None = None,
+    **kwargs: Any,
+) -> str:
     """
     Read the content of the file at the given url.
+    If cache_dir is provided, the response is cached on disk and revalidated
+    with conditional requests, see get_url_cached for more info.
     """
     requests = require_requests()
+    if cache_dir is not None:
+        meta, body = get_url_cached(
+            requests.get,
+            url,
+            cache_dir=cache_dir,
+            cache_max_size=cache_max_size,
+            **kwargs,
+        )
+        return body.decode(meta["encoding"] or "utf-8", errors="replace")
     response = requests.get(url, **kwargs)
     response.raise_for_status()
     content = str(response.text)
@@ -49,31 +158,120 @@ def read_file_json(path: PathIn, **kwargs: Any) -> Any:
     return data
 
 
+READ_FILE_TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def _read_file_tail_lines(path: str, count: int) -> list[bytes]:
+    """
+    Read the last count lines (line endings included) of the file
+    at the given path, scanning it backwards by blocks from its end.
+    """
+    if count <= 0:
+        return []
+    blocks: list[bytes] = []
+    newlines_count = 0
+    with open(path, "rb") as file:
+        try:
+            position = file.seek(0, os.SEEK_END)
+        except OSError:
+            position = 0
+        if position == 0:
+            # not seekable or zero size (eg. pseudo-files), scan it forward
+            return list(deque(file, maxlen=count))
+        ends_with_newline: bool | None = None
+        while position > 0:
+            size = min(READ_FILE_TAIL_BLOCK_SIZE, position)
+            position -= size
+            file.seek(position)
+            block = file.read(size)
+            if ends_with_newline is None:
+                ends_with_newline = block.endswith(b"\n")
+            blocks.append(block)
+            newlines_count += block.count(b"\n")
+            # a newline before the first line is needed to know where it starts
+            if newlines_count - int(ends_with_newline) >= count:
+                break
+    data = b"".join(reversed(blocks))
+    lines = data.split(b"\n")
+    if position > 0:
+        # the first line is partial
+        lines = lines[1:]
+    tail_lines = [line + b"\n" for line in lines[:-1]]
+    if lines[-1]:
+        tail_lines.append(lines[-1])
+    return tail_lines[-count:]
+
+
+def _read_file_lines_in_range_indexed(
+    path: str,
+    index: FileLinesIndex,
+    *,
+    line_start: int,
+    line_end: int,
+    encoding: str,
+) -> Generator[str]:
+    # normalize negative indexes using the indexed lines count
+    if line_start < 0:
+        line_start = max(0, line_start + index.lines_count)
+    if line_end < 0:
+        line_end = line_end + index.lines_count
+    line_end = min(line_end, index.lines_count - 1)
+    if line_start > line_end:
+        return
+    offset, skip = index.get_line_offset(line_start)
+    with open(path, "rb") as file:
+        file.seek(offset)
+        lines = islice(file, skip, skip + line_end - line_start + 1)
+        for line in lines:
+            yield line.decode(encoding)
+
+
+def _iter_file_splitlines(path: str, *, encoding: str) -> Generator[str]:
+    # same lines of read_file(path).splitlines(), since the text mode
+    # translates the line endings to newlines that terminate every line
+    with open(path, encoding=encoding) as file:
+        for line in file:
+            yield from line.splitlines()
+
+
 def _read_file_lines_in_range(
     path: PathIn,
     *,
     line_start: int = 0,
     line_end: int = -1,
     encoding: str = "utf-8",
+    use_index: bool = False,
 ) -> Generator[str]:
     path = _get_path(path)
-    line_start_negative = line_start < 0
-    line_end_negative = line_end < 0
-    if line_start_negative or line_end_negative:
-        # pre-calculate lines count only if using negative line indexes
-        lines_count = read_file_lines_count(path)
-        # normalize negative indexes
-        if line_start_negative:
-            line_start = max(0, line_start + lines_count)
-        if line_end_negative:
-            line_end = min(line_end + lines_count, lines_count - 1)
+    index = load_file_lines_index(path) if use_index else None
+    if index is not None:
+        yield from _read_file_lines_in_range_indexed(
+            path, index, line_start=line_start, line_end=line_end, encoding=encoding
+        )
+        return
+    if line_start < 0 and line_end >= 0:
+        # the lines count is needed only to normalize a negative line_start
+        # when line_end is positive
+        line_start = max(0, line_start + read_file_lines_count(path))
+    if line_start < 0:
+        # read the tail lines scanning the file backwards from its end
+        lines = _read_file_tail_lines(path, -line_start)
+        for line in lines[: max(0, line_end + len(lines) + 1)]:
+            yield line.decode(encoding)
+        return
+    # lines are yielded with a delay to skip the last lines
+    # if line_end is negative, the read stops after line_end if it is positive
+    delayed_lines: deque[bytes] = deque()
+    delay = -line_end - 1 if line_end < 0 else 0
     with open(path, "rb") as file:
-        file.seek(0)
-        line_index = 0
-        for line in file:
-            if line_index >= line_start and line_index <= line_end:
-                yield line.decode(encoding)
-            line_index += 1
+        for line_index, line in enumerate(file):
+            if line_end >= 0 and line_index > line_end:
+                break
+            if line_index < line_start:
+                continue
+            delayed_lines.append(line)
+            if len(delayed_lines) > delay:
+                yield delayed_lines.popleft().decode(encoding)
 
 
 def read_file_lines(
@@ -84,73 +282,199 @@ def read_file_lines(
     strip_white: bool = True,
     skip_empty: bool = True,
     encoding: str = "utf-8",
+    use_index: bool = False,
 ) -> list[str]:
     """
     Read file content lines.
     It is possible to specify the line indexes (negative indexes too),
-    very useful especially when reading large files.
+    very useful especially when reading large files:
+    negative line_start lines are read scanning the file backwards from its end,
+    and reading stops as soon as line_end is reached.
+    If use_index and the file has a valid lines index
+    (see update_file_lines_index), the requested lines are read seeking
+    straight to them (looking for the index costs a stat and an open,
+    so it is done only if use_index).
     """
-    path = _get_path(path)
-    assert_file(path)
-    if line_start == 0 and line_end == -1:
-        content = read_file(path, encoding=encoding)
-        lines = content.splitlines()
-    else:
-        lines = list(
-            _read_file_lines_in_range(
-                path,
-                line_start=line_start,
-                line_end=line_end,
-                encoding=encoding,
-            )
+    lines = iter_file_lines(
+        path,
+        line_start=line_start,
+        line_end=line_end,
+        strip_white=strip_white,
+        skip_empty=skip_empty,
+        encoding=encoding,
+        use_index=use_index,
+    )
+    return list(lines)
+
+
+READ_FILE_LINES_COUNT_CHUNK_SIZE = 1024 * 1024
+READ_FILE_LINES_COUNT_PARALLEL_SIZE = 256 * 1024 * 1024
+
+
+def _count_file_newlines(
+    path: str, start: int = 0, end: int | None = None
+) -> tuple[int, bool]:
+    """
+    Count the newlines in the given bytes range (until the end of file
+    if end is None) of the file at the given path, reading it in chunks
+    into a reused buffer (no per-line allocations).
+    Return the newlines count and if the last byte read is a newline.
+    """
+    newlines_count = 0
+    ends_with_newline = True
+    buffer = bytearray(READ_FILE_LINES_COUNT_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as file:
+        if start:
+            file.seek(start)
+        position = start
+        while end is None or position < end:
+            limit = len(buffer) if end is None else min(len(buffer), end - position)
+            size = file.readinto(view[:limit])
+            if not size:
+                break
+            newlines_count += buffer.count(b"\n", 0, size)
+            ends_with_newline = buffer[size - 1] == ord("\n")
+            position += size
+    return (newlines_count, ends_with_newline)
+
+
+def _count_file_newlines_parallel(
+    path: str, size: int, workers: int
+) -> tuple[int, bool]:
+    from concurrent.futures import ThreadPoolExecutor
+
+    range_size = -(-size // workers)
+    starts = list(range(0, size, range_size))
+    # the last range is read until the end of file, even if the file grew
+    ends: list[int | None] = [*starts[1:], None]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(_count_file_newlines, [path] * len(starts), starts, ends)
         )
-    if strip_white:
-        lines = [line.strip() for line in lines]
-    if skip_empty:
-        lines = [line for line in lines if line]
-    return lines
+    newlines_count = sum(count for count, _ in results)
+    _, ends_with_newline = results[-1]
+    return (newlines_count, ends_with_newline)
 
 
-def read_file_lines_count(path: PathIn) -> int:
+def read_file_lines_count(
+    path: PathIn, *, workers: int | None = None, use_index: bool = False
+) -> int:
     """
     Read file lines count.
+    If use_index and the file has a valid lines index
+    (see update_file_lines_index), the count is read from it.
+    Files larger than READ_FILE_LINES_COUNT_PARALLEL_SIZE are split
+    in byte ranges counted by parallel workers (by default min(cpu count, 8)),
+    workers=1 disables it.
     """
     path = _get_path(path)
     assert_file(path)
-    lines_count = 0
-    with open(path, "rb") as file:
-        file.seek(0)
-        lines_count = sum(1 for line in file)
+    if workers is not None and workers < 1:
+        raise ValueError(f"Invalid workers: {workers!r}, expected a value >= 1.")
+    index = load_file_lines_index(path) if use_index else None
+    if index is not None:
+        return index.lines_count
+    # the size is used only to split the file in ranges, files are read
+    # until the end of file (sizes may be zero or outdated, eg. /proc files)
+    size = os.path.getsize(path)
+    if workers is None:
+        parallel = size >= READ_FILE_LINES_COUNT_PARALLEL_SIZE
+        workers = min(os.cpu_count() or 1, 8) if parallel else 1
+    if workers > 1 and size > 0:
+        newlines_count, ends_with_newline = _count_file_newlines_parallel(
+            path, size, workers
+        )
+    else:
+        newlines_count, ends_with_newline = _count_file_newlines(path)
+    # the last line is counted also if it doesn't end with a newline
+    lines_count = newlines_count + int(not ends_with_newline)
     return lines_count
 
 
-def _write_file_atomic(
+def read_file_tail(
     path: PathIn,
-    content: str,
+    n: int = 10,
+    *,
+    strip_white: bool = True,
+    skip_empty: bool = True,
+    encoding: str = "utf-8",
+) -> list[str]:
+    """
+    Read the last n lines of the file at the given path,
+    scanning it backwards from its end (the file is not read entirely).
+    """
+    if n <= 0:
+        return []
+    return read_file_lines(
+        path,
+        line_start=-n,
+        strip_white=strip_white,
+        skip_empty=skip_empty,
+        encoding=encoding,
+    )
+
+
+@contextmanager
+def read_file_view(path: PathIn) -> Iterator[memoryview]:
+    """
+    Read the content of the file at the given path as a read-only memoryview
+    (context manager) backed by a memory map, without copying it on the heap.
+    The view (and its slices) must not be used outside of the context.
+    Files reporting a zero size but having content (eg. /proc pseudo-files)
+    can't be memory mapped, a ValueError is raised.
+    """
+    path = _get_path(path)
+    assert_file(path)
+    if os.path.getsize(path) == 0:
+        with open(path, "rb") as file:
+            if file.read(1):
+                raise ValueError(f"File can't be memory mapped: {path!r}")
+        with memoryview(b"") as view:
+            yield view
+        return
+    with open_file_mmap(path) as file_mmap, memoryview(file_mmap) as view:
+        yield view
+
+
+def _read_file_content(path: str, *, binary: bool, encoding: str) -> Any:
+    if binary:
+        return read_file_bytes(path)
+    return read_file(path, encoding=encoding)
+
+
+def _write_file_atomic(
+    path: PathIn | PathInfo,
+    content: str | bytes,
     *,
     append: bool = False,
     encoding: str = "utf-8",
+    exclusive: bool = False,
 ) -> None:
-    path = _get_path(path)
-    mode = "a" if append else "w"
+    info = get_path_info(path)
+    path = info.path
+    binary = isinstance(content, bytes)
     if append:
-        content = read_file(path, encoding=encoding) + content
+        content = _read_file_content(path, binary=binary, encoding=encoding) + content
     dirpath, _ = split_filepath(path)
     temp_path = None
     try:
         with tempfile.NamedTemporaryFile(
-            mode=mode,
+            mode="wb" if binary else "w",
             dir=dirpath,
             delete=False,
             # delete_on_close=False, # supported since Python >= 3.12
-            encoding=encoding,
+            encoding=None if binary else encoding,
         ) as file:
             file.write(content)
             file.flush()
             os.fsync(file.fileno())
             temp_path = file.name
         # file is now closed, safe to replace on Windows
-        permissions = get_permissions(path) if exists(path) else None
+        if exclusive:
+            rename_noreplace(temp_path, path)
+            return
+        permissions = get_permissions(info) if info.exists else None
         os.replace(temp_path, path)
         if permissions:
             set_permissions(path, permissions)
@@ -167,37 +491,48 @@ def _write_file_atomic(
 
 
 def _write_file_non_atomic(
-    path: PathIn,
-    content: str,
+    path: PathIn | PathInfo,
+    content: str | bytes,
     *,
     append: bool = False,
     encoding: str = "utf-8",
+    exclusive: bool = False,
 ) -> None:
-    mode = "a" if append else "w"
+    mode = "x" if exclusive else "a" if append else "w"
+    if isinstance(content, bytes):
+        with open(path, f"{mode}b") as file:
+            file.write(content)
+        return
     with open(path, mode, encoding=encoding) as file:
         file.write(content)
 
 
 def write_file(
     path: PathIn,
-    content: str,
+    content: str | bytes,
     *,
     append: bool = False,
     encoding: str = "utf-8",
     atomic: bool = False,
+    exclusive: bool = False,
 ) -> None:
     """
-    Write file with the specified content at the given path.
+    Write file with the specified content at the given path,
+    if content is bytes the file is written in binary mode.
+    If exclusive, the file is written only if it doesn't exist yet,
+    otherwise a FileExistsError is raised (enforced by the kernel without races,
+    if atomic the complete file is published only if path doesn't exist).
     """
-    path = _get_path(path)
-    assert_not_dir(path)
-    make_dirs_for_file(path)
+    info = get_path_info(path)
+    assert_not_dir(info)
+    make_dirs_for_file(info)
     write_file_func = _write_file_atomic if atomic else _write_file_non_atomic
     write_file_func(
-        path,
+        info,
         content,
         append=append,
         encoding=encoding,
+        exclusive=exclusive,
     )
 
 
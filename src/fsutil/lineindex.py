@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import os
+import struct
+import sys
+from array import array
+from itertools import islice
+from typing import NamedTuple
+
+from fsutil.args import get_path as _get_path
+from fsutil.checks import assert_file
+from fsutil.types import PathIn
+
+LINES_INDEX_EXTENSION = ".linesindex"
+LINES_INDEX_STRIDE = 1024
+
+# magic, version, file size, file mtime_ns, lines count, stride
+_LINES_INDEX_HEADER = struct.Struct("<8sIQqQI")
+_LINES_INDEX_MAGIC = b"FSUTILLI"
+_LINES_INDEX_VERSION = 1
+
+
+class FileLinesIndex(NamedTuple):
+    """
+    Lines index of a file: the lines count and the offsets
+    of the start of every stride-th line.
+    """
+
+    lines_count: int
+    stride: int
+    offsets: array[int]
+
+    def get_line_offset(self, line_index: int) -> tuple[int, int]:
+        """
+        Get the offset of the nearest indexed line before the given line index
+        and the number of lines to skip from there to reach it.
+        """
+        offset_index = min(line_index // self.stride, len(self.offsets) - 1)
+        return (self.offsets[offset_index], line_index - offset_index * self.stride)
+
+
+def get_file_lines_index_path(path: PathIn) -> str:
+    """
+    Get the path of the lines index sidecar file of the file at the given path.
+    """
+    return _get_path(path) + LINES_INDEX_EXTENSION
+
+
+def _read_file_lines_index(index_path: str, stat: os.stat_result) -> FileLinesIndex:
+    with open(index_path, "rb") as file:
+        header = file.read(_LINES_INDEX_HEADER.size)
+        magic, version, size, mtime_ns, lines_count, stride = (
+            _LINES_INDEX_HEADER.unpack(header)
+        )
+        if (magic, version) != (_LINES_INDEX_MAGIC, _LINES_INDEX_VERSION):
+            raise ValueError(f"Invalid lines index: {index_path}")
+        if (size, mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+            raise ValueError(f"Outdated lines index: {index_path}")
+        offsets = array("Q")
+        offsets.frombytes(file.read())
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    if stride < 1 or len(offsets) != max(1, -(-lines_count // stride)):
+        raise ValueError(f"Invalid lines index: {index_path}")
+    return FileLinesIndex(lines_count, stride, offsets)
+
+
+def load_file_lines_index(path: PathIn) -> FileLinesIndex | None:
+    """
+    Load the lines index sidecar file of the file at the given path,
+    return None if it doesn't exist or if it is not valid anymore
+    (the file size or last modification time changed).
+    """
+    path = _get_path(path)
+    try:
+        return _read_file_lines_index(get_file_lines_index_path(path), os.stat(path))
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def update_file_lines_index(
+    path: PathIn, *, stride: int = LINES_INDEX_STRIDE
+) -> FileLinesIndex:
+    """
+    Create or update (only if not valid anymore) the lines index sidecar file
+    of the file at the given path, storing the offset of every stride-th line,
+    the index is then used by read_file_lines and read_file_lines_count
+    (with use_index=True) to seek straight to the requested lines.
+    """
+    from fsutil.io import write_file
+
+    path = _get_path(path)
+    assert_file(path)
+    if stride < 1:
+        raise ValueError(f"Invalid stride: {stride!r}, expected a value >= 1.")
+    index = load_file_lines_index(path)
+    if index is not None and index.stride == stride:
+        return index
+    offsets = array("Q")
+    offset = 0
+    lines_count = 0
+    with open(path, "rb") as file:
+        stat = os.fstat(file.fileno())
+        # read lines in batches of stride lines, recording each batch offset
+        while lines := list(islice(file, stride)):
+            offsets.append(offset)
+            offset += sum(map(len, lines))
+            lines_count += len(lines)
+    if not offsets:
+        offsets.append(0)
+    header = _LINES_INDEX_HEADER.pack(
+        _LINES_INDEX_MAGIC,
+        _LINES_INDEX_VERSION,
+        stat.st_size,
+        stat.st_mtime_ns,
+        lines_count,
+        stride,
+    )
+    data = array("Q", offsets)
+    if sys.byteorder == "big":
+        data.byteswap()
+    write_file(get_file_lines_index_path(path), header + data.tobytes(), atomic=True)
+    return FileLinesIndex(lines_count, stride, offsets)
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-import glob
+import errno
 import os
 import re
 import shutil
+import stat
 import tempfile
+import threading
 import uuid
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Any, NamedTuple
+from urllib.parse import urlsplit
 
 from fsutil.args import get_path as _get_path
 from fsutil.checks import (
@@ -17,12 +23,15 @@ from fsutil.checks import (
     assert_not_exists,
     assert_not_file,
     exists,
-    is_dir,
-    is_empty_dir,
-    is_empty_file,
-    is_file,
 )
 from fsutil.deps import require_requests
+from fsutil.downloads import (
+    create_download_session,
+    download_file_ranges,
+    get_download_size,
+)
+from fsutil.index import search_dir_index
+from fsutil.pathinfo import PathInfo, get_path_info
 from fsutil.paths import (
     get_file_basename,
     get_file_extension,
@@ -34,46 +43,152 @@ from fsutil.paths import (
     split_filename,
     split_filepath,
 )
+from fsutil.progress import ProgressCallback, ProgressTracker
+from fsutil.syscalls import (
+    RENAME_FLAGS_UNSUPPORTED_ERRNOS,
+    copy_file_data,
+    rename_exchange,
+    rename_noreplace,
+)
 from fsutil.types import PathIn
-
-
-def _clean_dir_empty_dirs(path: PathIn) -> None:
-    path = _get_path(path)
-    for basepath, dirnames, _ in os.walk(path, topdown=False):
-        for dirname in dirnames:
-            dirpath = os.path.join(basepath, dirname)
-            if is_empty_dir(dirpath):
-                remove_dir(dirpath)
-
-
-def _clean_dir_empty_files(path: PathIn) -> None:
-    path = _get_path(path)
-    for basepath, _, filenames in os.walk(path, topdown=False):
-        for filename in filenames:
-            filepath = os.path.join(basepath, filename)
-            if is_empty_file(filepath):
-                remove_file(filepath)
-
-
-def clean_dir(path: PathIn, *, dirs: bool = True, files: bool = True) -> None:
-    """
-    Clean a directory by removing empty directories and/or empty files.
+from fsutil.urlcache import get_url_cached
+from fsutil.walk import PathFilter, compile_filter, compile_matcher, walk_entries
+
+
+class _CleanDirOptions(NamedTuple):
+    dirs: bool
+    files: bool
+    dry_run: bool
+
+
+def _clean_dir_entry(
+    dirpath: str,
+    dir_fd: int | None,
+    entry: os.DirEntry[str],
+    options: _CleanDirOptions,
+    report: _RemoveReport,
+) -> bool:
+    """
+    Clean the given entry (bottom-up if it is a directory),
+    updating the report, and return True if the entry has been removed.
+    """
+    path = os.path.join(dirpath, entry.name)
+    name = path if dir_fd is None else entry.name
+    if entry.is_dir(follow_symlinks=False):
+        entry_fd = _open_dir_fd(name, dir_fd)
+        try:
+            entries = _scan_dir_entries(path, entry_fd)
+            remaining = _clean_dir_entries(path, entry_fd, entries, options, report)
+        finally:
+            if entry_fd is not None:
+                os.close(entry_fd)
+        if not options.dirs or remaining:
+            return False
+        if not options.dry_run:
+            os.rmdir(name, dir_fd=dir_fd)
+        report["dirs"] += 1
+        return True
+    if (
+        options.files
+        and entry.is_file(follow_symlinks=False)
+        and entry.stat(follow_symlinks=False).st_size == 0
+    ):
+        if not options.dry_run:
+            os.unlink(name, dir_fd=dir_fd)
+        report["files"] += 1
+        return True
+    return False
+
+
+def _clean_dir_entries(
+    dirpath: str,
+    dir_fd: int | None,
+    entries: list[os.DirEntry[str]],
+    options: _CleanDirOptions,
+    report: _RemoveReport,
+) -> int:
+    """
+    Clean the given entries of the directory at dirpath (opened as dir_fd),
+    updating the report, and return the number of remaining entries.
+    """
+    remaining = 0
+    for entry in entries:
+        try:
+            if _clean_dir_entry(dirpath, dir_fd, entry, options, report):
+                continue
+        except OSError as error:
+            report["errors"].append((os.path.join(dirpath, entry.name), str(error)))
+        remaining += 1
+    return remaining
+
+
+def _clean_dir_entries_task(
+    dirpath: str,
+    dir_fd: int | None,
+    entries: list[os.DirEntry[str]],
+    options: _CleanDirOptions,
+) -> _RemoveReport:
+    report = _new_remove_report()
+    _clean_dir_entries(dirpath, dir_fd, entries, options, report)
+    return report
+
+
+def clean_dir(
+    path: PathIn,
+    *,
+    dirs: bool = True,
+    files: bool = True,
+    dry_run: bool = False,
+    workers: int | None = None,
+) -> _RemoveReport:
+    """
+    Clean a directory by removing empty directories and/or empty files
+    and return a report dict with the number of removed "dirs" and "files"
+    and the list of "errors" as (path, error message) tuples.
+    The directory is walked once bottom-up, so directories emptied
+    by the removal of their content are removed too, symlinks are never followed.
+    If dry_run, nothing is removed and the report contains
+    what would have been removed.
+    If workers is defined, sub-directories are cleaned in parallel
+    using a pool of workers threads.
     """
     path = _get_path(path)
     assert_dir(path)
-    if files:
-        _clean_dir_empty_files(path)
-    if dirs:
-        _clean_dir_empty_dirs(path)
+    if not dirs and not files:
+        return _new_remove_report()
+    options = _CleanDirOptions(dirs, files, dry_run)
+    dir_fd = _open_dir_fd(path)
+    try:
+        entries = _scan_dir_entries(path, dir_fd)
+        tasks = [
+            (path, dir_fd, entries_chunk, options)
+            for entries_chunk in _chunk_dir_entries(entries)
+        ]
+        return _run_remove_tasks(_clean_dir_entries_task, tasks, workers=workers)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
 
 
 def copy_dir(
-    path: PathIn, dest: PathIn, *, overwrite: bool = False, **kwargs: Any
+    path: PathIn,
+    dest: PathIn,
+    *,
+    overwrite: bool = False,
+    workers: int | None = None,
+    strategy: str = "auto",
+    progress: ProgressCallback | None = None,
+    **kwargs: Any,
 ) -> None:
     """
     Copy the directory at the given path and all its content to dest path.
     If overwrite is not allowed and dest path exists, an OSError is raised.
-    More informations about kwargs supported options here:
+    If workers is defined, files are copied in parallel
+    using a pool of workers threads.
+    Files data are copied using the given strategy (see copy_file).
+    If progress is defined, it is called (rate-limited) with the progress.
+    More informations about kwargs supported options here
+    (all of them are supported with workers too):
     https://docs.python.org/3/library/shutil.html#shutil.copytree
     """
     path = _get_path(path)
@@ -84,13 +199,132 @@ def copy_dir(
     assert_not_file(dest)
     if not overwrite:
         assert_not_exists(dest)
-    copy_dir_content(path, dest, **kwargs)
+    copy_dir_content(
+        path, dest, workers=workers, strategy=strategy, progress=progress, **kwargs
+    )
 
 
-def copy_dir_content(path: PathIn, dest: PathIn, **kwargs: Any) -> None:
+def _get_copy_dir_content_tasks(
+    path: str,
+    dest: str,
+    *,
+    symlinks: bool = False,
+    ignore: Callable[[str, list[str]], Iterable[str]] | None = None,
+) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+    """
+    Get the directories (top-down) and the files that need to be copied
+    from path to dest as lists of (src, dest) tuples.
+    """
+    dirs_tasks = [(path, dest)]
+    files_tasks = []
+    for basepath, dirnames, filenames in os.walk(path, followlinks=not symlinks):
+        relpath = os.path.relpath(basepath, path)
+        destpath = os.path.normpath(os.path.join(dest, relpath))
+        ignored_names = set(ignore(basepath, dirnames + filenames)) if ignore else set()
+        walk_dirnames = []
+        for dirname in dirnames:
+            if dirname in ignored_names:
+                continue
+            task = (os.path.join(basepath, dirname), os.path.join(destpath, dirname))
+            if symlinks and os.path.islink(task[0]):
+                files_tasks.append(task)
+                continue
+            dirs_tasks.append(task)
+            walk_dirnames.append(dirname)
+        dirnames[:] = walk_dirnames
+        files_tasks += [
+            (os.path.join(basepath, filename), os.path.join(destpath, filename))
+            for filename in filenames
+            if filename not in ignored_names
+        ]
+    return (dirs_tasks, files_tasks)
+
+
+def _copy_dir_content_parallel(
+    path: str,
+    dest: str,
+    *,
+    workers: int,
+    symlinks: bool = False,
+    ignore: Callable[[str, list[str]], Iterable[str]] | None = None,
+    copy_function: Callable[[str, str], object] = shutil.copy2,
+    ignore_dangling_symlinks: bool = False,
+    dirs_exist_ok: bool = True,
+) -> None:
+    """
+    Copy the content of the directory at the given path to dest path:
+    the directories skeleton is created first, then files are copied
+    in parallel and finally directories metadata are copied.
+    Options are the same of shutil.copytree.
+    """
+    dirs_tasks, files_tasks = _get_copy_dir_content_tasks(
+        path, dest, symlinks=symlinks, ignore=ignore
+    )
+    for _, dirpath in dirs_tasks:
+        os.makedirs(dirpath, exist_ok=dirs_exist_ok)
+
+    def copy_file_task(src: str, dst: str) -> tuple[str, str, str] | None:
+        try:
+            if symlinks and os.path.islink(src):
+                os.symlink(os.readlink(src), dst)
+                shutil.copystat(src, dst, follow_symlinks=False)
+            elif (
+                ignore_dangling_symlinks
+                and os.path.islink(src)
+                and not os.path.exists(src)
+            ):
+                return None
+            else:
+                copy_function(src, dst)
+        except OSError as error:
+            return (src, dst, str(error))
+        return None
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(lambda task: copy_file_task(*task), files_tasks)
+        errors = [error for error in results if error]
+    # copy directories metadata at the end, bottom-up,
+    # because copying files changes their last modification date
+    for src, dst in reversed(dirs_tasks):
+        try:
+            shutil.copystat(src, dst)
+        except OSError as error:
+            errors.append((src, dst, str(error)))
+    if errors:
+        raise shutil.Error(errors)
+
+
+def _copy_file_with_progress(
+    copy_function: Callable[[str, str], object],
+    tracker: ProgressTracker,
+    src: str,
+    dst: str,
+) -> object:
+    result = copy_function(src, dst)
+    tracker.add_file(src)
+    return result
+
+
+def copy_dir_content(
+    path: PathIn,
+    dest: PathIn,
+    *,
+    workers: int | None = None,
+    strategy: str = "auto",
+    progress: ProgressCallback | None = None,
+    **kwargs: Any,
+) -> None:
     """
     Copy the content of the directory at the given path to dest path.
-    More informations about kwargs supported options here:
+    If workers is defined, the directories skeleton is created first,
+    then files are copied in parallel using a pool of workers threads
+    (the whole tree is walked first, so files of the same sub-directory
+    are copied in parallel too, not only the top-level entries).
+    Files data are copied using the given strategy (see copy_file),
+    unless a custom copy_function is passed.
+    If progress is defined, it is called (rate-limited) with the progress.
+    More informations about kwargs supported options here
+    (all of them are supported with workers too):
     https://docs.python.org/3/library/shutil.html#shutil.copytree
     """
     path = _get_path(path)
@@ -99,26 +333,99 @@ def copy_dir_content(path: PathIn, dest: PathIn, **kwargs: Any) -> None:
     assert_not_file(dest)
     make_dirs(dest)
     kwargs.setdefault("dirs_exist_ok", True)
-    shutil.copytree(path, dest, **kwargs)
+    kwargs.setdefault(
+        "copy_function", partial(_copy_file_with_strategy, strategy=strategy)
+    )
+    tracker = ProgressTracker(progress, paths=[path])
+    if tracker.enabled:
+        kwargs["copy_function"] = partial(
+            _copy_file_with_progress, kwargs["copy_function"], tracker
+        )
+    if workers is not None and workers > 1:
+        _copy_dir_content_parallel(path, dest, workers=workers, **kwargs)
+    else:
+        shutil.copytree(path, dest, **kwargs)
+    tracker.finish(path=dest)
+
+
+def _copy_file_with_strategy(
+    path: str | PathInfo,
+    dest: str | PathInfo,
+    *,
+    strategy: str,
+    exclusive: bool = False,
+    progress: Callable[[int], None] | None = None,
+) -> str:
+    used_strategy = copy_file_data(
+        path, dest, strategy=strategy, exclusive=exclusive, progress=progress
+    )
+    shutil.copystat(path, dest)
+    return used_strategy
+
+
+def _update_copy_progress(tracker: ProgressTracker, size: int, *, path: str) -> None:
+    tracker.update(bytes=size, path=path)
 
 
 def copy_file(
-    path: PathIn, dest: PathIn, *, overwrite: bool = False, **kwargs: Any
-) -> None:
+    path: PathIn,
+    dest: PathIn,
+    *,
+    overwrite: bool = False,
+    strategy: str = "auto",
+    progress: ProgressCallback | None = None,
+    **kwargs: Any,
+) -> str:
     """
-    Copy the file at the given path and its metadata to dest path.
-    If overwrite is not allowed and dest path exists, an OSError is raised.
+    Copy the file at the given path and its metadata to dest path
+    and return the strategy used to copy the file data.
+    If overwrite is not allowed and dest path exists, an OSError is raised
+    (dest is created exclusively, so concurrent copies cannot overwrite it).
+    Supported strategies: "reflink" (copy-on-write clone), "copy_file_range",
+    "sendfile", "native" (shutil.copyfile, using the platform fast paths)
+    or "auto" that tries all of them in this order, falling back to the next
+    one if not supported, and "buffer" (userspace copy, only if requested).
+    If follow_symlinks is False and path is a symlink, the symlink is copied
+    and "symlink" is returned.
+    If progress is defined, it is called (rate-limited) with the progress
+    of each copied chunk (only when the copy starts and ends for reflink
+    and native copies).
     More informations about kwargs supported options here:
     https://docs.python.org/3/library/shutil.html#shutil.copy2
     """
-    path = _get_path(path)
-    dest = _get_path(dest)
-    assert_file(path)
-    assert_not_dir(dest)
-    if not overwrite:
-        assert_not_exists(dest)
-    make_dirs_for_file(dest)
-    shutil.copy2(path, dest, **kwargs)
+    info = get_path_info(path)
+    assert_file(info)
+    path = info.path
+    dest_info: str | PathInfo = _get_path(dest)
+    if overwrite:
+        dest_info = get_path_info(dest_info)
+        assert_not_dir(dest_info)
+        make_dirs_for_file(dest_info)
+    else:
+        # dest existence is checked by the kernel when creating it
+        make_dirs(os.path.dirname(dest_info) or os.curdir)
+    tracker = ProgressTracker(progress, bytes_total=info.size, files_total=1)
+    tracker.update(path=path)
+    copy_progress = None
+    if tracker.enabled:
+        copy_progress = partial(_update_copy_progress, tracker, path=path)
+    if info.is_symlink and not kwargs.get("follow_symlinks", True):
+        if not overwrite:
+            assert_not_exists(dest_info)
+        shutil.copy2(path, dest_info, **kwargs)
+        used_strategy = "symlink"
+    else:
+        used_strategy = _copy_file_with_strategy(
+            info,
+            dest_info,
+            strategy=strategy,
+            exclusive=not overwrite,
+            progress=copy_progress,
+        )
+    # the bytes not reported by chunks (reflink, native and symlink copies)
+    tracker.update(bytes=info.size - tracker.bytes_done, files=1)
+    tracker.finish(path=path)
+    return used_strategy
 
 
 def create_dir(path: PathIn, *, overwrite: bool = False) -> None:
@@ -136,15 +443,13 @@ def create_dir(path: PathIn, *, overwrite: bool = False) -> None:
 def create_file(path: PathIn, content: str = "", *, overwrite: bool = False) -> None:
     """
     Create file with the specified content at the given path.
-    If overwrite is not allowed and path exists, an OSError is raised.
+    If overwrite is not allowed and path exists, an OSError is raised
+    (the file is created exclusively, without races).
     """
     from fsutil.io import write_file
 
     path = _get_path(path)
-    assert_not_dir(path)
-    if not overwrite:
-        assert_not_exists(path)
-    write_file(path, content)
+    write_file(path, content, exclusive=not overwrite)
 
 
 def delete_dir(path: PathIn) -> bool:
@@ -155,11 +460,12 @@ def delete_dir(path: PathIn) -> bool:
     return removed
 
 
-def delete_dir_content(path: PathIn) -> None:
+def delete_dir_content(path: PathIn, *, workers: int | None = None) -> _RemoveReport:
     """
     Alias for remove_dir_content.
     """
-    remove_dir_content(path)
+    report = remove_dir_content(path, workers=workers)
+    return report
 
 
 def delete_dirs(*paths: PathIn) -> None:
@@ -177,11 +483,82 @@ def delete_file(path: PathIn) -> bool:
     return removed
 
 
-def delete_files(*paths: PathIn) -> None:
+def delete_files(*paths: PathIn, workers: int | None = None) -> _RemoveReport:
     """
     Alias for remove_files.
     """
-    remove_files(*paths)
+    report = remove_files(*paths, workers=workers)
+    return report
+
+
+def _get_download_filename(url: str, headers: Any) -> str:
+    # detect filename from headers
+    content_disposition = headers.get("content-disposition", "") or ""
+    filename_pattern = r'filename="(.*)"'
+    filename_match = re.search(filename_pattern, content_disposition)
+    filename = ""
+    if filename_match:
+        # sanitize Content-Disposition filename to prevent path traversal
+        filename = filename_match.group(1).replace("\\", "/")
+        filename = os.path.basename(filename)
+    # or detect filename from url
+    if not filename:
+        filename = get_filename(url)
+    # or fallback to a unique name
+    if not filename:
+        filename_uuid = str(uuid.uuid4())
+        filename = f"download-{filename_uuid}"
+    return filename
+
+
+def _get_download_filepath(dirpath: PathIn | None, filename: str) -> str:
+    dirpath = dirpath or tempfile.gettempdir()
+    dirpath = _get_path(dirpath)
+    filepath = join_path(dirpath, filename)
+    make_dirs_for_file(filepath)
+    return filepath
+
+
+def _download_file_cached(
+    get: Any,
+    url: str,
+    *,
+    dirpath: PathIn | None,
+    filename: str | None,
+    progress: ProgressCallback | None,
+    **kwargs: Any,
+) -> str:
+    from fsutil.io import write_file
+
+    meta, body = get_url_cached(get, url, **kwargs)
+    headers = {"content-disposition": meta.get("content_disposition")}
+    filename = filename or _get_download_filename(url, headers)
+    filepath = _get_download_filepath(dirpath, filename)
+    write_file(filepath, body)
+    tracker = ProgressTracker(progress, bytes_total=len(body), files_total=1)
+    tracker.update(bytes=len(body), files=1, path=filepath)
+    tracker.finish(path=filepath)
+    return filepath
+
+
+def _download_file_stream(
+    response: Any,
+    filepath: str,
+    *,
+    chunk_size: int,
+    progress: ProgressCallback | None,
+) -> None:
+    size = response.headers.get("content-length")
+    tracker = ProgressTracker(
+        progress, bytes_total=int(size) if size else None, files_total=1
+    )
+    with open(filepath, "wb") as file:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            if chunk:
+                file.write(chunk)
+                tracker.update(bytes=len(chunk), path=filepath)
+    tracker.update(files=1, path=filepath)
+    tracker.finish(path=filepath)
 
 
 def download_file(
@@ -190,123 +567,579 @@ def download_file(
     dirpath: PathIn | None = None,
     filename: str | None = None,
     chunk_size: int = 8192,
+    workers: int | None = None,
+    resume: bool = False,
+    session: Any = None,
+    cache_dir: PathIn | None = None,
+    cache_max_size: int | None = None,
+    progress: ProgressCallback | None = None,
     **kwargs: Any,
 ) -> str:
     """
     Download a file from url to dirpath.
     If dirpath is not provided, the file will be downloaded to a temp directory.
     If filename is provided, the file will be named using filename.
+    If workers (> 1) and the server supports range requests, the file
+    is downloaded in parallel segments.
+    If resume, an interrupted ranged download is resumed from its ".part" file.
+    If session is provided, requests are sent using it (eg. to reuse connections).
+    If cache_dir is provided, the response is cached on disk and revalidated
+    with conditional requests, see get_url_cached for more info:
+    the whole response body is loaded in memory (chunk_size is not used)
+    and a ValueError is raised if combined with workers (> 1) or resume.
+    If progress is defined, it is called (rate-limited) with the progress.
     It is possible to pass extra request options
     (eg. for authentication) using **kwargs.
     """
     requests = require_requests()
     # https://stackoverflow.com/a/16696317/2096218
 
-    kwargs["stream"] = True
-    with requests.get(url, **kwargs) as response:
+    get = session.get if session is not None else requests.get
+    if cache_dir is not None:
+        if (workers or 1) > 1 or resume:
+            raise ValueError(
+                "Invalid cache_dir: it cannot be combined with workers or resume."
+            )
+        return _download_file_cached(
+            get,
+            url,
+            dirpath=dirpath,
+            filename=filename,
+            cache_dir=cache_dir,
+            cache_max_size=cache_max_size,
+            progress=progress,
+            **kwargs,
+        )
+    with get(url, stream=True, **kwargs) as response:
         response.raise_for_status()
 
-        # build filename
-        if not filename:
-            # detect filename from headers
-            content_disposition = response.headers.get("content-disposition", "") or ""
-            filename_pattern = r'filename="(.*)"'
-            filename_match = re.search(filename_pattern, content_disposition)
-            if filename_match:
-                # sanitize Content-Disposition filename to prevent path traversal
-                filename = filename_match.group(1).replace("\\", "/")
-                filename = os.path.basename(filename)
-            # or detect filename from url
-            if not filename:
-                filename = get_filename(url)
-            # or fallback to a unique name
-            if not filename:
-                filename_uuid = str(uuid.uuid4())
-                filename = f"download-{filename_uuid}"
-
         # build filepath
-        dirpath = dirpath or tempfile.gettempdir()
-        dirpath = _get_path(dirpath)
-        filepath = join_path(dirpath, filename)
-        make_dirs_for_file(filepath)
+        filename = filename or _get_download_filename(url, response.headers)
+        filepath = _get_download_filepath(dirpath, filename)
+
+        # download file in ranges if possible
+        size = get_download_size(response.headers)
+        if size is not None and ((workers or 1) > 1 or resume):
+            response.close()
+            download_file_ranges(
+                url,
+                filepath,
+                size=size,
+                headers=response.headers,
+                workers=workers,
+                resume=resume,
+                chunk_size=chunk_size,
+                session=session,
+                progress=progress,
+                **kwargs,
+            )
+            return filepath
 
         # write file to disk
-        with open(filepath, "wb") as file:
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                if chunk:
-                    file.write(chunk)
+        _download_file_stream(
+            response, filepath, chunk_size=chunk_size, progress=progress
+        )
     return filepath
 
 
-def _filter_paths(
-    basepath: str,
-    relpaths: list[str],
+_DownloadReport = dict[str, Any]
+
+
+def _download_files_task(
+    url: str,
+    *,
+    session: Any,
+    semaphores: dict[str, threading.Semaphore],
+    semaphores_lock: threading.Lock,
+    max_per_host: int | None,
+    **kwargs: Any,
+) -> str:
+    if max_per_host is None:
+        return download_file(url, session=session, **kwargs)
+    host = urlsplit(url).netloc
+    with semaphores_lock:
+        semaphore = semaphores.setdefault(host, threading.Semaphore(max_per_host))
+    with semaphore:
+        return download_file(url, session=session, **kwargs)
+
+
+def download_files(
+    urls: Iterable[str],
+    *,
+    dirpath: PathIn | None = None,
+    workers: int | None = None,
+    max_per_host: int | None = None,
+    retries: int = 3,
+    backoff: float = 0.5,
+    chunk_size: int = 8192,
+    **kwargs: Any,
+) -> _DownloadReport:
+    """
+    Download the files at the given urls to dirpath concurrently (using
+    a pool of workers threads) sharing a session that reuses connections,
+    with at most max_per_host concurrent downloads per host.
+    Failed requests are retried (retries times) with exponential backoff.
+    Return a report with the downloaded files and the errors, both as lists
+    of (url, filepath or error message) tuples in the order of urls.
+    It is possible to pass extra request options
+    (eg. for authentication) using **kwargs.
+    """
+    require_requests()
+    urls = list(urls)
+    workers = max(workers or min(32, (os.cpu_count() or 1) + 4), 1)
+    pool_size = min(workers, max_per_host or workers)
+    semaphores: dict[str, threading.Semaphore] = {}
+    semaphores_lock = threading.Lock()
+    report: _DownloadReport = {"files": [], "errors": []}
+    with (
+        create_download_session(
+            pool_size=pool_size, retries=retries, backoff=backoff
+        ) as session,
+        ThreadPoolExecutor(max_workers=workers) as executor,
+    ):
+        futures = [
+            executor.submit(
+                _download_files_task,
+                url,
+                session=session,
+                semaphores=semaphores,
+                semaphores_lock=semaphores_lock,
+                max_per_host=max_per_host,
+                dirpath=dirpath,
+                chunk_size=chunk_size,
+                **kwargs,
+            )
+            for url in urls
+        ]
+        for url, future in zip(urls, futures, strict=True):
+            error = future.exception()
+            if error is None:
+                report["files"].append((url, future.result()))
+            else:
+                report["errors"].append((url, str(error)))
+    return report
+
+
+def _iter_paths(
+    path: PathIn,
     *,
-    predicate: Callable[[str], bool] | None = None,
+    predicate: Callable[[os.DirEntry[str]], bool],
+) -> Generator[str]:
+    """
+    Iterate over the paths of the entries contained at the given directory path
+    in a single os.scandir pass, filtering them using the predicate function
+    (that receives the os.DirEntry, so no extra stat is needed per entry).
+    """
+    path = _get_path(path)
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if predicate(entry):
+                yield entry.path
+
+
+def iter_dirs(path: PathIn) -> Iterator[str]:
+    """
+    Iterate lazily over all directories contained at the given directory path,
+    directories are yielded in file-system order.
+    """
+    path = _get_path(path)
+    assert_dir(path)
+    return _iter_paths(path, predicate=os.DirEntry.is_dir)
+
+
+def iter_files(path: PathIn) -> Iterator[str]:
+    """
+    Iterate lazily over all files contained at the given directory path,
+    files are yielded in file-system order.
+    """
+    path = _get_path(path)
+    assert_dir(path)
+    return _iter_paths(path, predicate=os.DirEntry.is_file)
+
+
+def iter_search_dirs(
+    path: PathIn,
+    pattern: str | list[str] = "**/*",
+    *,
+    exclude: str | list[str] | None = None,
+    max_depth: int | None = None,
+    follow_symlinks: bool = True,
+    min_size: int | str | None = None,
+    max_size: int | str | None = None,
+    modified_after: datetime | None = None,
+    modified_before: datetime | None = None,
+    extensions: list[str] | None = None,
+    symlinks: bool = True,
+    workers: int | None = None,
+    index: PathIn | None = None,
+) -> Iterator[str]:
+    """
+    Iterate lazily over directories at path matching the given pattern(s),
+    directories are yielded as soon as they are found.
+    Directories matching the exclude pattern(s) (gitignore-style) are skipped
+    without descending into them.
+    Patterns are relative to path ("." and ".." segments are resolved),
+    the path itself is never returned (unlike glob, "**" doesn't match it).
+    If max_depth is defined, only paths at most max_depth levels below path
+    are searched.
+    If follow_symlinks, symlinked directories are searched too.
+    If min_size and/or max_size are defined, only paths with size in range
+    are returned (sizes can be expressed in bytes or as strings, eg. "1 GB").
+    If modified_after and/or modified_before are defined, only paths
+    last modified in range are returned.
+    If extensions is defined, only paths with one of the extensions are returned.
+    If not symlinks, symlinks are not returned.
+    If workers is defined, directories are searched in parallel
+    using a pool of workers threads.
+    If index is defined, directories are searched using the index
+    at the given path (see update_dir_index) without walking the file-system.
+    The content of symlinked directories is not indexed, so if follow_symlinks
+    and the search would descend into a symlinked directory, a ValueError
+    is raised (use follow_symlinks=False).
+    """
+    path = _get_path(path)
+    path_filter = compile_filter(
+        min_size=min_size,
+        max_size=max_size,
+        modified_after=modified_after,
+        modified_before=modified_before,
+        extensions=extensions,
+        symlinks=symlinks,
+    )
+    if index is not None:
+        return search_dir_index(
+            index,
+            path,
+            pattern,
+            dirs=True,
+            exclude=exclude,
+            max_depth=max_depth,
+            follow_symlinks=follow_symlinks,
+            path_filter=path_filter,
+        )
+    assert_dir(path)
+    entries = _iter_search_entries(
+        path,
+        pattern,
+        predicate=os.DirEntry.is_dir,
+        exclude=exclude,
+        max_depth=max_depth,
+        follow_symlinks=follow_symlinks,
+        path_filter=path_filter,
+        workers=workers,
+    )
+    return (entry.path for entry in entries)
+
+
+def iter_search_entries(
+    path: PathIn,
+    pattern: str | list[str] = "**/*",
+    *,
+    dirs: bool = True,
+    files: bool = True,
+    exclude: str | list[str] | None = None,
+    max_depth: int | None = None,
+    follow_symlinks: bool = True,
+    min_size: int | str | None = None,
+    max_size: int | str | None = None,
+    modified_after: datetime | None = None,
+    modified_before: datetime | None = None,
+    extensions: list[str] | None = None,
+    symlinks: bool = True,
+    workers: int | None = None,
+) -> Iterator[os.DirEntry[str]]:
+    """
+    Iterate lazily over directories and/or files entries (os.DirEntry objects)
+    at path matching the given pattern(s), entries are yielded as soon as
+    they are found and their stat result is cached (entry.stat()).
+    Directories matching the exclude pattern(s) (gitignore-style) are skipped
+    without descending into them.
+    Patterns are relative to path ("." and ".." segments are resolved),
+    the path itself is never returned (unlike glob, "**" doesn't match it).
+    If max_depth is defined, only paths at most max_depth levels below path
+    are searched.
+    If follow_symlinks, symlinked directories are searched too.
+    If min_size and/or max_size are defined, only paths with size in range
+    are returned (sizes can be expressed in bytes or as strings, eg. "1 GB").
+    If modified_after and/or modified_before are defined, only paths
+    last modified in range are returned.
+    If extensions is defined, only paths with one of the extensions are returned.
+    If not symlinks, symlinks are not returned.
+    If workers is defined, directories are searched in parallel
+    using a pool of workers threads.
+    """
+    path = _get_path(path)
+    assert_dir(path)
+
+    def predicate(entry: os.DirEntry[str]) -> bool:
+        return (dirs and entry.is_dir()) or (files and entry.is_file())
+
+    path_filter = compile_filter(
+        min_size=min_size,
+        max_size=max_size,
+        modified_after=modified_after,
+        modified_before=modified_before,
+        extensions=extensions,
+        symlinks=symlinks,
+    )
+    return _iter_search_entries(
+        path,
+        pattern,
+        predicate=predicate,
+        exclude=exclude,
+        max_depth=max_depth,
+        follow_symlinks=follow_symlinks,
+        path_filter=path_filter,
+        workers=workers,
+    )
+
+
+def iter_search_files(
+    path: PathIn,
+    pattern: str | list[str] = "**/*.*",
+    *,
+    exclude: str | list[str] | None = None,
+    max_depth: int | None = None,
+    follow_symlinks: bool = True,
+    min_size: int | str | None = None,
+    max_size: int | str | None = None,
+    modified_after: datetime | None = None,
+    modified_before: datetime | None = None,
+    extensions: list[str] | None = None,
+    symlinks: bool = True,
+    workers: int | None = None,
+    index: PathIn | None = None,
+) -> Iterator[str]:
+    """
+    Iterate lazily over files at path matching the given pattern(s),
+    files are yielded as soon as they are found.
+    Directories matching the exclude pattern(s) (gitignore-style) are skipped
+    without descending into them.
+    Patterns are relative to path ("." and ".." segments are resolved),
+    the path itself is never returned (unlike glob, "**" doesn't match it).
+    If max_depth is defined, only paths at most max_depth levels below path
+    are searched.
+    If follow_symlinks, symlinked directories are searched too.
+    If min_size and/or max_size are defined, only paths with size in range
+    are returned (sizes can be expressed in bytes or as strings, eg. "1 GB").
+    If modified_after and/or modified_before are defined, only paths
+    last modified in range are returned.
+    If extensions is defined, only paths with one of the extensions are returned.
+    If not symlinks, symlinks are not returned.
+    If workers is defined, directories are searched in parallel
+    using a pool of workers threads.
+    If index is defined, directories are searched using the index
+    at the given path (see update_dir_index) without walking the file-system.
+    The content of symlinked directories is not indexed, so if follow_symlinks
+    and the search would descend into a symlinked directory, a ValueError
+    is raised (use follow_symlinks=False).
+    """
+    path = _get_path(path)
+    path_filter = compile_filter(
+        min_size=min_size,
+        max_size=max_size,
+        modified_after=modified_after,
+        modified_before=modified_before,
+        extensions=extensions,
+        symlinks=symlinks,
+    )
+    if index is not None:
+        return search_dir_index(
+            index,
+            path,
+            pattern,
+            dirs=False,
+            exclude=exclude,
+            max_depth=max_depth,
+            follow_symlinks=follow_symlinks,
+            path_filter=path_filter,
+        )
+    assert_dir(path)
+    entries = _iter_search_entries(
+        path,
+        pattern,
+        predicate=os.DirEntry.is_file,
+        exclude=exclude,
+        max_depth=max_depth,
+        follow_symlinks=follow_symlinks,
+        path_filter=path_filter,
+        workers=workers,
+    )
+    return (entry.path for entry in entries)
+
+
+def _list_paths(
+    path: PathIn,
+    *,
+    predicate: Callable[[os.DirEntry[str]], bool],
+    sort: bool = True,
 ) -> list[str]:
     """
-    Filter paths relative to basepath according to the optional predicate function.
-    If predicate is defined, paths are filtered using it,
-    otherwise all paths will be listed.
+    List the paths of the entries contained at the given directory path,
+    filtering them using the predicate function.
     """
-    paths = []
-    for relpath in relpaths:
-        abspath = os.path.join(basepath, relpath)
-        if predicate is None or predicate(abspath):
-            paths.append(abspath)
-    paths.sort()
+    paths = list(_iter_paths(path, predicate=predicate))
+    if sort:
+        paths.sort()
     return paths
 
 
-def list_dirs(path: PathIn) -> list[str]:
+def list_dirs(path: PathIn, *, sort: bool = True) -> list[str]:
     """
     List all directories contained at the given directory path.
+    If sort is not allowed, directories are listed in file-system order.
     """
-    path = _get_path(path)
-    return _filter_paths(path, os.listdir(path), predicate=is_dir)
+    return _list_paths(path, predicate=os.DirEntry.is_dir, sort=sort)
 
 
-def list_files(path: PathIn) -> list[str]:
+def list_files(path: PathIn, *, sort: bool = True) -> list[str]:
     """
     List all files contained at the given directory path.
+    If sort is not allowed, files are listed in file-system order.
     """
-    path = _get_path(path)
-    return _filter_paths(path, os.listdir(path), predicate=is_file)
+    return _list_paths(path, predicate=os.DirEntry.is_file, sort=sort)
 
 
-def make_dirs(path: PathIn) -> None:
+def make_dirs(path: PathIn | PathInfo) -> None:
     """
     Create the directories needed to ensure that the given path exists.
     If a file already exists at the given path an OSError is raised.
     """
-    path = _get_path(path)
-    if is_dir(path):
+    info = get_path_info(path)
+    if info.is_dir:
         return
-    assert_not_file(path)
-    os.makedirs(path, exist_ok=True)
+    assert_not_file(info)
+    os.makedirs(info.path, exist_ok=True)
 
 
-def make_dirs_for_file(path: PathIn) -> None:
+def make_dirs_for_file(path: PathIn | PathInfo) -> None:
     """
     Create the directories needed to ensure that the given path exists.
     If a directory already exists at the given path an OSError is raised.
     """
-    path = _get_path(path)
-    if is_file(path):
+    info = get_path_info(path)
+    if info.is_file:
         return
-    assert_not_dir(path)
-    dirpath, _ = split_filepath(path)
+    assert_not_dir(info)
+    dirpath, _ = split_filepath(info.path)
     if dirpath:
         make_dirs(dirpath)
 
 
+def _is_same_device(path: PathIn | PathInfo, dest: PathIn | PathInfo) -> bool:
+    return get_path_info(path).dev == get_path_info(dest).dev
+
+
+def _move_file_verified(
+    path: str,
+    dest: str,
+    *,
+    same_device: bool,
+    strategy: str,
+    overwrite: bool = True,
+) -> None:
+    """
+    Move the file at path to dest: renaming it if on the same device,
+    otherwise copying it (unless dest is already in sync, eg. resuming
+    an interrupted move) and removing path only once the copy is verified.
+    If overwrite is not allowed and dest exists, a FileExistsError is raised.
+    """
+    if same_device:
+        try:
+            if overwrite:
+                os.replace(path, dest)
+            else:
+                rename_noreplace(path, dest)
+            return
+        except OSError as error:
+            if error.errno != errno.EXDEV:
+                raise
+    if os.path.islink(path):
+        if overwrite and os.path.lexists(dest):
+            os.remove(dest)
+        os.symlink(os.readlink(path), dest)
+        os.remove(path)
+        return
+    if overwrite:
+        _, size = _sync_dir_file(path, dest, checksum=False, strategy=strategy)
+    else:
+        size = os.stat(path).st_size
+        _copy_file_with_strategy(path, dest, strategy=strategy, exclusive=True)
+    if os.stat(dest).st_size != size:
+        raise OSError(errno.EIO, f"Moved file verification failed: {dest}")
+    os.remove(path)
+
+
+def _move_dir_streaming(
+    path: str,
+    dest: str,
+    *,
+    same_device: bool,
+    workers: int | None,
+    strategy: str,
+    tracker: ProgressTracker,
+) -> None:
+    """
+    Move the directory at path to dest file by file: the directories skeleton
+    is created first, then files are moved (in parallel if workers)
+    and finally the emptied directories are removed bottom-up.
+    Failures are collected and raised at the end as shutil.Error.
+    """
+    dirs_tasks, files_tasks = _get_copy_dir_content_tasks(path, dest, symlinks=True)
+    for _, dirpath in dirs_tasks:
+        os.makedirs(dirpath, exist_ok=True)
+
+    def move_file_task(task: tuple[str, str]) -> tuple[str, str, str] | None:
+        try:
+            size = os.lstat(task[0]).st_size if tracker.enabled else 0
+            _move_file_verified(*task, same_device=same_device, strategy=strategy)
+            tracker.add_file(task[0], size)
+        except OSError as error:
+            return (*task, str(error))
+        return None
+
+    if workers is not None and workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(move_file_task, files_tasks))
+    else:
+        results = [move_file_task(task) for task in files_tasks]
+    errors = [error for error in results if error]
+    for src, dst in reversed(dirs_tasks):
+        try:
+            shutil.copystat(src, dst)
+            if not errors:
+                os.rmdir(src)
+        except OSError as error:
+            errors.append((src, dst, str(error)))
+    if errors:
+        raise shutil.Error(errors)
+
+
 def move_dir(
-    path: PathIn, dest: PathIn, *, overwrite: bool = False, **kwargs: Any
+    path: PathIn,
+    dest: PathIn,
+    *,
+    overwrite: bool = False,
+    workers: int | None = None,
+    strategy: str = "auto",
+    progress: ProgressCallback | None = None,
+    **kwargs: Any,
 ) -> None:
     """
     Move an existing dir from path to dest directory.
     If overwrite is not allowed and dest path exists, an OSError is raised.
-    More informations about kwargs supported options here:
+    If path and dest are on the same device the directory is renamed,
+    otherwise files are copied (using the given strategy, see copy_file)
+    and each source file is removed as soon as its copy is verified;
+    files are moved in parallel if workers is defined, failures are
+    raised at the end as shutil.Error and an interrupted move
+    can be resumed calling it again with overwrite=True.
+    If overwrite and dest already contains a directory with the same name,
+    the directory content is merged into it (files with the same name
+    are replaced, the other ones are kept) instead of raising shutil.Error.
+    If progress is defined, it is called (rate-limited) with the progress
+    (only at the end if the directory is renamed).
+    If kwargs are passed, shutil.move is used, more informations here:
     https://docs.python.org/3/library/shutil.html#shutil.move
     """
     path = _get_path(path)
@@ -316,28 +1149,72 @@ def move_dir(
     if not overwrite:
         assert_not_exists(dest)
     make_dirs(dest)
-    shutil.move(path, dest, **kwargs)
+    if kwargs:
+        shutil.move(path, dest, **kwargs)
+        return
+    target = os.path.join(dest, os.path.basename(os.path.normpath(path)))
+    if os.path.abspath(target).startswith(os.path.join(os.path.abspath(path), "")):
+        raise shutil.Error(f"Cannot move a directory {path!r} into itself {dest!r}.")
+    same_device = _is_same_device(path, dest)
+    if same_device and not os.path.lexists(target):
+        try:
+            os.rename(path, target)
+            ProgressTracker(progress).finish(path=target)
+            return
+        except OSError as error:
+            if error.errno != errno.EXDEV:
+                raise
+    tracker = ProgressTracker(progress, paths=[path])
+    _move_dir_streaming(
+        path,
+        target,
+        same_device=same_device,
+        workers=workers,
+        strategy=strategy,
+        tracker=tracker,
+    )
+    tracker.finish(path=target)
 
 
 def move_file(
-    path: PathIn, dest: PathIn, *, overwrite: bool = False, **kwargs: Any
+    path: PathIn,
+    dest: PathIn,
+    *,
+    overwrite: bool = False,
+    strategy: str = "auto",
+    **kwargs: Any,
 ) -> None:
     """
     Move an existing file from path to dest directory.
     If overwrite is not allowed and dest path exists, an OSError is raised.
-    More informations about kwargs supported options here:
+    If path and dest are on the same device the file is renamed,
+    otherwise it is copied (using the given strategy, see copy_file)
+    and removed only once its copy is verified.
+    If overwrite is not allowed, it is enforced by the kernel where supported,
+    without races.
+    If kwargs are passed, shutil.move is used, more informations here:
     https://docs.python.org/3/library/shutil.html#shutil.move
     """
-    path = _get_path(path)
-    dest = _get_path(dest)
-    assert_file(path)
-    assert_not_file(dest)
-    dest = os.path.join(dest, get_filename(path))
-    assert_not_dir(dest)
-    if not overwrite:
-        assert_not_exists(dest)
-    make_dirs_for_file(dest)
-    shutil.move(path, dest, **kwargs)
+    info = get_path_info(path)
+    assert_file(info)
+    path = info.path
+    dir_info = get_path_info(dest)
+    assert_not_file(dir_info)
+    dest = os.path.join(dir_info.path, get_filename(path))
+    if overwrite or kwargs:
+        assert_not_dir(dest)
+    if not dir_info.exists:
+        make_dirs(dir_info)
+        dir_info = get_path_info(dir_info.path)
+    if kwargs:
+        if not overwrite:
+            assert_not_exists(dest)
+        shutil.move(path, dest, **kwargs)
+        return
+    same_device = _is_same_device(info, dir_info)
+    _move_file_verified(
+        path, dest, same_device=same_device, strategy=strategy, overwrite=overwrite
+    )
 
 
 def remove_dir(path: PathIn, **kwargs: Any) -> bool:
@@ -355,14 +1232,168 @@ def remove_dir(path: PathIn, **kwargs: Any) -> bool:
     return not exists(path)
 
 
-def remove_dir_content(path: PathIn) -> None:
+REMOVE_CHUNK_SIZE = 1000
+REMOVE_WITH_DIR_FD = {os.open, os.rmdir, os.unlink} <= os.supports_dir_fd and (
+    os.scandir in os.supports_fd
+)
+
+_RemoveReport = dict[str, Any]
+
+
+def _new_remove_report() -> _RemoveReport:
+    return {"dirs": 0, "files": 0, "errors": []}
+
+
+def _merge_remove_reports(reports: Iterable[_RemoveReport]) -> _RemoveReport:
+    report = _new_remove_report()
+    for item in reports:
+        report["dirs"] += item["dirs"]
+        report["files"] += item["files"]
+        report["errors"] += item["errors"]
+    return report
+
+
+def _open_dir_fd(path: str, dir_fd: int | None = None) -> int | None:
     """
-    Removes all directory content (both sub-directories and files).
+    Open the directory at path (relative to dir_fd) without following symlinks,
+    return None if removing entries relative to directories fds is not supported.
+    """
+    if not REMOVE_WITH_DIR_FD:
+        return None
+    flags = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_NOFOLLOW", 0)
+    return os.open(path, flags, dir_fd=dir_fd)
+
+
+def _scan_dir_entries(dirpath: str, dir_fd: int | None) -> list[os.DirEntry[str]]:
+    with os.scandir(dirpath if dir_fd is None else dir_fd) as entries:
+        return list(entries)
+
+
+def _remove_dir_tree(
+    dirpath: str, name: str, parent_fd: int | None, report: _RemoveReport
+) -> None:
+    dir_fd = _open_dir_fd(name, parent_fd)
+    try:
+        entries = _scan_dir_entries(dirpath, dir_fd)
+        _remove_dir_entries(dirpath, dir_fd, entries, report)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+    os.rmdir(name, dir_fd=parent_fd)
+
+
+def _remove_dir_entries(
+    dirpath: str,
+    dir_fd: int | None,
+    entries: list[os.DirEntry[str]],
+    report: _RemoveReport,
+) -> _RemoveReport:
+    """
+    Remove the given entries of the directory at dirpath (opened as dir_fd)
+    and all their content, updating and returning the report.
+    """
+    for entry in entries:
+        path = os.path.join(dirpath, entry.name)
+        name = path if dir_fd is None else entry.name
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                _remove_dir_tree(path, name, dir_fd, report)
+                report["dirs"] += 1
+            else:
+                os.unlink(name, dir_fd=dir_fd)
+                report["files"] += 1
+        except FileNotFoundError:
+            pass
+        except OSError as error:
+            report["errors"].append((path, str(error)))
+    return report
+
+
+def _remove_files_in_dir(dirpath: str, names: list[str]) -> _RemoveReport:
+    report = _new_remove_report()
+    try:
+        dir_fd = _open_dir_fd(dirpath)
+    except FileNotFoundError:
+        return report
+    except OSError as error:
+        report["errors"] += [
+            (os.path.join(dirpath, name), str(error)) for name in names
+        ]
+        return report
+    try:
+        for name in names:
+            path = os.path.join(dirpath, name)
+            try:
+                os.unlink(path if dir_fd is None else name, dir_fd=dir_fd)
+                report["files"] += 1
+            except FileNotFoundError:
+                pass
+            except OSError as error:
+                report["errors"].append((path, str(error)))
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+    return report
+
+
+def _run_remove_tasks(
+    func: Callable[..., _RemoveReport],
+    tasks: list[tuple[Any, ...]],
+    *,
+    workers: int | None,
+) -> _RemoveReport:
+    if workers is not None and workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return _merge_remove_reports(executor.map(lambda task: func(*task), tasks))
+    return _merge_remove_reports(func(*task) for task in tasks)
+
+
+def _chunk_list(items: list[Any], size: int) -> list[list[Any]]:
+    return [items[index : index + size] for index in range(0, len(items), size)]
+
+
+def _chunk_dir_entries(
+    entries: list[os.DirEntry[str]],
+) -> list[list[os.DirEntry[str]]]:
+    """
+    Split the given entries in chunks that can be processed in parallel:
+    a chunk for each sub-directory and chunks of REMOVE_CHUNK_SIZE other entries.
+    """
+    dirs_entries = [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+    files_entries = [
+        entry for entry in entries if not entry.is_dir(follow_symlinks=False)
+    ]
+    return [[entry] for entry in dirs_entries] + _chunk_list(
+        files_entries, REMOVE_CHUNK_SIZE
+    )
+
+
+def remove_dir_content(path: PathIn, *, workers: int | None = None) -> _RemoveReport:
+    """
+    Removes all directory content (both sub-directories and files)
+    and return a report dict with the number of removed "dirs" and "files"
+    and the list of "errors" as (path, error message) tuples.
+    Removal failures don't raise an OSError anymore (as in previous versions),
+    so check report["errors"].
+    Entries are removed relative to the opened directory (when supported)
+    and symlinks are never followed.
+    If workers is defined, sub-directories (and chunks of files) are removed
+    in parallel using a pool of workers threads, parallelism is per top-level
+    entry (the content of each sub-directory is removed by a single worker).
     """
     path = _get_path(path)
     assert_dir(path)
-    remove_dirs(*list_dirs(path))
-    remove_files(*list_files(path))
+    dir_fd = _open_dir_fd(path)
+    try:
+        entries = _scan_dir_entries(path, dir_fd)
+        tasks = [
+            (path, dir_fd, entries_chunk, _new_remove_report())
+            for entries_chunk in _chunk_dir_entries(entries)
+        ]
+        return _run_remove_tasks(_remove_dir_entries, tasks, workers=workers)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
 
 
 def remove_dirs(*paths: PathIn) -> None:
@@ -378,47 +1409,69 @@ def remove_file(path: PathIn) -> bool:
     Remove a file at the given path.
     If the file is removed with success returns True, otherwise False.
     """
-    path = _get_path(path)
-    if not exists(path):
+    info = get_path_info(path)
+    if not info.exists:
         return False
-    assert_file(path)
-    os.remove(path)
-    return not exists(path)
-
-
-def remove_files(*paths: PathIn) -> None:
-    """
-    Remove multiple files at the given paths.
-    """
+    assert_file(info)
+    os.remove(info.path)
+    return True
+
+
+def remove_files(*paths: PathIn, workers: int | None = None) -> _RemoveReport:
+    """
+    Remove multiple files at the given paths and return a report dict
+    with the number of removed "files" and the list of "errors"
+    as (path, error message) tuples, missing files are ignored.
+    If any of the given paths is an existing directory, an OSError is raised
+    before removing anything, removal failures don't raise an OSError anymore
+    (as in previous versions): the other files are removed anyway
+    and failures are listed in the report, so check report["errors"].
+    Files are grouped by directory and removed relative to the opened
+    directory (when supported).
+    If workers is defined, files are removed in parallel
+    using a pool of workers threads.
+    """
+    names_by_dir: dict[str, list[str]] = {}
     for path in paths:
-        remove_file(path)
+        info = get_path_info(path)
+        if info.is_dir:
+            raise OSError(f"Invalid file path: {info.path}")
+    for path in paths:
+        dirpath, name = os.path.split(os.path.abspath(_get_path(path)))
+        names_by_dir.setdefault(dirpath, []).append(name)
+    tasks = [
+        (dirpath, names_chunk)
+        for dirpath, names in names_by_dir.items()
+        for names_chunk in _chunk_list(names, REMOVE_CHUNK_SIZE)
+    ]
+    return _run_remove_tasks(_remove_files_in_dir, tasks, workers=workers)
 
 
 def rename_dir(path: PathIn, name: str) -> None:
     """
     Rename a directory with the given name.
-    If a directory or a file with the given name already exists, an OSError is raised.
+    If a directory or a file with the given name already exists, an OSError is raised
+    (enforced by the kernel where supported, without races).
     """
     path = _get_path(path)
     assert_dir(path)
     comps = list(os.path.split(path))
     comps[-1] = name
     dest = os.path.join(*comps)
-    assert_not_exists(dest)
-    os.rename(path, dest)
+    rename_noreplace(path, dest)
 
 
 def rename_file(path: PathIn, name: str) -> None:
     """
     Rename a file with the given name.
-    If a directory or a file with the given name already exists, an OSError is raised.
+    If a directory or a file with the given name already exists, an OSError is raised
+    (enforced by the kernel where supported, without races).
     """
     path = _get_path(path)
     assert_file(path)
     dirpath, _ = split_filepath(path)
     dest = join_filepath(dirpath, name)
-    assert_not_exists(dest)
-    os.rename(path, dest)
+    rename_noreplace(path, dest)
 
 
 def rename_file_basename(path: PathIn, basename: str) -> None:
@@ -441,10 +1494,56 @@ def rename_file_extension(path: PathIn, extension: str) -> None:
     rename_file(path, filename)
 
 
-def replace_dir(path: PathIn, src: PathIn, *, autodelete: bool = False) -> None:
+def _replace_dir_by_rename(path: str, src: str) -> bool:
+    """
+    Replace the existing directory at path with the directory at src
+    without copying it, atomically exchanging them when supported,
+    and remove the replaced directory.
+    Return False if nothing has been done because they are nested,
+    not on the same file-system or the renames failed.
+    """
+    if os.path.commonpath([path, src]) in (path, src):
+        return False
+    try:
+        rename_exchange(src, path)
+    except OSError as error:
+        if error.errno not in RENAME_FLAGS_UNSUPPORTED_ERRNOS:
+            return False
+    else:
+        remove_dir(src)
+        return True
+    # not atomic fallback: move path aside, move src into place
+    dirpath, _ = split_filepath(path)
+    temp_path = join_path(dirpath, get_unique_name(dirpath))
+    try:
+        os.rename(path, temp_path)
+    except OSError:
+        return False
+    try:
+        os.rename(src, path)
+    except OSError:
+        os.rename(temp_path, path)
+        return False
+    remove_dir(temp_path)
+    return True
+
+
+def replace_dir(
+    path: PathIn,
+    src: PathIn,
+    *,
+    autodelete: bool = False,
+    workers: int | None = None,
+    strategy: str = "auto",
+) -> None:
     """
     Replace directory at the specified path with the directory located at src.
     If autodelete, the src directory will be removed at the end of the operation.
+    If autodelete and src is on the same file-system, src is moved into place
+    without copying it (atomically exchanging the directories where supported).
+    If workers is defined, files are copied in parallel
+    using a pool of workers threads.
+    Files data are copied using the given strategy (see copy_file).
     Optimized for large files.
     """
     path = _get_path(path)
@@ -457,11 +1556,19 @@ def replace_dir(path: PathIn, src: PathIn, *, autodelete: bool = False) -> None:
 
     make_dirs(path)
 
+    if (
+        autodelete
+        and not os.path.islink(src)
+        and _is_same_device(src, path)
+        and _replace_dir_by_rename(os.path.abspath(path), os.path.abspath(src))
+    ):
+        return
+
     dirpath, dirname = split_filepath(path)
     # safe temporary name to avoid clashes with existing files/directories
     temp_dirname = get_unique_name(dirpath)
     temp_dest = join_path(dirpath, temp_dirname)
-    copy_dir_content(src, temp_dest)
+    copy_dir_content(src, temp_dest, workers=workers, strategy=strategy)
 
     if exists(path):
         temp_dirname = get_unique_name(dirpath)
@@ -476,10 +1583,15 @@ def replace_dir(path: PathIn, src: PathIn, *, autodelete: bool = False) -> None:
         remove_dir(path=src)
 
 
-def replace_file(path: PathIn, src: PathIn, *, autodelete: bool = False) -> None:
+def replace_file(
+    path: PathIn, src: PathIn, *, autodelete: bool = False, strategy: str = "auto"
+) -> None:
     """
     Replace file at the specified path with the file located at src.
     If autodelete, the src file will be removed at the end of the operation.
+    If autodelete and src is on the same file-system, src is atomically
+    moved into place without copying it.
+    The file data is copied using the given strategy (see copy_file).
     Optimized for large files.
     """
     path = _get_path(path)
@@ -492,11 +1604,23 @@ def replace_file(path: PathIn, src: PathIn, *, autodelete: bool = False) -> None
     make_dirs_for_file(path)
 
     dirpath, filename = split_filepath(path)
+    if (
+        autodelete
+        and not os.path.islink(src)
+        and _is_same_device(src, dirpath or os.curdir)
+    ):
+        try:
+            os.replace(src, path)
+            return
+        except OSError as error:
+            if error.errno != errno.EXDEV:
+                raise
+
     _, extension = split_filename(filename)
     # safe temporary name to avoid clashes with existing files/directories
     temp_filename = get_unique_name(dirpath, extension=extension)
     temp_dest = join_path(dirpath, temp_filename)
-    copy_file(path=src, dest=temp_dest, overwrite=False)
+    copy_file(path=src, dest=temp_dest, overwrite=False, strategy=strategy)
 
     if exists(path):
         temp_filename = get_unique_name(dirpath, extension=extension)
@@ -511,32 +1635,277 @@ def replace_file(path: PathIn, src: PathIn, *, autodelete: bool = False) -> None
         remove_file(path=src)
 
 
-def _search_paths(path: PathIn, pattern: str) -> list[str]:
-    """
-    Search all paths relative to path matching the given pattern.
+def _iter_search_entries(
+    path: PathIn,
+    pattern: str | list[str],
+    *,
+    predicate: Callable[[os.DirEntry[str]], bool],
+    exclude: str | list[str] | None = None,
+    max_depth: int | None = None,
+    follow_symlinks: bool = True,
+    path_filter: PathFilter | None = None,
+    workers: int | None = None,
+) -> Generator[os.DirEntry[str]]:
+    """
+    Iterate over all entries at path matching the given pattern(s),
+    the predicate function and the path filter, pruning the directories
+    that are excluded or that cannot contain matches.
     """
     path = _get_path(path)
-    assert_dir(path)
-    pathname = os.path.join(path, pattern)
-    paths = glob.glob(pathname, recursive=True)
-    # normalize paths to use OS-specific separators
-    paths = [
-        os.path.relpath(os.path.normpath(path_result), path) for path_result in paths
-    ]
+    matcher = compile_matcher(pattern, exclude=exclude)
+    entries = walk_entries(
+        path,
+        matcher,
+        max_depth=max_depth,
+        follow_symlinks=follow_symlinks,
+        workers=workers,
+    )
+    for entry in entries:
+        if predicate(entry) and (path_filter is None or path_filter.match_entry(entry)):
+            yield entry
+
+
+def search_dirs(
+    path: PathIn,
+    pattern: str | list[str] = "**/*",
+    *,
+    exclude: str | list[str] | None = None,
+    max_depth: int | None = None,
+    follow_symlinks: bool = True,
+    min_size: int | str | None = None,
+    max_size: int | str | None = None,
+    modified_after: datetime | None = None,
+    modified_before: datetime | None = None,
+    extensions: list[str] | None = None,
+    symlinks: bool = True,
+    workers: int | None = None,
+    index: PathIn | None = None,
+) -> list[str]:
+    """
+    Search for directories at path matching the given pattern(s).
+    Directories matching the exclude pattern(s) (gitignore-style) are skipped
+    without descending into them.
+    Patterns are relative to path ("." and ".." segments are resolved),
+    the path itself is never returned (unlike glob, "**" doesn't match it).
+    If max_depth is defined, only paths at most max_depth levels below path
+    are searched.
+    If follow_symlinks, symlinked directories are searched too.
+    If min_size and/or max_size are defined, only paths with size in range
+    are returned (sizes can be expressed in bytes or as strings, eg. "1 GB").
+    If modified_after and/or modified_before are defined, only paths
+    last modified in range are returned.
+    If extensions is defined, only paths with one of the extensions are returned.
+    If not symlinks, symlinks are not returned.
+    If workers is defined, directories are searched in parallel
+    using a pool of workers threads.
+    If index is defined, directories are searched using the index
+    at the given path (see update_dir_index) without walking the file-system.
+    The content of symlinked directories is not indexed, so if follow_symlinks
+    and the search would descend into a symlinked directory, a ValueError
+    is raised (use follow_symlinks=False).
+    """
+    paths = list(
+        iter_search_dirs(
+            path,
+            pattern,
+            exclude=exclude,
+            max_depth=max_depth,
+            follow_symlinks=follow_symlinks,
+            min_size=min_size,
+            max_size=max_size,
+            modified_after=modified_after,
+            modified_before=modified_before,
+            extensions=extensions,
+            symlinks=symlinks,
+            workers=workers,
+            index=index,
+        )
+    )
+    paths.sort()
     return paths
 
 
-def search_dirs(path: PathIn, pattern: str = "**/*") -> list[str]:
-    """
-    Search for directories at path matching the given pattern.
+def search_files(
+    path: PathIn,
+    pattern: str | list[str] = "**/*.*",
+    *,
+    exclude: str | list[str] | None = None,
+    max_depth: int | None = None,
+    follow_symlinks: bool = True,
+    min_size: int | str | None = None,
+    max_size: int | str | None = None,
+    modified_after: datetime | None = None,
+    modified_before: datetime | None = None,
+    extensions: list[str] | None = None,
+    symlinks: bool = True,
+    workers: int | None = None,
+    index: PathIn | None = None,
+) -> list[str]:
     """
-    path = _get_path(path)
-    return _filter_paths(path, _search_paths(path, pattern), predicate=is_dir)
+    Search for files at path matching the given pattern(s).
+    Directories matching the exclude pattern(s) (gitignore-style) are skipped
+    without descending into them.
+    Patterns are relative to path ("." and ".." segments are resolved),
+    the path itself is never returned (unlike glob, "**" doesn't match it).
+    If max_depth is defined, only paths at most max_depth levels below path
+    are searched.
+    If follow_symlinks, symlinked directories are searched too.
+    If min_size and/or max_size are defined, only paths with size in range
+    are returned (sizes can be expressed in bytes or as strings, eg. "1 GB").
+    If modified_after and/or modified_before are defined, only paths
+    last modified in range are returned.
+    If extensions is defined, only paths with one of the extensions are returned.
+    If not symlinks, symlinks are not returned.
+    If workers is defined, directories are searched in parallel
+    using a pool of workers threads.
+    If index is defined, directories are searched using the index
+    at the given path (see update_dir_index) without walking the file-system.
+    The content of symlinked directories is not indexed, so if follow_symlinks
+    and the search would descend into a symlinked directory, a ValueError
+    is raised (use follow_symlinks=False).
+    """
+    paths = list(
+        iter_search_files(
+            path,
+            pattern,
+            exclude=exclude,
+            max_depth=max_depth,
+            follow_symlinks=follow_symlinks,
+            min_size=min_size,
+            max_size=max_size,
+            modified_after=modified_after,
+            modified_before=modified_before,
+            extensions=extensions,
+            symlinks=symlinks,
+            workers=workers,
+            index=index,
+        )
+    )
+    paths.sort()
+    return paths
 
 
-def search_files(path: PathIn, pattern: str = "**/*.*") -> list[str]:
-    """
-    Search for files at path matching the given pattern.
+def _sync_dir_delete(dest: str, relpaths: set[str]) -> tuple[int, int]:
+    """
+    Delete the entries at dest that are not in the given relative paths
+    and return the number and the size of the deleted files.
+    """
+    deleted, deleted_bytes = (0, 0)
+    deleted_dirs = []
+    for entry in walk_entries(dest, follow_symlinks=False):
+        if os.path.relpath(entry.path, dest) in relpaths:
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            deleted_dirs.append(entry.path)
+            continue
+        deleted += 1
+        deleted_bytes += entry.stat(follow_symlinks=False).st_size
+        os.remove(entry.path)
+    # sub-directories come after their parent directory in sort order
+    for dirpath in sorted(deleted_dirs, reverse=True):
+        os.rmdir(dirpath)
+    return (deleted, deleted_bytes)
+
+
+def _sync_dir_file(
+    path: str, dest: str, *, checksum: bool, strategy: str
+) -> tuple[bool, int]:
+    """
+    Copy the file at path to dest unless dest is already in sync (same size
+    and last modification date, or same hash if checksum) and return
+    a tuple with a copied flag and the file size.
+    """
+    from fsutil.info import get_file_hash
+
+    path_stat = os.stat(path)
+    try:
+        dest_stat = os.stat(dest, follow_symlinks=False)
+    except FileNotFoundError:
+        dest_stat = None
+    if dest_stat is not None:
+        if stat.S_ISDIR(dest_stat.st_mode):
+            remove_dir(dest)
+        elif not stat.S_ISREG(dest_stat.st_mode):
+            os.remove(dest)
+        elif path_stat.st_size == dest_stat.st_size and (
+            get_file_hash(path) == get_file_hash(dest)
+            if checksum
+            else path_stat.st_mtime_ns == dest_stat.st_mtime_ns
+        ):
+            return (False, path_stat.st_size)
+    _copy_file_with_strategy(path, dest, strategy=strategy)
+    return (True, path_stat.st_size)
+
+
+def _sync_dir_make_dirs(dirs_tasks: list[tuple[str, str]]) -> None:
+    for _, dirpath in dirs_tasks:
+        if os.path.lexists(dirpath) and not os.path.isdir(dirpath):
+            os.remove(dirpath)
+        os.makedirs(dirpath, exist_ok=True)
+
+
+def sync_dir(
+    path: PathIn,
+    dest: PathIn,
+    *,
+    checksum: bool = False,
+    delete: bool = False,
+    workers: int | None = None,
+    strategy: str = "auto",
+) -> dict[str, int]:
+    """
+    Sync the content of the directory at the given path to dest path,
+    copying only new and changed files, detected by size and last modification
+    date (or by size and hash if checksum) and return a report dict
+    with the number and the size of copied, skipped and deleted files.
+    If delete, files and directories in dest that are not in path are deleted.
+    If workers is defined, files are synced in parallel
+    using a pool of workers threads.
+    Files data are copied using the given strategy (see copy_file).
     """
     path = _get_path(path)
-    return _filter_paths(path, _search_paths(path, pattern), predicate=is_file)
+    dest = _get_path(dest)
+    assert_dir(path)
+    assert_not_file(dest)
+    make_dirs(dest)
+    dirs_tasks = [(path, dest)]
+    files_tasks = []
+    relpaths = set()
+    for entry in walk_entries(path):
+        relpath = os.path.relpath(entry.path, path)
+        task = (entry.path, os.path.join(dest, relpath))
+        if entry.is_dir():
+            dirs_tasks.append(task)
+        elif entry.is_file():
+            files_tasks.append(task)
+        else:
+            continue
+        relpaths.add(relpath)
+    deleted, deleted_bytes = _sync_dir_delete(dest, relpaths) if delete else (0, 0)
+    report = {
+        "copied": 0,
+        "copied_bytes": 0,
+        "skipped": 0,
+        "skipped_bytes": 0,
+        "deleted": deleted,
+        "deleted_bytes": deleted_bytes,
+    }
+    _sync_dir_make_dirs(dirs_tasks)
+
+    def sync_file_task(task: tuple[str, str]) -> tuple[bool, int]:
+        return _sync_dir_file(*task, checksum=checksum, strategy=strategy)
+
+    if workers is not None and workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(sync_file_task, files_tasks))
+    else:
+        results = [sync_file_task(task) for task in files_tasks]
+    for copied, size in results:
+        key = "copied" if copied else "skipped"
+        report[key] += 1
+        report[f"{key}_bytes"] += size
+    # copy directories metadata at the end, bottom-up,
+    # because syncing files changes their last modification date
+    for src, dst in reversed(dirs_tasks):
+        shutil.copystat(src, dst)
+    return report
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import os
+import stat
+import threading
+from typing import NamedTuple
+
+from fsutil.args import get_path as _get_path
+from fsutil.types import PathIn
+
+_stat_count = 0
+_stat_count_lock = threading.Lock()
+
+
+def _count_stat() -> None:
+    global _stat_count
+    with _stat_count_lock:
+        _stat_count += 1
+
+
+def get_stat_count() -> int:
+    """
+    Get the number of stat syscalls done to get paths info (get_path_info)
+    since the start (or the last reset of the counter).
+    Only the stats done through this layer are counted, the ones done
+    internally by the standard library (eg. shutil.copystat, os.makedirs)
+    or by os.scandir entries are not.
+    """
+    return _stat_count
+
+
+def reset_stat_count() -> None:
+    """
+    Reset the counter of stat syscalls done to get paths info.
+    """
+    global _stat_count
+    with _stat_count_lock:
+        _stat_count = 0
+
+
+class PathInfo(NamedTuple):
+    """
+    Snapshot of the info of a path (symlinks are followed),
+    it can be passed to checks functions instead of the path
+    to avoid stat-ing it again.
+    """
+
+    path: str
+    stat_result: os.stat_result | None
+    is_symlink: bool = False
+
+    def __fspath__(self) -> str:
+        return self.path
+
+    def _get_stat_result(self) -> os.stat_result:
+        if self.stat_result is None:
+            raise OSError(f"Invalid item path: {self.path}")
+        return self.stat_result
+
+    @property
+    def ctime(self) -> float:
+        return self._get_stat_result().st_ctime
+
+    @property
+    def dev(self) -> int:
+        return self._get_stat_result().st_dev
+
+    @property
+    def exists(self) -> bool:
+        return self.stat_result is not None
+
+    @property
+    def is_dir(self) -> bool:
+        return self.exists and stat.S_ISDIR(self._get_stat_result().st_mode)
+
+    @property
+    def is_file(self) -> bool:
+        return self.exists and stat.S_ISREG(self._get_stat_result().st_mode)
+
+    @property
+    def mode(self) -> int:
+        return self._get_stat_result().st_mode
+
+    @property
+    def mtime(self) -> float:
+        return self._get_stat_result().st_mtime
+
+    @property
+    def size(self) -> int:
+        return self._get_stat_result().st_size
+
+    def samefile(self, other: PathInfo) -> bool:
+        if self.stat_result is None or other.stat_result is None:
+            return False
+        return os.path.samestat(self.stat_result, other.stat_result)
+
+
+def get_path_info(path: PathIn | PathInfo) -> PathInfo:
+    """
+    Get the info (exists, type, size, ctime, mtime, mode) of the given path
+    with a single lstat (plus a stat if it is a symlink).
+    If path is already a PathInfo, it is returned as it is.
+    """
+    if isinstance(path, PathInfo):
+        return path
+    path = _get_path(path)
+    _count_stat()
+    try:
+        stat_result = os.lstat(path)
+    except (OSError, ValueError):
+        return PathInfo(path, None)
+    if not stat.S_ISLNK(stat_result.st_mode):
+        return PathInfo(path, stat_result)
+    _count_stat()
+    try:
+        return PathInfo(path, os.stat(path), True)
+    except (OSError, ValueError):
+        return PathInfo(path, None, True)
@@ -4,16 +4,17 @@ import os
 
 from fsutil.args import get_path as _get_path
 from fsutil.checks import assert_exists
+from fsutil.pathinfo import PathInfo, get_path_info
 from fsutil.types import PathIn
 
 
-def get_permissions(path: PathIn) -> int:
+def get_permissions(path: PathIn | PathInfo) -> int:
     """
     Get the file/directory permissions.
     """
-    path = _get_path(path)
-    assert_exists(path)
-    st_mode = os.stat(path).st_mode
+    info = get_path_info(path)
+    assert_exists(info)
+    st_mode = info.mode
     permissions = int(str(oct(st_mode & 0o777))[2:])
     return permissions
 
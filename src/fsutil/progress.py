@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import NamedTuple
+
+PROGRESS_INTERVAL = 0.1
+
+
+class Progress(NamedTuple):
+    """
+    Snapshot of the progress of a long-running operation,
+    totals are None if not known.
+    """
+
+    bytes_done: int
+    bytes_total: int | None
+    files_done: int
+    files_total: int | None
+    path: str | None
+    elapsed: float
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_done / self.elapsed if self.elapsed > 0 else 0.0
+
+
+ProgressCallback = Callable[[Progress], object]
+
+
+def get_paths_totals(paths: Iterable[str]) -> tuple[int, int]:
+    """
+    Get the files count and the total size in bytes of the given paths
+    (files or directories, walked recursively without following symlinks).
+    """
+    files_count = 0
+    size = 0
+    stack = list(paths)
+    while stack:
+        path = stack.pop()
+        try:
+            if os.path.isdir(path) and not os.path.islink(path):
+                with os.scandir(path) as entries:
+                    stack.extend(entry.path for entry in entries)
+                continue
+            size += os.lstat(path).st_size
+        except OSError:
+            continue
+        files_count += 1
+    return (files_count, size)
+
+
+class ProgressTracker:
+    """
+    Thread-safe progress tracker that calls the given callback
+    at most once per interval (and always at start and finish),
+    all its methods do nothing if the callback is None.
+    """
+
+    def __init__(
+        self,
+        callback: ProgressCallback | None,
+        *,
+        bytes_total: int | None = None,
+        files_total: int | None = None,
+        paths: Iterable[str] | None = None,
+        interval: float | None = None,
+    ) -> None:
+        self.callback = callback
+        if callback is not None and paths is not None:
+            files_total, bytes_total = get_paths_totals(paths)
+        self.bytes_total = bytes_total
+        self.files_total = files_total
+        self.bytes_done = 0
+        self.files_done = 0
+        self.interval = PROGRESS_INTERVAL if interval is None else interval
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._last: float | None = None
+        self._last_done = (-1, -1)
+
+    @property
+    def enabled(self) -> bool:
+        return self.callback is not None
+
+    def _emit(self, callback: ProgressCallback, now: float, path: str | None) -> None:
+        self._last = now
+        self._last_done = (self.bytes_done, self.files_done)
+        progress = Progress(
+            self.bytes_done,
+            self.bytes_total,
+            self.files_done,
+            self.files_total,
+            path,
+            now - self._start,
+        )
+        callback(progress)
+
+    def update(
+        self, *, bytes: int = 0, files: int = 0, path: str | None = None
+    ) -> None:
+        """
+        Add the given bytes and files to the done counters and call
+        the callback if the interval elapsed since the last call.
+        """
+        callback = self.callback
+        if callback is None:
+            return
+        with self._lock:
+            self.bytes_done += bytes
+            self.files_done += files
+            now = time.monotonic()
+            if self._last is None or now - self._last >= self.interval:
+                self._emit(callback, now, path)
+
+    def add_file(self, path: str, size: int | None = None) -> None:
+        """
+        Mark the file at the given path as done, its size is read
+        from the file-system if not provided.
+        """
+        if self.callback is None:
+            return
+        if size is None:
+            try:
+                size = os.lstat(path).st_size
+            except OSError:
+                size = 0
+        self.update(bytes=size, files=1, path=path)
+
+    def finish(self, *, path: str | None = None) -> None:
+        """
+        Call the callback with the final progress,
+        unless it has already been notified.
+        """
+        callback = self.callback
+        if callback is None:
+            return
+        with self._lock:
+            if self._last_done != (self.bytes_done, self.files_done):
+                self._emit(callback, time.monotonic(), path)
@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import errno
+import functools
+import os
+import shutil
+import sys
+from collections.abc import Callable
+
+from fsutil.args import get_path as _get_path
+from fsutil.pathinfo import PathInfo, get_path_info
+from fsutil.types import PathIn
+
+COPY_BUFFER_SIZE = 1024 * 1024
+COPY_CHUNK_SIZE = 1024 * 1024 * 1024
+# smaller chunks are copied if the progress is tracked
+COPY_PROGRESS_CHUNK_SIZE = 16 * 1024 * 1024
+COPY_STRATEGIES = ["reflink", "copy_file_range", "sendfile", "native", "buffer"]
+# "buffer" is used only if explicitly requested, "native" (shutil.copyfile)
+# already uses the platform fast paths (fcopyfile on macos, CopyFile2 on windows)
+COPY_STRATEGIES_AUTO = ["reflink", "copy_file_range", "sendfile", "native"]
+COPY_STRATEGIES_FALLBACK_ERRNOS = {
+    errno.EBADF,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTSUP,
+    errno.ENOTTY,
+    errno.EOPNOTSUPP,
+    errno.EPERM,
+    errno.ETXTBSY,
+    errno.EXDEV,
+}
+
+# linux ioctl request to clone a file (_IOW(0x94, 9, int))
+FICLONE = 0x40049409
+
+IS_LINUX = sys.platform.startswith("linux")
+
+# called with the number of bytes copied by each chunk
+CopyProgressCallback = Callable[[int], None]
+CopyStrategyFunc = Callable[[int, int, CopyProgressCallback | None], None]
+
+
+def _raise_not_supported(strategy: str) -> None:
+    raise OSError(errno.ENOTSUP, f"Copy strategy not supported: {strategy}")
+
+
+def _copy_reflink(
+    src_fd: int, dest_fd: int, progress: CopyProgressCallback | None = None
+) -> None:
+    if not IS_LINUX:
+        _raise_not_supported("reflink")
+    import fcntl
+
+    fcntl.ioctl(dest_fd, FICLONE, src_fd)
+
+
+def _copy_file_range(
+    src_fd: int, dest_fd: int, progress: CopyProgressCallback | None = None
+) -> None:
+    if not hasattr(os, "copy_file_range"):
+        _raise_not_supported("copy_file_range")
+    chunk_size = COPY_CHUNK_SIZE if progress is None else COPY_PROGRESS_CHUNK_SIZE
+    while copied := os.copy_file_range(src_fd, dest_fd, chunk_size):
+        if progress is not None:
+            progress(copied)
+
+
+def _copy_sendfile(
+    src_fd: int, dest_fd: int, progress: CopyProgressCallback | None = None
+) -> None:
+    # sendfile to regular files is supported only on linux
+    if not IS_LINUX:
+        _raise_not_supported("sendfile")
+    chunk_size = COPY_CHUNK_SIZE if progress is None else COPY_PROGRESS_CHUNK_SIZE
+    offset = 0
+    while sent := os.sendfile(dest_fd, src_fd, offset, chunk_size):
+        offset += sent
+        if progress is not None:
+            progress(sent)
+    os.lseek(dest_fd, offset, os.SEEK_SET)
+
+
+def _copy_buffer(
+    src_fd: int, dest_fd: int, progress: CopyProgressCallback | None = None
+) -> None:
+    while data := os.read(src_fd, COPY_BUFFER_SIZE):
+        view = memoryview(data)
+        while view:
+            view = view[os.write(dest_fd, view) :]
+        if progress is not None:
+            progress(len(data))
+
+
+COPY_STRATEGIES_FUNCS: dict[str, CopyStrategyFunc] = {
+    "reflink": _copy_reflink,
+    "copy_file_range": _copy_file_range,
+    "sendfile": _copy_sendfile,
+    "buffer": _copy_buffer,
+}
+
+
+def _get_copy_strategies(strategy: str) -> list[str]:
+    if strategy == "auto":
+        return COPY_STRATEGIES_AUTO
+    if strategy not in COPY_STRATEGIES:
+        raise ValueError(
+            f"Invalid copy strategy: {strategy!r}, "
+            f"expected 'auto' or one of {COPY_STRATEGIES!r}."
+        )
+    return [strategy]
+
+
+def _copy_file_data_fd(
+    src_fd: int,
+    dest_fd: int,
+    strategies: list[str],
+    *,
+    fallback: bool = False,
+    progress: CopyProgressCallback | None = None,
+) -> str | None:
+    """
+    Copy the file data using the first supported strategy and return it,
+    if none of them is supported the last error is raised,
+    or None is returned if fallback.
+    """
+    copied = 0
+
+    def on_progress(size: int) -> None:
+        nonlocal copied
+        copied += size
+        if progress is not None:
+            progress(size)
+
+    for strategy in strategies:
+        try:
+            COPY_STRATEGIES_FUNCS[strategy](
+                src_fd, dest_fd, on_progress if progress is not None else None
+            )
+            return strategy
+        except OSError as error:
+            if error.errno not in COPY_STRATEGIES_FALLBACK_ERRNOS:
+                raise
+            if strategy == strategies[-1] and not fallback:
+                raise
+        # restart from scratch using the next strategy
+        if copied:
+            on_progress(-copied)
+        os.lseek(src_fd, 0, os.SEEK_SET)
+        os.lseek(dest_fd, 0, os.SEEK_SET)
+        os.ftruncate(dest_fd, 0)
+    return None
+
+
+def copy_file_data(
+    path: PathIn | PathInfo,
+    dest: PathIn | PathInfo,
+    *,
+    strategy: str = "auto",
+    exclusive: bool = False,
+    progress: CopyProgressCallback | None = None,
+) -> str:
+    """
+    Copy the data of the file at the given path to dest path
+    using the specified strategy and return the strategy used.
+    Supported strategies: "reflink" (copy-on-write clone), "copy_file_range",
+    "sendfile", "native" (shutil.copyfile, using the platform fast paths)
+    or "auto" that tries all of them in this order, falling back to the next
+    one if not supported, and "buffer" (userspace copy, only if requested).
+    If exclusive, dest is created with O_EXCL and a FileExistsError is raised
+    if it already exists (dest is removed if the copy fails).
+    If progress is defined, it is called with the number of bytes copied
+    by each chunk (negative if a partial copy is restarted by the fallback),
+    reflink and native copies don't report chunks.
+    """
+    info = get_path_info(path)
+    dest_info = get_path_info(dest) if not exclusive else None
+    path = info.path
+    dest = _get_path(dest)
+    strategies = _get_copy_strategies(strategy)
+    native = strategies[-1] == "native"
+    if dest_info is not None and info.samefile(dest_info):
+        raise shutil.SameFileError(f"{path!r} and {dest!r} are the same file")
+    with (
+        open(path, "rb") as src_file,
+        open(dest, "xb" if exclusive else "wb") as dest_file,
+    ):
+        try:
+            used_strategy = _copy_file_data_fd(
+                src_file.fileno(),
+                dest_file.fileno(),
+                strategies[:-1] if native else strategies,
+                fallback=native,
+                progress=progress,
+            )
+        except BaseException:
+            if exclusive:
+                os.remove(dest)
+            raise
+    if used_strategy is not None:
+        return used_strategy
+    # dest is closed, the native copy could require exclusive access to it
+    try:
+        shutil.copyfile(path, dest)
+    except BaseException:
+        if exclusive:
+            os.remove(dest)
+        raise
+    return "native"
+
+
+# linux renameat2 flags and special fd for the current working directory
+AT_FDCWD = -100
+RENAME_NOREPLACE = 1 << 0
+RENAME_EXCHANGE = 1 << 1
+RENAME_FLAGS_UNSUPPORTED_ERRNOS = {
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTSUP,
+    errno.EOPNOTSUPP,
+}
+
+
+@functools.cache
+def _get_renameat2() -> Callable[..., int] | None:
+    if not IS_LINUX:
+        return None
+    import ctypes
+
+    try:
+        func = ctypes.CDLL(None, use_errno=True).renameat2
+    except (AttributeError, OSError):
+        return None
+    func.argtypes = [
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_uint,
+    ]
+    func.restype = ctypes.c_int
+    return func
+
+
+def _renameat2(path: str, dest: str, flags: int) -> None:
+    import ctypes
+
+    renameat2 = _get_renameat2()
+    if renameat2 is None:
+        raise OSError(errno.ENOSYS, "renameat2 is not supported", path)
+    if renameat2(AT_FDCWD, os.fsencode(path), AT_FDCWD, os.fsencode(dest), flags):
+        error = ctypes.get_errno()
+        raise OSError(error, os.strerror(error), path, None, dest)
+
+
+def rename_exchange(path: PathIn, dest: PathIn) -> None:
+    """
+    Atomically exchange the existing path and dest (files or directories)
+    using renameat2 with RENAME_EXCHANGE (linux only).
+    If not supported by the platform or the file-system, an OSError is raised
+    with errno in RENAME_FLAGS_UNSUPPORTED_ERRNOS.
+    """
+    path = _get_path(path)
+    dest = _get_path(dest)
+    _renameat2(path, dest, RENAME_EXCHANGE)
+
+
+def _rename_noreplace_fallback(path: str, dest: str) -> None:
+    # windows os.rename never replaces an existing dest
+    if os.name == "nt":
+        os.rename(path, dest)
+        return
+    # publish files with a hard link, that fails if dest exists
+    if os.path.islink(path) or not os.path.isdir(path):
+        try:
+            os.link(path, dest, follow_symlinks=False)
+        except FileExistsError:
+            raise
+        except OSError:
+            pass
+        else:
+            os.unlink(path)
+            return
+    # not race-free fallback for directories or file-systems without hard links
+    if os.path.lexists(dest):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dest)
+    os.rename(path, dest)
+
+
+def rename_noreplace(path: PathIn, dest: PathIn) -> None:
+    """
+    Rename path to dest only if dest doesn't exist, otherwise raise
+    a FileExistsError, letting the kernel enforce it without races:
+    using renameat2 with RENAME_NOREPLACE on linux, os.rename on windows
+    and hard links for files on other platforms.
+    """
+    path = _get_path(path)
+    dest = _get_path(dest)
+    try:
+        _renameat2(path, dest, RENAME_NOREPLACE)
+        return
+    except OSError as error:
+        if error.errno not in RENAME_FLAGS_UNSUPPORTED_ERRNOS:
+            raise
+    _rename_noreplace_fallback(path, dest)
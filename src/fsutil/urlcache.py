@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Any
+
+from fsutil.args import get_path as _get_path
+from fsutil.types import PathIn
+
+URL_CACHE_EXTENSION = ".cache"
+URL_CACHE_MAX_SIZE = 128 * 1024 * 1024
+
+_CacheEntry = tuple[dict[str, Any], bytes]
+
+
+def get_url_cache_entry_path(cache_dir: PathIn, url: str) -> str:
+    """
+    Get the path of the cache entry of the given url in cache_dir.
+    """
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return os.path.join(_get_path(cache_dir), f"{key}{URL_CACHE_EXTENSION}")
+
+
+def _read_url_cache_entry(path: str, url: str) -> _CacheEntry | None:
+    """
+    Read the cache entry at the given path, stored as a json encoded
+    metadata line followed by the response body.
+    """
+    try:
+        with open(path, "rb") as file:
+            meta = json.loads(file.readline())
+            body = file.read()
+    except (OSError, ValueError):
+        return None
+    if not isinstance(meta, dict) or meta.get("url") != url:
+        return None
+    if meta.get("size") != len(body):
+        return None
+    return (meta, body)
+
+
+def _write_url_cache_entry(path: str, meta: dict[str, Any], body: bytes) -> None:
+    from fsutil.io import write_file
+
+    header = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+    write_file(path, header + b"\n" + body, atomic=True)
+
+
+def _touch_url_cache_entry(path: str) -> None:
+    # the entry mtime is its last access time, used for lru eviction
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def evict_url_cache(cache_dir: PathIn, max_size: int) -> int:
+    """
+    Remove the least recently used entries from cache_dir until the total size
+    of the entries is at most max_size bytes and return the removed entries count.
+    """
+    cache_dir = _get_path(cache_dir)
+    entries = []
+    with os.scandir(cache_dir) as entries_iter:
+        for entry in entries_iter:
+            if not entry.name.endswith(URL_CACHE_EXTENSION):
+                continue
+            try:
+                entry_stat = entry.stat(follow_symlinks=False)
+            except FileNotFoundError:
+                continue
+            entries.append((entry_stat.st_mtime_ns, entry_stat.st_size, entry.path))
+    size = sum(entry_size for _, entry_size, _ in entries)
+    removed = 0
+    for _, entry_size, entry_path in sorted(entries):
+        if size <= max_size:
+            break
+        try:
+            os.remove(entry_path)
+            removed += 1
+        except FileNotFoundError:
+            pass
+        size -= entry_size
+    return removed
+
+
+def _get_conditional_headers(meta: dict[str, Any]) -> dict[str, str]:
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def get_url_cached(
+    get: Any,
+    url: str,
+    *,
+    cache_dir: PathIn,
+    cache_max_size: int | None = None,
+    **kwargs: Any,
+) -> _CacheEntry:
+    """
+    Get the metadata and the body of the resource at url
+    using the given get function (requests like),
+    revalidating the response cached in cache_dir with a conditional request
+    (the cached body is used on "304 Not Modified" responses).
+    Responses with an etag or last-modified header are cached atomically,
+    then the least recently used entries are evicted to keep the cache size
+    under cache_max_size (responses bigger than it are not cached).
+    """
+    cache_max_size = cache_max_size or URL_CACHE_MAX_SIZE
+    entry_path = get_url_cache_entry_path(cache_dir, url)
+    entry = _read_url_cache_entry(entry_path, url)
+    headers = dict(kwargs.pop("headers", None) or {})
+    if entry is not None:
+        headers.update(_get_conditional_headers(entry[0]))
+    response = get(url, headers=headers, **kwargs)
+    if entry is not None and response.status_code == 304:
+        _touch_url_cache_entry(entry_path)
+        return entry
+    response.raise_for_status()
+    body = bytes(response.content)
+    meta = {
+        "url": url,
+        "etag": response.headers.get("etag"),
+        "last_modified": response.headers.get("last-modified"),
+        "encoding": response.encoding or response.apparent_encoding,
+        "content_disposition": response.headers.get("content-disposition"),
+        "size": len(body),
+    }
+    if (meta["etag"] or meta["last_modified"]) and len(body) <= cache_max_size:
+        os.makedirs(_get_path(cache_dir), exist_ok=True)
+        _write_url_cache_entry(entry_path, meta, body)
+        evict_url_cache(cache_dir, cache_max_size)
+    return (meta, body)
@@ -0,0 +1,488 @@
+from __future__ import annotations
+
+import functools
+import os
+import posixpath
+import re
+from collections.abc import Generator, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import NamedTuple
+
+from fsutil.args import get_path as _get_path
+from fsutil.converters import convert_size_string_to_bytes
+from fsutil.types import PathIn
+
+PATTERN_MAGIC_CHARS = ("*", "?", "[")
+PATTERN_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+
+class _ExcludePattern(NamedTuple):
+    regex: re.Pattern[str]
+    negated: bool
+    dirs_only: bool
+
+
+class _IncludePattern(NamedTuple):
+    regex: re.Pattern[str] | None
+    dirs_regex: re.Pattern[str] | None
+    walk_regex: re.Pattern[str] | None
+
+
+class PathMatcher(NamedTuple):
+    includes: tuple[re.Pattern[str], ...]
+    includes_dirs: tuple[re.Pattern[str], ...]
+    includes_walk: tuple[re.Pattern[str], ...]
+    excludes: tuple[_ExcludePattern, ...]
+
+    def match(self, relpath: str, *, is_dir: bool) -> bool:
+        """
+        Check if the given relative path matches at least one include pattern.
+        """
+        if any(regex.fullmatch(relpath) for regex in self.includes):
+            return True
+        return is_dir and any(regex.fullmatch(relpath) for regex in self.includes_dirs)
+
+    def match_walk(self, relpath: str) -> bool:
+        """
+        Check if the directory at the given relative path could contain
+        paths matching at least one include pattern.
+        """
+        return any(regex.fullmatch(relpath) for regex in self.includes_walk)
+
+    def exclude(self, relpath: str, *, is_dir: bool) -> bool:
+        """
+        Check if the given relative path is excluded,
+        the last matching exclude pattern wins (gitignore-style).
+        """
+        excluded = False
+        for pattern in self.excludes:
+            if pattern.dirs_only and not is_dir:
+                continue
+            if pattern.regex.fullmatch(relpath):
+                excluded = not pattern.negated
+        return excluded
+
+
+def _translate_pattern_segment(segment: str, *, hidden: bool) -> str:
+    """
+    Translate a single pattern segment to a regex,
+    wildcards never match the path separator.
+    """
+    regex = ""
+    index = 0
+    length = len(segment)
+    while index < length:
+        char = segment[index]
+        index += 1
+        if char == "*":
+            regex += "[^/]*"
+        elif char == "?":
+            regex += "[^/]"
+        elif char == "[":
+            end = segment.find("]", index + 1)
+            if end == -1:
+                regex += re.escape(char)
+                continue
+            chars = segment[index:end].replace("\\", "\\\\")
+            if chars.startswith("!"):
+                chars = "^" + chars[1:]
+            regex += f"[{chars}]"
+            index = end + 1
+        else:
+            regex += re.escape(char)
+    has_magic = any(char in segment for char in PATTERN_MAGIC_CHARS)
+    if hidden and has_magic and not segment.startswith("."):
+        # like glob, wildcards don't match names starting with a dot
+        regex = r"(?!\.)" + regex
+    return regex
+
+
+def _translate_pattern(segments: list[str], *, hidden: bool) -> str:
+    """
+    Translate the given pattern segments to a regex matching relative paths.
+    """
+    name = r"(?!\.)[^/]+" if hidden else r"[^/]+"
+    regex = ""
+    separator = ""
+    last_index = len(segments) - 1
+    for index, segment in enumerate(segments):
+        if segment == "**":
+            if index == last_index:
+                regex += f"(?:/{name})+" if regex else f"{name}(?:/{name})*"
+            else:
+                regex += f"{separator}(?:{name}/)*"
+                separator = ""
+            continue
+        regex += separator + _translate_pattern_segment(segment, hidden=hidden)
+        separator = "/"
+    return regex
+
+
+def _split_pattern(pattern: str) -> list[str]:
+    if os.sep != "/":
+        pattern = pattern.replace(os.sep, "/")
+    # resolve "." and ".." segments, like glob does joining them to the path
+    segments = [
+        segment for segment in posixpath.normpath(pattern).split("/") if segment
+    ]
+    if segments[:1] == ["."]:
+        segments = segments[1:]
+    if segments[:1] == [".."]:
+        raise ValueError(f"Invalid pattern: {pattern!r}, it can't point outside path.")
+    # collapse consecutive recursive wildcards
+    return [
+        segment
+        for index, segment in enumerate(segments)
+        if not (segment == "**" and index > 0 and segments[index - 1] == "**")
+    ]
+
+
+def _compile_pattern(segments: list[str], *, hidden: bool) -> re.Pattern[str]:
+    return re.compile(_translate_pattern(segments, hidden=hidden), PATTERN_FLAGS)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_include_pattern(pattern: str) -> _IncludePattern:
+    segments = _split_pattern(pattern)
+    regex: re.Pattern[str] | None = _compile_pattern(segments, hidden=True)
+    dirs_regex = None
+    recursive = segments[-1:] == ["**"]
+    if recursive and len(segments) > 1:
+        # like glob, the trailing recursive wildcard matches the directory itself
+        dirs_regex = _compile_pattern(segments[:-1], hidden=True)
+    if pattern.endswith(("/", os.sep)):
+        # like glob, a trailing separator matches only directories
+        dirs_regexes = [regex.pattern for regex in (regex, dirs_regex) if regex]
+        regex, dirs_regex = (None, re.compile("|".join(dirs_regexes), PATTERN_FLAGS))
+    # directories that could contain matches are the ones matching
+    # a pattern prefix, the trailing recursive wildcard matches any depth
+    prefixes_count = len(segments) if recursive else len(segments) - 1
+    prefixes_regexes = [
+        _translate_pattern(segments[:count], hidden=True)
+        for count in range(1, prefixes_count + 1)
+    ]
+    walk_regex = None
+    if prefixes_regexes:
+        walk_regex = re.compile("|".join(prefixes_regexes), PATTERN_FLAGS)
+    return _IncludePattern(regex, dirs_regex, walk_regex)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_exclude_pattern(pattern: str) -> _ExcludePattern:
+    negated = pattern.startswith("!")
+    if negated:
+        pattern = pattern[1:]
+    dirs_only = pattern.endswith(("/", os.sep))
+    segments = _split_pattern(pattern)
+    anchored = pattern.startswith(("/", os.sep)) or len(segments) > 1
+    if not anchored:
+        # like gitignore, patterns without separators match at any depth
+        segments = ["**"] + segments
+    regex = _compile_pattern(segments, hidden=False)
+    return _ExcludePattern(regex, negated, dirs_only)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_matcher(
+    includes: tuple[str, ...],
+    excludes: tuple[str, ...],
+) -> PathMatcher:
+    includes_compiled = [_compile_include_pattern(pattern) for pattern in includes]
+    return PathMatcher(
+        includes=tuple(include.regex for include in includes_compiled if include.regex),
+        includes_dirs=tuple(
+            include.dirs_regex for include in includes_compiled if include.dirs_regex
+        ),
+        includes_walk=tuple(
+            include.walk_regex for include in includes_compiled if include.walk_regex
+        ),
+        excludes=tuple(_compile_exclude_pattern(pattern) for pattern in excludes),
+    )
+
+
+def compile_matcher(
+    pattern: str | Iterable[str],
+    *,
+    exclude: str | Iterable[str] | None = None,
+) -> PathMatcher:
+    """
+    Compile the include pattern(s) and the exclude pattern(s) to a path matcher,
+    compiled matchers are cached and reused across calls.
+    Include patterns use glob syntax, exclude patterns use gitignore syntax
+    (patterns without separators match at any depth, a trailing separator
+    matches only directories and a leading "!" negates the pattern).
+    """
+    includes = (pattern,) if isinstance(pattern, str) else tuple(pattern)
+    excludes = (exclude,) if isinstance(exclude, str) else tuple(exclude or ())
+    return _compile_matcher(includes, excludes)
+
+
+class PathFilter(NamedTuple):
+    min_size: int | None
+    max_size: int | None
+    modified_after: float | None
+    modified_before: float | None
+    extensions: frozenset[str] | None
+    symlinks: bool
+
+    def match_name(self, name: str, *, is_symlink: bool) -> bool:
+        """
+        Check if the given name matches the filter (without needing a stat).
+        """
+        if is_symlink and not self.symlinks:
+            return False
+        if self.extensions is not None:
+            _, extension = os.path.splitext(name)
+            if extension[1:].lower() not in self.extensions:
+                return False
+        return True
+
+    def match_stat(self, *, size: int, mtime: float) -> bool:
+        """
+        Check if the given size and last modification time match the filter.
+        """
+        return (
+            (self.min_size is None or size >= self.min_size)
+            and (self.max_size is None or size <= self.max_size)
+            and (self.modified_after is None or mtime > self.modified_after)
+            and (self.modified_before is None or mtime < self.modified_before)
+        )
+
+    def match_entry(self, entry: os.DirEntry[str]) -> bool:
+        """
+        Check if the given entry matches the filter,
+        the entry is stat-ed (and cached) only if needed.
+        """
+        if not self.match_name(entry.name, is_symlink=entry.is_symlink()):
+            return False
+        if not self.stat_required:
+            return True
+        try:
+            stat = entry.stat()
+        except OSError:
+            return False
+        return self.match_stat(size=stat.st_size, mtime=stat.st_mtime)
+
+    @property
+    def stat_required(self) -> bool:
+        return any(
+            value is not None
+            for value in (
+                self.min_size,
+                self.max_size,
+                self.modified_after,
+                self.modified_before,
+            )
+        )
+
+
+def _get_filter_size(size: int | str | None) -> int | None:
+    if size is None or isinstance(size, int):
+        return size
+    return int(convert_size_string_to_bytes(size))
+
+
+def _get_filter_timestamp(date: datetime | None) -> float | None:
+    return date.timestamp() if date is not None else None
+
+
+def compile_filter(
+    *,
+    min_size: int | str | None = None,
+    max_size: int | str | None = None,
+    modified_after: datetime | None = None,
+    modified_before: datetime | None = None,
+    extensions: Iterable[str] | None = None,
+    symlinks: bool = True,
+) -> PathFilter | None:
+    """
+    Compile the given stat predicates to a path filter,
+    None is returned if there is nothing to filter.
+    Sizes can be expressed in bytes or as strings (eg. "1 GB").
+    """
+    path_filter = PathFilter(
+        min_size=_get_filter_size(min_size),
+        max_size=_get_filter_size(max_size),
+        modified_after=_get_filter_timestamp(modified_after),
+        modified_before=_get_filter_timestamp(modified_before),
+        extensions=(
+            frozenset(extension.lstrip(".").lower() for extension in extensions)
+            if extensions is not None
+            else None
+        ),
+        symlinks=symlinks,
+    )
+    if path_filter == PathFilter(None, None, None, None, None, True):
+        return None
+    return path_filter
+
+
+def _is_dir_entry(entry: os.DirEntry[str]) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _get_dir_entry_id(entry: os.DirEntry[str]) -> tuple[int, int] | None:
+    try:
+        stat = entry.stat()
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino)
+
+
+class _WalkOptions(NamedTuple):
+    matcher: PathMatcher | None
+    max_depth: int | None
+    follow_symlinks: bool
+    sort: bool
+    visited_links: set[tuple[int, int]]
+
+
+_WalkDir = tuple[str, str, int]
+_WalkDirResult = tuple[list[os.DirEntry[str]], list[_WalkDir]]
+
+
+def _can_walk_dir_entry(
+    entry: os.DirEntry[str], relpath: str, depth: int, options: _WalkOptions
+) -> bool:
+    if options.max_depth is not None and depth >= options.max_depth:
+        return False
+    if options.matcher and not options.matcher.match_walk(relpath):
+        return False
+    if entry.is_symlink():
+        if not options.follow_symlinks:
+            return False
+        # avoid walking symlinks loops endlessly
+        entry_id = _get_dir_entry_id(entry)
+        if entry_id is None or entry_id in options.visited_links:
+            return False
+        options.visited_links.add(entry_id)
+    return True
+
+
+def _is_matching_entry(
+    entry: os.DirEntry[str], relpath: str, is_dir: bool, matcher: PathMatcher | None
+) -> bool | None:
+    """
+    Return True if the entry matches, False if it doesn't match
+    and None if it is excluded (so it must not be walked too).
+    """
+    if matcher is None:
+        return True
+    if matcher.excludes and matcher.exclude(relpath, is_dir=is_dir):
+        return None
+    return matcher.match(relpath, is_dir=is_dir)
+
+
+def _scan_dir(walk_dir: _WalkDir, options: _WalkOptions) -> _WalkDirResult:
+    """
+    Scan a single directory and return the entries matching the matcher
+    and the sub-directories that need to be walked.
+    """
+    dirpath, dirrelpath, depth = walk_dir
+    matches: list[os.DirEntry[str]] = []
+    walk_dirs: list[_WalkDir] = []
+    try:
+        with os.scandir(dirpath) as entries_iter:
+            entries = list(entries_iter)
+    except OSError:
+        return (matches, walk_dirs)
+    if options.sort:
+        entries.sort(key=lambda entry: entry.name)
+    for entry in entries:
+        relpath = f"{dirrelpath}/{entry.name}" if dirrelpath else entry.name
+        is_dir = _is_dir_entry(entry)
+        matching = _is_matching_entry(entry, relpath, is_dir, options.matcher)
+        if matching is None:
+            continue
+        if matching:
+            matches.append(entry)
+        if is_dir and _can_walk_dir_entry(entry, relpath, depth, options):
+            walk_dirs.append((entry.path, relpath, depth + 1))
+    return (matches, walk_dirs)
+
+
+def _walk_dirs(
+    root: _WalkDir, options: _WalkOptions
+) -> Generator[list[os.DirEntry[str]]]:
+    stack: list[_WalkDir] = [root]
+    while stack:
+        matches, walk_dirs = _scan_dir(stack.pop(), options)
+        yield matches
+        stack.extend(reversed(walk_dirs))
+
+
+def _walk_dirs_parallel(
+    root: _WalkDir, options: _WalkOptions, *, workers: int
+) -> Generator[list[os.DirEntry[str]]]:
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        pending = {executor.submit(_scan_dir, root, options)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                matches, walk_dirs = future.result()
+                yield matches
+                for walk_dir in walk_dirs:
+                    pending.add(executor.submit(_scan_dir, walk_dir, options))
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _walk_dirs_parallel_ordered(
+    root: _WalkDir, options: _WalkOptions, *, workers: int
+) -> Generator[list[os.DirEntry[str]]]:
+    # same depth-first order of the sequential walk,
+    # but sub-directories are scanned ahead by the workers
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        stack: list[Future[_WalkDirResult]] = [
+            executor.submit(_scan_dir, root, options)
+        ]
+        while stack:
+            matches, walk_dirs = stack.pop().result()
+            yield matches
+            futures = [
+                executor.submit(_scan_dir, walk_dir, options) for walk_dir in walk_dirs
+            ]
+            stack.extend(reversed(futures))
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def walk_entries(
+    path: PathIn,
+    matcher: PathMatcher | None = None,
+    *,
+    max_depth: int | None = None,
+    follow_symlinks: bool = True,
+    sort: bool = False,
+    workers: int | None = None,
+) -> Generator[os.DirEntry[str]]:
+    """
+    Walk the directory tree at the given path using os.scandir
+    and yield the entries matching the matcher (all entries if not defined).
+    Excluded directories and directories that cannot contain matches
+    are skipped without descending into them.
+    If max_depth is defined, only entries at most max_depth levels
+    below path are walked.
+    If follow_symlinks, symlinked directories are walked too.
+    If sort, entries are yielded in a deterministic order (directory by
+    directory, depth-first, sorted by name) also when using workers.
+    If workers is defined, directories are scanned in parallel
+    using a pool of workers threads (useful on high-latency storages).
+    """
+    path = _get_path(path)
+    options = _WalkOptions(matcher, max_depth, follow_symlinks, sort, set())
+    root = (path, "", 1)
+    if workers is None or workers <= 1:
+        walk_dirs = _walk_dirs(root, options)
+    elif sort:
+        walk_dirs = _walk_dirs_parallel_ordered(root, options, workers=workers)
+    else:
+        walk_dirs = _walk_dirs_parallel(root, options, workers=workers)
+    for matches in walk_dirs:
+        yield from matches
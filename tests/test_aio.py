@@ -0,0 +1,150 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import fsutil
+from fsutil import aio
+
+
+@pytest.fixture(autouse=True)
+def reset_executor():
+    yield
+    aio.set_executor(None)
+
+
+def test_aio_functions(temp_path):
+    path = temp_path("a/b/c.txt")
+
+    async def main():
+        await aio.write_file(path, "hello world")
+        assert await aio.read_file(path) == "hello world"
+        dest = temp_path("a/b/d.txt")
+        await aio.copy_file(path, dest)
+        assert await aio.get_file_hash(dest) == fsutil.get_file_hash(path)
+        return await aio.search_files(temp_path("a"), "**/*.txt")
+
+    assert asyncio.run(main()) == [temp_path("a/b/c.txt"), temp_path("a/b/d.txt")]
+
+
+def test_aio_functions_raise_errors(temp_path):
+    with pytest.raises(OSError):
+        asyncio.run(aio.read_file(temp_path("missing.txt")))
+
+
+def test_aio_with_invalid_attribute():
+    with pytest.raises(AttributeError):
+        aio.not_a_function  # noqa: B018
+    with pytest.raises(AttributeError):
+        aio.__version__  # noqa: B018
+    assert "read_file" in dir(aio)
+
+
+def test_aio_functions_are_all_wrapped():
+    names = [name for name in fsutil.__all__ if callable(getattr(fsutil, name))]
+    assert [name for name in names if not hasattr(aio, name)] == []
+
+
+def test_aio_open_file_mmap(temp_path):
+    path = temp_path("a.txt")
+    fsutil.write_file(path, "hello world")
+
+    async def main():
+        async with aio.open_file_mmap(path) as data:
+            return data[:5]
+
+    assert asyncio.run(main()) == b"hello"
+
+
+def test_aio_read_file_view(temp_path):
+    path = temp_path("a.txt")
+    fsutil.write_file(path, "hello world")
+
+    async def main():
+        async with aio.read_file_view(path) as view:
+            return bytes(view[6:])
+
+    assert asyncio.run(main()) == b"world"
+
+
+def test_aio_read_file_view_with_error(temp_path):
+    path = temp_path("a.txt")
+    fsutil.write_file(path, "hello world")
+
+    async def main():
+        async with aio.read_file_view(path) as view:
+            view[0]  # noqa: B018
+            raise ValueError("error")
+
+    with pytest.raises(ValueError, match="error"):
+        asyncio.run(main())
+
+
+def test_aio_iter_files(temp_path):
+    for index in range(600):
+        fsutil.create_file(temp_path(f"a/f-{index}.txt"))
+
+    async def main():
+        return [path async for path in aio.iter_files(temp_path("a"))]
+
+    assert sorted(asyncio.run(main())) == fsutil.list_files(temp_path("a"))
+
+
+def test_aio_iter_file_lines(temp_path):
+    path = temp_path("a.txt")
+    fsutil.write_file(path, "".join(f"line {index}\n" for index in range(1000)))
+
+    async def main():
+        return [line async for line in aio.iter_file_lines(path, line_start=-500)]
+
+    lines = asyncio.run(main())
+    assert len(lines) == 500
+    assert lines[0] == "line 500"
+    assert lines[-1] == "line 999"
+
+
+def test_aio_with_max_concurrency():
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def blocking():
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+
+    async def main():
+        await asyncio.gather(*(aio.run(blocking) for _ in range(50)))
+
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        aio.set_executor(executor, max_concurrency=3)
+        asyncio.run(main())
+    assert max_active == 3
+
+
+def test_aio_set_executor(temp_path):
+    path = temp_path("a.txt")
+    fsutil.write_file(path, "hello")
+    threads = set()
+
+    def initializer():
+        threads.add(threading.current_thread().name)
+
+    with ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="aio-test", initializer=initializer
+    ) as executor:
+        aio.set_executor(executor)
+        assert asyncio.run(aio.read_file(path)) == "hello"
+    assert len(threads) == 1
+    assert threads.pop().startswith("aio-test")
+
+
+def test_aio_set_executor_with_invalid_max_concurrency():
+    with pytest.raises(ValueError):
+        aio.set_executor(max_concurrency=0)
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 import fsutil
@@ -131,3 +133,23 @@ def test_extract_tar_file_with_autodelete(temp_path):
 
 if __name__ == "__main__":
     pytest.main()
+
+
+@pytest.mark.parametrize("archive", ["tar", "zip"])
+def test_archives_with_progress(temp_path, archive):
+    archive_path = temp_path(f"archive.{archive}")
+    for index in range(5):
+        fsutil.create_file(temp_path(f"a/b{index % 2}/f{index}.txt"), content="hello")
+    create_archive = getattr(fsutil, f"create_{archive}_file")
+    extract_archive = getattr(fsutil, f"extract_{archive}_file")
+    calls = []
+    with patch("fsutil.progress.PROGRESS_INTERVAL", 0):
+        create_archive(archive_path, [temp_path("a")], progress=calls.append)
+    assert [p.files_done for p in calls] == [1, 2, 3, 4, 5]
+    assert calls[-1][:4] == (25, 25, 5, 5)
+    calls = []
+    with patch("fsutil.progress.PROGRESS_INTERVAL", 0):
+        extract_archive(archive_path, temp_path("x"), progress=calls.append)
+    assert [p.files_done for p in calls] == [1, 2, 3, 4, 5]
+    assert calls[-1][:4] == (25, 25, 5, 5)
+    assert len(fsutil.search_files(temp_path("x"), "**/*.txt")) == 5
@@ -0,0 +1,258 @@
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+import fsutil
+from fsutil import downloads
+from fsutil.downloads import _get_missing_ranges, get_download_size
+
+DATA = bytes(range(256)) * 4096
+
+
+class RangeRequestHandler(BaseHTTPRequestHandler):
+    data = DATA
+    ranges = True
+    etag = '"v1"'
+    requests: list[str | None] = []
+    # number of 503 responses to send before succeeding, by path
+    failures: dict[str, int] = {}
+    delay = 0.0
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        cls = type(self)
+        cls.requests.append(self.headers.get("Range"))
+        with cls.lock:
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        try:
+            time.sleep(self.delay)
+            self._do_GET()
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def _do_GET(self):
+        with self.lock:
+            failures = self.failures.get(self.path, 0)
+            self.failures[self.path] = failures - 1
+        if self.path == "/missing" or failures > 0:
+            self.send_response(404 if self.path == "/missing" else 503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        byte_range = self.headers.get("Range")
+        match = re.match(r"bytes=(\d+)-(\d+)", byte_range or "")
+        if not self.ranges or not match:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(self.data)))
+            if self.ranges:
+                self.send_header("Accept-Ranges", "bytes")
+                self.send_header("ETag", self.etag)
+            self.end_headers()
+            self.wfile.write(self.data)
+            return
+        start, end = int(match.group(1)), int(match.group(2))
+        body = self.data[start : end + 1]
+        self.send_response(206)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(self.data)}")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", self.etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _read_bytes(path):
+    with open(path, "rb") as file:
+        return file.read()
+
+
+@pytest.fixture
+def server():
+    handler = type(
+        "Handler",
+        (RangeRequestHandler,),
+        {"requests": [], "failures": {}, "lock": threading.Lock()},
+    )
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield handler, f"http://127.0.0.1:{httpd.server_port}/data.bin"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_get_download_size():
+    assert get_download_size({"accept-ranges": "bytes", "content-length": "10"}) == 10
+    assert get_download_size({"content-length": "10"}) is None
+    assert get_download_size({"accept-ranges": "bytes"}) is None
+    assert (
+        get_download_size(
+            {
+                "accept-ranges": "bytes",
+                "content-length": "10",
+                "content-encoding": "gzip",
+            }
+        )
+        is None
+    )
+
+
+def test_get_missing_ranges():
+    assert _get_missing_ranges(10, [], 4) == [(0, 4), (4, 8), (8, 10)]
+    assert _get_missing_ranges(10, [(0, 3), (2, 5)], 4) == [(5, 9), (9, 10)]
+    assert _get_missing_ranges(10, [(3, 5), (8, 10)], 4) == [(0, 3), (5, 8)]
+    assert _get_missing_ranges(10, [(0, 10)], 4) == []
+
+
+def test_download_file_with_workers(server, temp_path):
+    handler, url = server
+    with patch("fsutil.downloads.DOWNLOAD_SEGMENT_SIZE", 100_000):
+        path = fsutil.download_file(url, dirpath=temp_path(), workers=4)
+    assert path == temp_path("data.bin")
+    assert _read_bytes(path) == DATA
+    ranges = [byte_range for byte_range in handler.requests if byte_range]
+    assert len(ranges) == 11
+    assert not os.path.exists(path + ".part")
+    assert not os.path.exists(path + ".part.json")
+
+
+def test_download_file_with_progress(server, temp_path):
+    handler, url = server
+    calls = []
+    with patch("fsutil.progress.PROGRESS_INTERVAL", 0):
+        fsutil.download_file(
+            url, dirpath=temp_path(), chunk_size=65536, progress=calls.append
+        )
+    assert calls[-1][:4] == (len(DATA), len(DATA), 1, 1)
+    assert len(calls) > 2
+
+
+def test_download_file_with_workers_and_progress(server, temp_path):
+    handler, url = server
+    calls = []
+    with (
+        patch("fsutil.downloads.DOWNLOAD_SEGMENT_SIZE", 100_000),
+        patch("fsutil.progress.PROGRESS_INTERVAL", 0),
+    ):
+        fsutil.download_file(url, dirpath=temp_path(), workers=4, progress=calls.append)
+    assert calls[0][:4] == (0, len(DATA), 0, 1)
+    assert calls[-1][:4] == (len(DATA), len(DATA), 1, 1)
+    assert [p.bytes_done for p in calls] == sorted(p.bytes_done for p in calls)
+
+
+def test_download_file_with_resume(server, temp_path):
+    handler, url = server
+    download_range = downloads._download_range
+    calls = []
+
+    def _download_range_failing(*args, **kwargs):
+        calls.append(args)
+        if len(calls) == 3:
+            raise OSError("Connection reset")
+        download_range(*args, **kwargs)
+
+    with (
+        patch("fsutil.downloads.DOWNLOAD_SEGMENT_SIZE", 100_000),
+        patch("fsutil.downloads._download_range", _download_range_failing),
+    ):
+        with pytest.raises(OSError, match="Connection reset"):
+            fsutil.download_file(url, dirpath=temp_path(), resume=True)
+    path = temp_path("data.bin")
+    assert not os.path.exists(path)
+    assert os.path.getsize(path + ".part") == len(DATA)
+    state = fsutil.read_file_json(path + ".part.json")
+    assert state["ranges"] == [[0, 200_000], [300_000, len(DATA)]]
+
+    handler.requests.clear()
+    with patch("fsutil.downloads.DOWNLOAD_SEGMENT_SIZE", 100_000):
+        path = fsutil.download_file(url, dirpath=temp_path(), resume=True)
+    assert _read_bytes(path) == DATA
+    ranges = [byte_range for byte_range in handler.requests if byte_range]
+    assert ranges == ["bytes=200000-299999"]
+    assert not os.path.exists(path + ".part")
+    assert not os.path.exists(path + ".part.json")
+
+
+def test_download_file_with_resume_and_changed_resource(server, temp_path):
+    handler, url = server
+    path = temp_path("data.bin")
+    fsutil.write_file(path + ".part", "x" * len(DATA))
+    fsutil.write_file_json(
+        path + ".part.json",
+        {
+            "validators": {
+                "url": url,
+                "size": len(DATA),
+                "etag": '"v0"',
+                "last_modified": None,
+            },
+            "ranges": [[0, len(DATA)]],
+        },
+    )
+    path = fsutil.download_file(url, dirpath=temp_path(), resume=True)
+    assert _read_bytes(path) == DATA
+
+
+def test_download_file_with_workers_without_range_support(server, temp_path):
+    handler, url = server
+    handler.ranges = False
+    path = fsutil.download_file(url, dirpath=temp_path(), workers=4, resume=True)
+    assert _read_bytes(path) == DATA
+    assert handler.requests == [None]
+    assert not os.path.exists(path + ".part")
+
+
+def test_download_files(server, temp_path):
+    handler, url = server
+    handler.failures["/flaky.bin"] = 2
+    urls = [
+        url.replace("data.bin", "a.bin"),
+        url.replace("data.bin", "missing"),
+        url.replace("data.bin", "flaky.bin"),
+        url.replace("data.bin", "b.bin"),
+    ]
+    report = fsutil.download_files(urls, dirpath=temp_path(), workers=4, backoff=0)
+    assert report["files"] == [
+        (urls[0], temp_path("a.bin")),
+        (urls[2], temp_path("flaky.bin")),
+        (urls[3], temp_path("b.bin")),
+    ]
+    assert [url for url, error in report["errors"]] == [urls[1]]
+    assert "404" in report["errors"][0][1]
+    assert _read_bytes(temp_path("flaky.bin")) == DATA
+    assert handler.requests.count(None) == 1 + 1 + 3 + 1
+
+
+def test_download_files_with_retries_exhausted(server, temp_path):
+    handler, url = server
+    handler.failures["/flaky.bin"] = 10
+    urls = [url.replace("data.bin", "flaky.bin")]
+    report = fsutil.download_files(urls, dirpath=temp_path(), retries=2, backoff=0)
+    assert report["files"] == []
+    assert [url for url, error in report["errors"]] == urls
+    assert "503" in report["errors"][0][1]
+    assert len(handler.requests) == 3
+
+
+def test_download_files_with_max_per_host(server, temp_path):
+    handler, url = server
+    handler.delay = 0.05
+    urls = [url.replace("data.bin", f"{index}.bin") for index in range(8)]
+    report = fsutil.download_files(urls, dirpath=temp_path(), workers=8, max_per_host=2)
+    assert len(report["files"]) == 8
+    assert report["errors"] == []
+    assert handler.max_active == 2
@@ -0,0 +1,128 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+import fsutil
+from fsutil.index import get_dir_index_size, search_dir_index
+
+
+def test_update_dir_index(temp_path):
+    fsutil.create_file(temp_path("a/b/c/IMG_1000.jpg"), content="hello")
+    fsutil.create_file(temp_path("a/b/c/IMG_1001.png"), content="hello world")
+    fsutil.create_file(temp_path("a/x/c/IMG_1002.png"))
+    index_path = temp_path("index/a.sqlite")
+    fsutil.update_dir_index(temp_path("a"), index_path)
+    assert fsutil.is_file(index_path)
+    results = fsutil.search_files(temp_path("a"), "**/*.png", index=index_path)
+    assert results == fsutil.search_files(temp_path("a"), "**/*.png")
+    results = fsutil.search_dirs(temp_path("a"), "**/c", index=index_path)
+    assert results == fsutil.search_dirs(temp_path("a"), "**/c")
+    size = fsutil.get_dir_size(temp_path("a"), index=index_path)
+    assert size == fsutil.get_dir_size(temp_path("a")) == 16
+
+
+def test_update_dir_index_incremental(temp_path):
+    fsutil.create_file(temp_path("a/b/c/f-1.txt"), content="hello")
+    fsutil.create_file(temp_path("a/x/f-2.txt"), content="hello")
+    index_path = temp_path("a.sqlite")
+    fsutil.update_dir_index(temp_path("a"), index_path)
+    fsutil.create_file(temp_path("a/b/c/f-3.txt"), content="hello world")
+    fsutil.remove_dir(temp_path("a/x"))
+    with patch("os.scandir", wraps=os.scandir) as scandir_mock:
+        fsutil.update_dir_index(temp_path("a"), index_path)
+    # only changed directories are scanned again
+    scanned_paths = [call.args[0] for call in scandir_mock.call_args_list]
+    assert sorted(scanned_paths) == [temp_path("a"), temp_path("a/b/c")]
+    results = fsutil.search_files(temp_path("a"), index=index_path)
+    assert results == [temp_path("a/b/c/f-1.txt"), temp_path("a/b/c/f-3.txt")]
+    assert fsutil.get_dir_size(temp_path("a"), index=index_path) == 16
+
+
+def test_update_dir_index_with_other_root(temp_path):
+    fsutil.create_file(temp_path("a/f-1.txt"))
+    fsutil.create_file(temp_path("b/f-2.txt"))
+    index_path = temp_path("index.sqlite")
+    fsutil.update_dir_index(temp_path("a"), index_path)
+    fsutil.update_dir_index(temp_path("b"), index_path)
+    results = fsutil.search_files(temp_path("b"), index=index_path)
+    assert results == [temp_path("b/f-2.txt")]
+
+
+def test_search_dir_index_in_sub_directory(temp_path):
+    fsutil.create_file(temp_path("a/b/c/f-1.txt"), content="hello")
+    fsutil.create_file(temp_path("a/b/f-2.txt"), content="hello")
+    fsutil.create_file(temp_path("a/f-3.txt"), content="hello")
+    index_path = temp_path("index.sqlite")
+    fsutil.update_dir_index(temp_path("a"), index_path)
+    results = list(search_dir_index(index_path, temp_path("a/b"), "*.txt"))
+    assert results == [temp_path("a/b/f-2.txt")]
+    assert get_dir_index_size(index_path, temp_path("a/b")) == 10
+    with pytest.raises(ValueError):
+        list(search_dir_index(index_path, temp_path("x"), "*.txt"))
+
+
+def test_search_dir_index_with_exclude_and_max_depth(temp_path):
+    fsutil.create_file(temp_path("a/src/index.js"))
+    fsutil.create_file(temp_path("a/src/lib/utils.js"))
+    fsutil.create_file(temp_path("a/node_modules/x/index.js"))
+    index_path = temp_path("index.sqlite")
+    fsutil.update_dir_index(temp_path("a"), index_path)
+    options = {"exclude": "node_modules", "max_depth": 2}
+    results = fsutil.search_files(
+        temp_path("a"), "**/*.js", index=index_path, **options
+    )
+    assert results == fsutil.search_files(temp_path("a"), "**/*.js", **options)
+    assert results == [temp_path("a/src/index.js")]
+
+
+def test_search_dir_index_with_filters(temp_path):
+    fsutil.create_file(temp_path("a/f-1.txt"), content="a" * 10)
+    fsutil.create_file(temp_path("a/b/f-2.txt"), content="a" * 100)
+    fsutil.create_file(temp_path("a/b/f-3.log"), content="a" * 100)
+    index_path = temp_path("index.sqlite")
+    fsutil.update_dir_index(temp_path("a"), index_path)
+    options = {"min_size": 50, "extensions": ["txt"]}
+    results = fsutil.search_files(temp_path("a"), index=index_path, **options)
+    assert results == fsutil.search_files(temp_path("a"), **options)
+    assert results == [temp_path("a/b/f-2.txt")]
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Test skipped on Windows")
+def test_search_dir_index_with_symlinks(temp_path):
+    fsutil.create_file(temp_path("a/f.txt"), content="hello")
+    fsutil.create_file(temp_path("t/a/f.txt"), content="hello")
+    os.symlink(temp_path("a/f.txt"), temp_path("t/link.txt"))
+    os.symlink(temp_path("a"), temp_path("t/ldir"))
+    os.symlink(temp_path("missing.txt"), temp_path("t/dangling.txt"))
+    index_path = temp_path("index.sqlite")
+    fsutil.update_dir_index(temp_path("t"), index_path)
+    for options in [
+        {"follow_symlinks": False},
+        {"follow_symlinks": False, "symlinks": False},
+        {"follow_symlinks": False, "min_size": 5},
+        {"exclude": "ldir"},
+        {"max_depth": 1},
+    ]:
+        results = fsutil.search_files(temp_path("t"), index=index_path, **options)
+        assert results == fsutil.search_files(temp_path("t"), **options)
+        results = fsutil.search_dirs(temp_path("t"), index=index_path, **options)
+        assert results == fsutil.search_dirs(temp_path("t"), **options)
+    results = fsutil.search_files(
+        temp_path("t"), index=index_path, follow_symlinks=False
+    )
+    assert results == [temp_path("t/a/f.txt"), temp_path("t/link.txt")]
+    with pytest.raises(ValueError, match="ldir"):
+        fsutil.search_files(temp_path("t"), index=index_path)
+    assert fsutil.get_dir_size(temp_path("t"), index=index_path) == 5
+
+
+def test_search_dir_index_without_index(temp_path):
+    fsutil.create_file(temp_path("a/f-1.txt"))
+    with pytest.raises(OSError):
+        fsutil.search_files(temp_path("a"), index=temp_path("index.sqlite"))
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -2,10 +2,12 @@ import io
 import re
 import time
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 
 import fsutil
+from fsutil.pathinfo import get_stat_count, reset_stat_count
 
 
 def create_file_of_size(path, size):
@@ -53,6 +55,32 @@ def test_get_dir_hash(temp_path):
     fsutil.create_file(f6_path, content="hello world 6")
     dir_hash = fsutil.get_dir_hash(temp_path("x/"))
     assert dir_hash == "eabe619c41f0c4611b7b9746bededfcb"
+    dir_hash = fsutil.get_dir_hash(temp_path("x/"), workers=4)
+    assert dir_hash == "eabe619c41f0c4611b7b9746bededfcb"
+
+
+@pytest.mark.parametrize("workers", [None, 1])
+def test_get_dir_hash_without_workers_hashes_inline(temp_path, workers):
+    fsutil.create_file(temp_path("x/a/f1.txt"), content="hello world 1")
+    fsutil.create_file(temp_path("x/a/f2.txt"), content="hello world 2")
+    expected_dir_hash = fsutil.get_dir_hash(temp_path("x/"), workers=2)
+    with patch("fsutil.info.ThreadPoolExecutor") as executor_mock:
+        dir_hash = fsutil.get_dir_hash(temp_path("x/"), workers=workers)
+    executor_mock.assert_not_called()
+    assert dir_hash == expected_dir_hash
+
+
+def test_get_dir_hash_with_progress(temp_path):
+    for index in range(6):
+        fsutil.create_file(
+            temp_path(f"x/a/f{index}.txt"), content=f"hello world {index}"
+        )
+    calls = []
+    with patch("fsutil.progress.PROGRESS_INTERVAL", 0):
+        dir_hash = fsutil.get_dir_hash(temp_path("x/"), progress=calls.append)
+    assert dir_hash == fsutil.get_dir_hash(temp_path("x/"))
+    assert [p.files_done for p in calls] == [1, 2, 3, 4, 5, 6]
+    assert calls[-1][:4] == (78, 78, 6, 6)
 
 
 def test_get_dir_last_modified_date(temp_path):
@@ -65,6 +93,9 @@ def test_get_dir_last_modified_date(temp_path):
     lastmod_date = fsutil.get_dir_last_modified_date(temp_path("a"))
     assert (now - lastmod_date) < timedelta(seconds=0.1)
     assert (lastmod_date - creation_date) > timedelta(seconds=0.15)
+    assert fsutil.get_dir_last_modified_date(temp_path("a"), workers=4) == (
+        lastmod_date
+    )
 
 
 def test_get_dir_last_modified_date_formatted(temp_path):
@@ -87,6 +118,7 @@ def test_get_dir_size(temp_path):
     assert fsutil.get_dir_size(temp_path("a")) == 10206412
     assert fsutil.get_dir_size(temp_path("a/b")) == 9105408
     assert fsutil.get_dir_size(temp_path("a/b/c")) == 4648960
+    assert fsutil.get_dir_size(temp_path("a"), workers=4) == 10206412
 
 
 def test_get_dir_size_formatted(temp_path):
@@ -128,12 +160,56 @@ def test_get_file_hash(temp_path):
     assert file_hash == "b10a8db164e0754105b7a99be72e3fe5"
 
 
+def test_get_file_hash_stat_budget(temp_path):
+    path = temp_path("a/b/c.txt")
+    fsutil.create_file(path, content="Hello World")
+    reset_stat_count()
+    fsutil.get_file_hash(path)
+    assert get_stat_count() == 1
+
+
 def test_get_file_hash_with_file_like_object():
     file = io.BytesIO(b"Hello World")
     file_hash = fsutil.get_file_hash(file)
     assert file_hash == "b10a8db164e0754105b7a99be72e3fe5"
 
 
+def test_get_file_hash_with_buffer():
+    assert fsutil.get_file_hash(b"Hello World") == "b10a8db164e0754105b7a99be72e3fe5"
+    buffer = memoryview(bytearray(b"Hello World"))
+    assert fsutil.get_file_hash(buffer) == "b10a8db164e0754105b7a99be72e3fe5"
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_get_file_hash_with_empty_file(temp_path, use_mmap):
+    path = temp_path("a/b/c.txt")
+    fsutil.create_file(path)
+    file_hash = fsutil.get_file_hash(path, use_mmap=use_mmap)
+    assert file_hash == "d41d8cd98f00b204e9800998ecf8427e"
+
+
+def test_get_file_hash_with_use_mmap(temp_path):
+    path = temp_path("a/b/c.txt")
+    fsutil.create_file(path, content="Hello World")
+    with patch("fsutil.io.open_file_mmap", wraps=fsutil.open_file_mmap) as mmap_mock:
+        assert fsutil.get_file_hash(path) == "b10a8db164e0754105b7a99be72e3fe5"
+        mmap_mock.assert_not_called()
+        file_hash = fsutil.get_file_hash(path, use_mmap=True)
+        assert file_hash == "b10a8db164e0754105b7a99be72e3fe5"
+        mmap_mock.assert_called_once()
+
+
+@pytest.mark.skipif(
+    not fsutil.is_file("/proc/self/status"), reason="requires /proc pseudo-files"
+)
+def test_get_file_hash_with_zero_size_pseudo_file():
+    # /proc files report a zero size but have content
+    path = "/proc/self/cmdline"
+    assert fsutil.get_file_hash(path) != "d41d8cd98f00b204e9800998ecf8427e"
+    with pytest.raises(ValueError):
+        fsutil.get_file_hash(path, use_mmap=True)
+
+
 def test_get_file_hash_with_file_like_object_restores_position():
     file = io.BytesIO(b"Hello World")
     file.seek(6)
@@ -1,18 +1,81 @@
+import os
 import sys
+import threading
 from datetime import datetime
 from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
 
 import fsutil
 
 
+def test_iter_file_lines(temp_path):
+    path = temp_path("a/b/c.txt")
+    fsutil.write_file(path, "".join(f" line {index} \n\n" for index in range(1000)))
+    with patch("fsutil.io.read_file") as read_file_mock:
+        lines = fsutil.iter_file_lines(path)
+        assert not isinstance(lines, list)
+        assert next(lines) == "line 0"
+        assert len(list(lines)) == 999
+    read_file_mock.assert_not_called()
+    lines = fsutil.iter_file_lines(path, line_start=-4, strip_white=False)
+    assert list(lines) == [" line 998 \n", "\n", " line 999 \n", "\n"]
+
+
+def test_iter_file_lines_with_missing_file(temp_path):
+    # the path is validated when called, not when iterated
+    with pytest.raises(OSError):
+        fsutil.iter_file_lines(temp_path("missing.txt"))
+
+
+@pytest.mark.parametrize("strip_white", [True, False])
+@pytest.mark.parametrize("skip_empty", [True, False])
+def test_iter_file_lines_matches_splitlines(temp_path, strip_white, skip_empty):
+    path = temp_path("a/b/c.txt")
+    content = " a \r\n\r\nb\rc\x0cd\u2028e\n\n  \nf"
+    fsutil.write_file(path, content)
+    expected_lines = fsutil.read_file(path).splitlines()
+    if strip_white:
+        expected_lines = [line.strip() for line in expected_lines]
+    if skip_empty:
+        expected_lines = [line for line in expected_lines if line]
+    lines = fsutil.iter_file_lines(path, strip_white=strip_white, skip_empty=skip_empty)
+    assert list(lines) == expected_lines
+
+
+def test_open_file_mmap(temp_path):
+    path = temp_path("a/b/c.txt")
+    fsutil.write_file(path, content="Hello World")
+    with fsutil.open_file_mmap(path) as file_mmap:
+        assert file_mmap[:5] == b"Hello"
+        assert file_mmap.find(b"World") == 6
+        with pytest.raises(TypeError):
+            file_mmap[0] = 0
+    assert file_mmap.closed
+    fsutil.create_file(temp_path("empty.txt"))
+    with pytest.raises(ValueError):
+        with fsutil.open_file_mmap(temp_path("empty.txt")):
+            pass
+    with pytest.raises(OSError):
+        with fsutil.open_file_mmap(temp_path("missing.txt")):
+            pass
+
+
 def test_read_file(temp_path):
     path = temp_path("a/b/c.txt")
     fsutil.write_file(path, content="Hello World")
     assert fsutil.read_file(path) == "Hello World"
 
 
+def test_read_file_bytes(temp_path):
+    path = temp_path("a/b/c.bin")
+    fsutil.write_file(path, content=b"\x00Hello\r\nWorld\xff")
+    assert fsutil.read_file_bytes(path) == b"\x00Hello\r\nWorld\xff"
+    with pytest.raises(OSError):
+        fsutil.read_file_bytes(temp_path("missing.bin"))
+
+
 def test_read_file_from_url():
     url = "https://raw.githubusercontent.com/fabiocaccamo/python-fsutil/main/README.md"
     content = fsutil.read_file_from_url(url)
@@ -96,6 +159,67 @@ def test_read_file_lines_with_lines_range(temp_path):
     assert lines == expected_lines
 
 
+@pytest.mark.parametrize("block_size", [1, 3, 65536])
+def test_read_file_lines_with_negative_lines_range(temp_path, block_size):
+    path = temp_path("a/b/c.txt")
+    fsutil.write_file(path, content="\n".join(str(index) for index in range(100)))
+    with (
+        patch("fsutil.io.READ_FILE_TAIL_BLOCK_SIZE", block_size),
+        patch("fsutil.io.read_file_lines_count") as read_file_lines_count_mock,
+    ):
+        assert fsutil.read_file_lines(path, line_start=-3) == ["97", "98", "99"]
+        assert fsutil.read_file_lines(path, line_start=-3, line_end=-2) == [
+            "97",
+            "98",
+        ]
+        assert fsutil.read_file_lines(path, line_start=-3, line_end=-5) == []
+        assert len(fsutil.read_file_lines(path, line_start=-200)) == 100
+        assert fsutil.read_file_lines(path, line_start=95, line_end=-3) == [
+            "95",
+            "96",
+            "97",
+        ]
+    read_file_lines_count_mock.assert_not_called()
+    assert fsutil.read_file_lines(path, line_start=-3, line_end=98) == ["97", "98"]
+
+
+@pytest.mark.skipif(
+    not fsutil.is_file("/proc/self/status"), reason="requires /proc pseudo-files"
+)
+def test_read_file_lines_with_negative_lines_range_and_zero_size_pseudo_file():
+    path = "/proc/self/status"
+    lines = fsutil.read_file_lines(path, strip_white=False, skip_empty=False)
+    assert fsutil.read_file_lines(path, line_start=-2) == [
+        line.strip() for line in lines[-2:]
+    ]
+    assert fsutil.read_file_tail(path, 1) == [lines[-1].strip()]
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires os.mkfifo")
+def test_read_file_tail_lines_with_not_seekable_file(temp_path):
+    path = temp_path("fifo")
+    os.mkfifo(path)
+
+    def write_fifo():
+        with open(path, "wb") as file:
+            file.write(b"".join(b"line %d\n" % index for index in range(100)))
+
+    thread = threading.Thread(target=write_fifo)
+    thread.start()
+    lines = fsutil.io._read_file_tail_lines(path, 2)
+    thread.join()
+    assert lines == [b"line 98\n", b"line 99\n"]
+
+
+def test_read_file_lines_with_lines_range_stops_early(temp_path):
+    path = temp_path("a/b/c.txt")
+    fsutil.write_file(path, content="0\n1\n2\n")
+    with open(path, "ab") as file:
+        # invalid utf-8 after line_end is never read
+        file.write(b"\xff\xfe\n" * 10)
+    assert fsutil.read_file_lines(path, line_start=1, line_end=2) == ["1", "2"]
+
+
 def test_read_file_lines_count(temp_path):
     path = temp_path("a/b/c.txt")
     lines = ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9"]
@@ -105,6 +229,110 @@ def test_read_file_lines_count(temp_path):
     assert lines_count == 10
 
 
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "\n",
+        "a",
+        "a\n",
+        "\n\n\n",
+        "a\r\nb\r\n",
+        "a\rb\rc",
+        "".join(f"line {index}\n" for index in range(10000)),
+        "".join(f"line {index}\n" for index in range(10000)) + "last",
+    ],
+)
+def test_read_file_lines_count_matches_lines_iteration(temp_path, content):
+    path = temp_path("a/b/c.txt")
+    fsutil.write_file(path, content)
+    with open(path, "rb") as file:
+        expected_lines_count = sum(1 for line in file)
+    for workers in [None, 1, 3, 8]:
+        assert fsutil.read_file_lines_count(path, workers=workers) == (
+            expected_lines_count
+        )
+
+
+def test_read_file_lines_count_with_chunks_and_workers(temp_path):
+    # benchmark-like synthetic file, lines crossing chunks and ranges boundaries
+    path = temp_path("a/b/c.txt")
+    fsutil.write_file(path, "".join(f"{'x' * (index % 97)}\n" for index in range(5000)))
+    with (
+        patch("fsutil.io.READ_FILE_LINES_COUNT_CHUNK_SIZE", 100),
+        patch("fsutil.io.READ_FILE_LINES_COUNT_PARALLEL_SIZE", 1000),
+        patch("os.cpu_count", return_value=4),
+        patch(
+            "fsutil.io._count_file_newlines_parallel",
+            wraps=fsutil.io._count_file_newlines_parallel,
+        ) as count_file_newlines_parallel_mock,
+    ):
+        assert fsutil.read_file_lines_count(path) == 5000
+        count_file_newlines_parallel_mock.assert_called_once()
+        assert fsutil.read_file_lines_count(path, workers=1) == 5000
+        count_file_newlines_parallel_mock.assert_called_once()
+        assert fsutil.read_file_lines_count(path, workers=7) == 5000
+    with pytest.raises(ValueError):
+        fsutil.read_file_lines_count(path, workers=0)
+
+
+def test_read_file_lines_count_reads_until_end_of_file(temp_path):
+    path = temp_path("a/b/c.txt")
+    fsutil.write_file(path, "".join(f"line {index}\n" for index in range(1000)))
+    # sizes of growing files or pseudo-files (eg. /proc) are outdated or zero
+    for size in [0, 10]:
+        with patch("os.path.getsize", return_value=size):
+            assert fsutil.read_file_lines_count(path) == 1000
+    with (
+        patch("fsutil.io.READ_FILE_LINES_COUNT_CHUNK_SIZE", 64),
+        patch("os.path.getsize", return_value=3000),
+    ):
+        assert fsutil.read_file_lines_count(path, workers=4) == 1000
+
+
+@pytest.mark.skipif(
+    not fsutil.is_file("/proc/self/status"), reason="requires /proc pseudo-files"
+)
+def test_read_file_lines_count_with_zero_size_pseudo_file():
+    with open("/proc/self/status", "rb") as file:
+        expected_lines_count = sum(1 for line in file)
+    assert expected_lines_count > 0
+    assert fsutil.read_file_lines_count("/proc/self/status") == expected_lines_count
+
+
+def test_read_file_tail(temp_path):
+    path = temp_path("a/b/c.txt")
+    fsutil.write_file(path, content="".join(f"line {index}\n" for index in range(1000)))
+    assert fsutil.read_file_tail(path, 2) == ["line 998", "line 999"]
+    assert len(fsutil.read_file_tail(path)) == 10
+    assert len(fsutil.read_file_tail(path, 5000)) == 1000
+    assert fsutil.read_file_tail(path, 0) == []
+    fsutil.write_file(path, content="a\n\nb\r\n\n")
+    assert fsutil.read_file_tail(path, 3, strip_white=False, skip_empty=False) == [
+        "\n",
+        "b\r\n",
+        "\n",
+    ]
+    assert fsutil.read_file_tail(path, 3) == ["b"]
+    fsutil.write_file(path, content="")
+    assert fsutil.read_file_tail(path) == []
+
+
+def test_read_file_view(temp_path):
+    path = temp_path("a/b/c.txt")
+    fsutil.write_file(path, content="Hello World")
+    with fsutil.read_file_view(path) as view:
+        assert isinstance(view, memoryview)
+        assert view.readonly
+        assert view[6:].tobytes() == b"World"
+        assert fsutil.get_file_hash(view) == "b10a8db164e0754105b7a99be72e3fe5"
+    with pytest.raises(ValueError):
+        view.tobytes()
+    fsutil.create_file(temp_path("empty.txt"))
+    with fsutil.read_file_view(temp_path("empty.txt")) as view:
+        assert view.tobytes() == b""
+
+
 def test_write_file(temp_path):
     path = temp_path("a/b/c.txt")
     fsutil.write_file(path, content="Hello World")
@@ -138,6 +366,26 @@ def test_write_file_atomic_permissions_inheritance(temp_path):
     assert fsutil.get_permissions(path) == 777
 
 
+@pytest.mark.parametrize("atomic", [False, True])
+def test_write_file_exclusive(temp_path, atomic):
+    path = temp_path("a/b/c.txt")
+    fsutil.write_file(path, content="Hello World", atomic=atomic, exclusive=True)
+    assert fsutil.read_file(path) == "Hello World"
+    with pytest.raises(FileExistsError):
+        fsutil.write_file(path, content="Hello Jupiter", atomic=atomic, exclusive=True)
+    assert fsutil.read_file(path) == "Hello World"
+    assert fsutil.list_files(temp_path("a/b/")) == [path]
+
+
+@pytest.mark.parametrize("atomic", [False, True])
+def test_write_file_bytes(temp_path, atomic):
+    path = temp_path("a/b/c.bin")
+    fsutil.write_file(path, content=b"\x00\xffHello", atomic=atomic)
+    fsutil.write_file(path, content=b"\r\n", append=True, atomic=atomic)
+    with open(path, "rb") as file:
+        assert file.read() == b"\x00\xffHello\r\n"
+
+
 def test_write_file_with_filename_only():
     path = "document.txt"
     fsutil.write_file(path, content="Hello World")
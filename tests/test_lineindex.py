@@ -0,0 +1,97 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+import fsutil
+from fsutil.lineindex import (
+    get_file_lines_index_path,
+    load_file_lines_index,
+    update_file_lines_index,
+)
+
+
+@pytest.fixture
+def lines_file(temp_path):
+    path = temp_path("a/b/c.jsonl")
+    fsutil.write_file(path, "".join(f'{{"line": {index}}}\n' for index in range(5000)))
+    return path
+
+
+def test_update_file_lines_index(lines_file):
+    index = fsutil.update_file_lines_index(lines_file, stride=100)
+    assert os.path.isfile(get_file_lines_index_path(lines_file))
+    assert index.lines_count == 5000
+    assert index.stride == 100
+    assert len(index.offsets) == 50
+    assert index.get_line_offset(250) == (index.offsets[2], 50)
+    assert load_file_lines_index(lines_file) == index
+    # the index is not rebuilt if still valid
+    with patch("fsutil.io.write_file") as write_file_mock:
+        assert update_file_lines_index(lines_file, stride=100) == index
+    write_file_mock.assert_not_called()
+
+
+def test_update_file_lines_index_with_empty_file(temp_path):
+    path = temp_path("a.txt")
+    fsutil.create_file(path)
+    index = update_file_lines_index(path)
+    assert index.lines_count == 0
+    assert fsutil.read_file_lines_count(path, use_index=True) == 0
+    assert fsutil.read_file_lines(path, line_start=-10, use_index=True) == []
+
+
+def test_update_file_lines_index_with_invalid_args(temp_path):
+    with pytest.raises(OSError):
+        update_file_lines_index(temp_path("missing.txt"))
+    fsutil.create_file(temp_path("a.txt"))
+    with pytest.raises(ValueError):
+        update_file_lines_index(temp_path("a.txt"), stride=0)
+
+
+def test_load_file_lines_index_outdated(lines_file):
+    update_file_lines_index(lines_file)
+    assert load_file_lines_index(lines_file) is not None
+    fsutil.write_file(lines_file, '{"line": 5000}\n', append=True)
+    assert load_file_lines_index(lines_file) is None
+    assert fsutil.read_file_lines_count(lines_file, use_index=True) == 5001
+
+
+def test_load_file_lines_index_corrupted(lines_file):
+    update_file_lines_index(lines_file)
+    index_path = get_file_lines_index_path(lines_file)
+    with open(index_path, "r+b") as file:
+        file.truncate(10)
+    assert load_file_lines_index(lines_file) is None
+    fsutil.write_file(index_path, b"x" * 100)
+    assert load_file_lines_index(lines_file) is None
+
+
+def test_read_file_lines_with_lines_index(lines_file):
+    update_file_lines_index(lines_file, stride=64)
+    with patch("fsutil.io._read_file_tail_lines") as read_file_tail_lines_mock:
+        lines = fsutil.read_file_lines(
+            lines_file, line_start=4000, line_end=4002, use_index=True
+        )
+        assert lines == ['{"line": 4000}', '{"line": 4001}', '{"line": 4002}']
+        lines = fsutil.read_file_lines(lines_file, line_start=-2, use_index=True)
+        assert lines == ['{"line": 4998}', '{"line": 4999}']
+        lines = fsutil.read_file_lines(
+            lines_file, line_start=-2, line_end=4998, use_index=True
+        )
+        assert lines == ['{"line": 4998}']
+        assert fsutil.read_file_lines_count(lines_file, use_index=True) == 5000
+    # negative indexes are normalized using the index lines count
+    read_file_tail_lines_mock.assert_not_called()
+
+
+def test_read_file_lines_without_use_index(lines_file):
+    update_file_lines_index(lines_file)
+    with patch("fsutil.io.load_file_lines_index") as load_file_lines_index_mock:
+        lines = fsutil.read_file_lines(lines_file, line_start=4000, line_end=4000)
+        assert lines == ['{"line": 4000}']
+        lines = fsutil.read_file_lines(lines_file, line_start=-1)
+        assert lines == ['{"line": 4999}']
+        assert fsutil.read_file_lines_count(lines_file) == 5000
+    # the lines index sidecar file is looked for only if use_index
+    load_file_lines_index_mock.assert_not_called()
@@ -1,9 +1,17 @@
+import errno
+import os
+import shutil
+import sys
 import threading
+import time
+from collections.abc import Iterator
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
 import pytest
 
 import fsutil
+from fsutil.pathinfo import get_stat_count, reset_stat_count
 
 
 def test_clean_dir_only_dirs(temp_path):
@@ -65,6 +73,56 @@ def test_clean_dir_dirs_and_files(temp_path):
     assert fsutil.exists(temp_path("a"))
 
 
+def test_clean_dir_with_workers(temp_path):
+    fsutil.create_file(temp_path("a/b/c/f1.txt"), content="hello world")
+    fsutil.create_file(temp_path("a/b/c/f2.txt"))
+    fsutil.create_file(temp_path("a/b/d/e/f3.txt"))
+    fsutil.create_dir(temp_path("a/b/f/g"))
+    fsutil.clean_dir(temp_path("a"), dirs=True, files=True, workers=4)
+    assert fsutil.exists(temp_path("a/b/c/f1.txt"))
+    assert not fsutil.exists(temp_path("a/b/c/f2.txt"))
+    assert not fsutil.exists(temp_path("a/b/d"))
+    assert not fsutil.exists(temp_path("a/b/f"))
+
+
+def test_clean_dir_report(temp_path):
+    fsutil.create_file(temp_path("a/b/c/f1.txt"), content="hello world")
+    fsutil.create_file(temp_path("a/b/c/f2.txt"))
+    fsutil.create_file(temp_path("a/b/d/e/f3.txt"))
+    fsutil.create_dir(temp_path("a/b/f/g"))
+    report = fsutil.clean_dir(temp_path("a"), dry_run=True)
+    assert report == {"dirs": 4, "files": 2, "errors": []}
+    assert fsutil.exists(temp_path("a/b/c/f2.txt"))
+    assert fsutil.exists(temp_path("a/b/d/e/f3.txt"))
+    assert fsutil.exists(temp_path("a/b/f/g"))
+    report = fsutil.clean_dir(temp_path("a"))
+    assert report == {"dirs": 4, "files": 2, "errors": []}
+    assert fsutil.exists(temp_path("a/b/c/f1.txt"))
+    assert not fsutil.exists(temp_path("a/b/c/f2.txt"))
+    assert not fsutil.exists(temp_path("a/b/d"))
+    assert not fsutil.exists(temp_path("a/b/f"))
+
+
+def test_clean_dir_single_pass(temp_path):
+    fsutil.create_file(temp_path("a/b/c/f1.txt"), content="hello world")
+    fsutil.create_file(temp_path("a/b/c/f2.txt"))
+    fsutil.create_file(temp_path("a/b/d/e/f3.txt"))
+    with patch("os.scandir", wraps=os.scandir) as scandir_mock:
+        fsutil.clean_dir(temp_path("a"))
+    # each directory is scanned only once
+    assert scandir_mock.call_count == 5
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires symlinks support")
+def test_clean_dir_does_not_follow_symlinks(temp_path):
+    fsutil.create_file(temp_path("x/y/f.txt"))
+    fsutil.create_dir(temp_path("a/b"))
+    os.symlink(temp_path("x"), temp_path("a/b/link"))
+    report = fsutil.clean_dir(temp_path("a"))
+    assert report == {"dirs": 0, "files": 0, "errors": []}
+    assert fsutil.exists(temp_path("x/y/f.txt"))
+
+
 def test_copy_file(temp_path):
     path = temp_path("a/b/c.txt")
     fsutil.create_file(path, content="hello world")
@@ -75,6 +133,119 @@ def test_copy_file(temp_path):
     assert fsutil.get_file_hash(path) == fsutil.get_file_hash(dest)
 
 
+def test_copy_file_with_progress(temp_path):
+    path = temp_path("a/b/c.txt")
+    fsutil.create_file(path, content="hello world")
+    calls = []
+    fsutil.copy_file(path, temp_path("x/y/z.txt"), progress=calls.append)
+    assert [p[:5] for p in calls] == [
+        (0, 11, 0, 1, path),
+        (11, 11, 1, 1, path),
+    ]
+
+
+@pytest.mark.parametrize("strategy", ["auto", "buffer"])
+def test_copy_file_with_progress_by_chunks(temp_path, strategy):
+    path = temp_path("a/b/c.txt")
+    fsutil.create_file(path, content="x" * 1000)
+    calls = []
+    with (
+        patch("fsutil.progress.PROGRESS_INTERVAL", 0),
+        patch("fsutil.syscalls.COPY_BUFFER_SIZE", 100),
+        patch("fsutil.syscalls.COPY_PROGRESS_CHUNK_SIZE", 100),
+    ):
+        used_strategy = fsutil.copy_file(
+            path, temp_path("x/y/z.txt"), strategy=strategy, progress=calls.append
+        )
+    bytes_done = [p.bytes_done for p in calls]
+    assert bytes_done[0] == 0
+    assert bytes_done[-1] == 1000
+    assert calls[-1].files_done == 1
+    if used_strategy in ("copy_file_range", "sendfile", "buffer"):
+        assert bytes_done[1:11] == list(range(100, 1001, 100))
+
+
+def test_copy_file_with_progress_and_restarted_strategy(temp_path):
+    path = temp_path("a/b/c.txt")
+    fsutil.create_file(path, content="x" * 1000)
+
+    def partial_then_unsupported(src_fd, dest_fd, progress=None):
+        progress(500)
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    calls = []
+    with (
+        patch("fsutil.progress.PROGRESS_INTERVAL", 0),
+        patch.dict(
+            fsutil.syscalls.COPY_STRATEGIES_FUNCS,
+            {"reflink": partial_then_unsupported},
+        ),
+    ):
+        fsutil.copy_file(path, temp_path("x.txt"), progress=calls.append)
+    bytes_done = [p.bytes_done for p in calls]
+    assert bytes_done[:3] == [0, 500, 0]
+    assert bytes_done[-1] == 1000
+
+
+def test_copy_file_with_strategy(temp_path):
+    path = temp_path("a/b/c.txt")
+    fsutil.create_file(path, content="hello world")
+    os.chmod(path, 0o640)
+    os.utime(path, (1_000_000_000, 1_000_000_000))
+    assert fsutil.copy_file(path, temp_path("x.txt")) in fsutil.syscalls.COPY_STRATEGIES
+    assert fsutil.copy_file(path, temp_path("y.txt"), strategy="buffer") == "buffer"
+    for dest in (temp_path("x.txt"), temp_path("y.txt")):
+        assert fsutil.read_file(dest) == "hello world"
+        assert os.stat(dest).st_mtime == 1_000_000_000
+        assert os.stat(dest).st_mode & 0o777 == 0o640
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires symlinks support")
+def test_copy_file_with_symlink(temp_path):
+    path = temp_path("a/c.txt")
+    fsutil.create_file(path, content="hello world")
+    os.symlink(path, temp_path("a/link.txt"))
+    strategy = fsutil.copy_file(
+        temp_path("a/link.txt"), temp_path("x.txt"), follow_symlinks=False
+    )
+    assert strategy == "symlink"
+    assert os.path.islink(temp_path("x.txt"))
+    assert fsutil.copy_file(temp_path("a/link.txt"), temp_path("y.txt")) != "symlink"
+    assert not os.path.islink(temp_path("y.txt"))
+
+
+@pytest.mark.parametrize("overwrite", [False, True])
+def test_copy_file_stat_budget(temp_path, overwrite):
+    path = temp_path("a/b/c.txt")
+    dest = temp_path("x/z.txt")
+    fsutil.create_file(path, content="hello world")
+    fsutil.make_dirs(temp_path("x"))
+    if overwrite:
+        fsutil.create_file(dest, content="existing")
+    reset_stat_count()
+    with patch("os.stat", wraps=os.stat) as stat_mock:
+        with patch("os.lstat", wraps=os.lstat) as lstat_mock:
+            fsutil.copy_file(path, dest, overwrite=overwrite)
+    assert get_stat_count() == 2
+    # plus the stat done by shutil.copystat (not counted)
+    assert stat_mock.call_count + lstat_mock.call_count == 3
+    assert fsutil.read_file(dest) == "hello world"
+
+
+def test_copy_file_without_overwrite(temp_path):
+    path = temp_path("a/b/c.txt")
+    dest = temp_path("x/y/z.txt")
+    fsutil.create_file(path, content="hello world")
+    fsutil.create_file(dest, content="existing")
+    with patch("fsutil.operations.assert_not_exists") as assert_not_exists_mock:
+        with pytest.raises(OSError):
+            fsutil.copy_file(path, dest)
+    assert_not_exists_mock.assert_not_called()
+    assert fsutil.read_file(dest) == "existing"
+    fsutil.copy_file(path, dest, overwrite=True)
+    assert fsutil.read_file(dest) == "hello world"
+
+
 def test_copy_dir(temp_path):
     fsutil.create_file(temp_path("a/b/f-1.txt"))
     fsutil.create_file(temp_path("a/b/f-2.txt"))
@@ -90,6 +261,30 @@ def test_copy_dir(temp_path):
     assert filenames == ["f-1.txt", "f-2.txt", "f-3.txt"]
 
 
+def test_copy_dir_with_progress(temp_path):
+    for index in range(5):
+        fsutil.create_file(temp_path(f"a/b/c{index % 2}/f{index}.txt"), content="hi")
+    calls = []
+    with patch("fsutil.progress.PROGRESS_INTERVAL", 0):
+        fsutil.copy_dir(temp_path("a/b"), temp_path("x"), progress=calls.append)
+    assert [(p.files_done, p.bytes_done) for p in calls] == [
+        (index, index * 2) for index in range(1, 6)
+    ]
+    assert {(p.files_total, p.bytes_total) for p in calls} == {(5, 10)}
+
+
+def test_copy_dir_with_progress_and_workers(temp_path):
+    for index in range(20):
+        fsutil.create_file(temp_path(f"a/b/f{index}.txt"), content="hello")
+    calls = []
+    with patch("fsutil.progress.PROGRESS_INTERVAL", 0):
+        fsutil.copy_dir(
+            temp_path("a/b"), temp_path("x"), workers=4, progress=calls.append
+        )
+    assert [p.files_done for p in calls] == list(range(1, 21))
+    assert calls[-1][:4] == (100, 100, 20, 20)
+
+
 def test_copy_dir_with_overwrite(temp_path):
     fsutil.create_file(temp_path("a/b/f-1.txt"))
     fsutil.create_file(temp_path("a/b/f-2.txt"))
@@ -112,6 +307,118 @@ def test_copy_dir_content(temp_path):
     assert filenames == ["f-1.txt", "f-2.txt", "f-3.txt"]
 
 
+def test_copy_dir_content_with_workers(temp_path):
+    for i in range(0, 5):
+        for j in range(0, 5):
+            fsutil.create_file(temp_path(f"a/b-{i}/f-{j}.txt"), content=f"{i}-{j}")
+    fsutil.create_dir(temp_path("a/c/d"))
+    fsutil.copy_dir_content(temp_path("a"), temp_path("z"), workers=4)
+    assert fsutil.search_files(temp_path("z"), "**/*") == [
+        temp_path(f"z/b-{i}/f-{j}.txt") for i in range(0, 5) for j in range(0, 5)
+    ]
+    assert fsutil.is_dir(temp_path("z/c/d"))
+    assert fsutil.read_file(temp_path("z/b-3/f-2.txt")) == "3-2"
+    assert fsutil.get_dir_hash(temp_path("z")) == fsutil.get_dir_hash(temp_path("a"))
+
+
+def test_copy_dir_content_with_workers_in_deep_single_root_tree(temp_path):
+    for index in range(8):
+        fsutil.create_file(temp_path(f"a/b/c/d/f{index}.txt"), content=f"{index}")
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def copy_function(src, dst):
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        time.sleep(0.05)
+        shutil.copy2(src, dst)
+        with lock:
+            active -= 1
+
+    fsutil.copy_dir_content(
+        temp_path("a"), temp_path("x"), workers=4, copy_function=copy_function
+    )
+    # files of the same deep sub-directory are copied in parallel
+    assert max_active > 1
+    assert fsutil.read_file(temp_path("x/b/c/d/f7.txt")) == "7"
+
+
+def test_copy_dir_content_with_workers_preserves_dirs_metadata(temp_path):
+    fsutil.create_file(temp_path("a/b/f.txt"))
+    timestamp = 946684800  # 2000-01-01
+    os.utime(temp_path("a/b"), (timestamp, timestamp))
+    fsutil.copy_dir_content(temp_path("a"), temp_path("z"), workers=4)
+    assert os.path.getmtime(temp_path("z/b")) == timestamp
+
+
+def test_copy_dir_content_with_workers_and_ignore(temp_path):
+    fsutil.create_file(temp_path("a/b/f.txt"))
+    fsutil.create_file(temp_path("a/b/f.pyc"))
+    fsutil.create_file(temp_path("a/__pycache__/f.pyc"))
+    fsutil.copy_dir_content(
+        temp_path("a"),
+        temp_path("z"),
+        workers=4,
+        ignore=shutil.ignore_patterns("*.pyc", "__pycache__"),
+    )
+    assert fsutil.search_files(temp_path("z"), "**/*") == [temp_path("z/b/f.txt")]
+    assert not fsutil.exists(temp_path("z/__pycache__"))
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Test skipped on Windows")
+def test_copy_dir_content_with_workers_and_symlinks(temp_path):
+    fsutil.create_file(temp_path("a/b/f.txt"))
+    os.symlink(temp_path("a/b/f.txt"), temp_path("a/f-link.txt"))
+    os.symlink(temp_path("a/b"), temp_path("a/b-link"))
+    fsutil.copy_dir_content(temp_path("a"), temp_path("y"), workers=4)
+    assert not os.path.islink(temp_path("y/f-link.txt"))
+    assert fsutil.is_file(temp_path("y/b-link/f.txt"))
+    fsutil.copy_dir_content(temp_path("a"), temp_path("z"), workers=4, symlinks=True)
+    assert os.path.islink(temp_path("z/f-link.txt"))
+    assert os.path.islink(temp_path("z/b-link"))
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Test skipped on Windows")
+@pytest.mark.parametrize("workers", [None, 4])
+def test_copy_dir_content_with_ignore_dangling_symlinks(temp_path, workers):
+    fsutil.create_file(temp_path("a/b/f.txt"))
+    os.symlink(temp_path("a/missing.txt"), temp_path("a/b/link.txt"))
+    with pytest.raises(shutil.Error):
+        fsutil.copy_dir_content(temp_path("a"), temp_path("y"), workers=workers)
+    fsutil.copy_dir_content(
+        temp_path("a"), temp_path("z"), workers=workers, ignore_dangling_symlinks=True
+    )
+    assert fsutil.search_files(temp_path("z"), "**/*") == [temp_path("z/b/f.txt")]
+
+
+def test_copy_dir_content_with_strategy(temp_path):
+    fsutil.create_file(temp_path("a/b/f1.txt"), content="1")
+    fsutil.create_file(temp_path("a/c/f2.txt"), content="2")
+    with patch(
+        "fsutil.operations.copy_file_data", wraps=fsutil.operations.copy_file_data
+    ) as copy_file_data_mock:
+        fsutil.copy_dir_content(temp_path("a"), temp_path("y"), strategy="buffer")
+        fsutil.copy_dir_content(
+            temp_path("a"), temp_path("z"), strategy="buffer", workers=2
+        )
+    assert copy_file_data_mock.call_count == 4
+    for call in copy_file_data_mock.call_args_list:
+        assert call.kwargs["strategy"] == "buffer"
+    assert fsutil.read_file(temp_path("z/c/f2.txt")) == "2"
+
+
+def test_copy_dir_with_workers(temp_path):
+    fsutil.create_file(temp_path("a/b/f-1.txt"))
+    fsutil.create_file(temp_path("a/b/f-2.txt"))
+    fsutil.copy_dir(temp_path("a/b"), temp_path("x/y/z"), workers=4)
+    filepaths = fsutil.list_files(temp_path("x/y/z/b/"))
+    filenames = [fsutil.get_filename(filepath) for filepath in filepaths]
+    assert filenames == ["f-1.txt", "f-2.txt"]
+
+
 def test_create_file(temp_path):
     path = temp_path("a/b/c.txt")
     assert not fsutil.exists(path)
@@ -121,6 +428,28 @@ def test_create_file(temp_path):
     assert fsutil.read_file(path) == "hello world"
 
 
+def test_create_file_concurrently(temp_path):
+    path = temp_path("a/b/c.txt")
+    barrier = threading.Barrier(16)
+    created = []
+
+    def create_file(index):
+        barrier.wait()
+        try:
+            fsutil.create_file(path, content=f"{index}")
+            created.append(index)
+        except OSError:
+            pass
+
+    threads = [threading.Thread(target=create_file, args=(i,)) for i in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(created) == 1
+    assert fsutil.read_file(path) == f"{created[0]}"
+
+
 def test_create_file_with_overwrite(temp_path):
     path = temp_path("a/b/c.txt")
     fsutil.create_file(path, content="hello world")
@@ -147,7 +476,8 @@ def test_delete_dir_content(temp_path):
     fsutil.create_file(temp_path("a/b/e.txt"))
     fsutil.create_file(temp_path("a/b/f.txt"))
     path = temp_path("a/b/")
-    fsutil.delete_dir_content(path)
+    report = fsutil.delete_dir_content(path)
+    assert report == {"dirs": 1, "files": 3, "errors": []}
     assert fsutil.is_empty_dir(path)
 
 
@@ -195,7 +525,8 @@ def test_delete_files(temp_path):
     assert fsutil.exists(path2)
     assert fsutil.exists(path3)
     assert fsutil.exists(path4)
-    fsutil.delete_files(path1, path2, path3, path4)
+    report = fsutil.delete_files(path1, path2, path3, path4)
+    assert report == {"dirs": 0, "files": 4, "errors": []}
     assert not fsutil.exists(path1)
     assert not fsutil.exists(path2)
     assert not fsutil.exists(path3)
@@ -259,6 +590,55 @@ def test_download_file_content_disposition_filename_is_sanitized(temp_path):
         assert path == temp_path("evil.txt")
 
 
+def test_iter_dirs(temp_path):
+    for i in range(0, 5):
+        fsutil.create_dir(temp_path(f"a/b/c/d-{i}"))
+        fsutil.create_file(temp_path(f"a/b/c/f-{i}"), content=f"{i}")
+    dirpaths = fsutil.iter_dirs(temp_path("a/b/c"))
+    assert isinstance(dirpaths, Iterator)
+    assert sorted(dirpaths) == fsutil.list_dirs(temp_path("a/b/c"))
+
+
+def test_iter_files(temp_path):
+    for i in range(0, 5):
+        fsutil.create_dir(temp_path(f"a/b/c/d-{i}"))
+        fsutil.create_file(temp_path(f"a/b/c/f-{i}.txt"), content=f"{i}")
+    filepaths = fsutil.iter_files(temp_path("a/b/c"))
+    assert isinstance(filepaths, Iterator)
+    assert sorted(filepaths) == fsutil.list_files(temp_path("a/b/c"))
+
+
+def test_iter_files_with_invalid_path(temp_path):
+    with pytest.raises(OSError):
+        fsutil.iter_files(temp_path("a/b/c"))
+
+
+def test_iter_search_dirs(temp_path):
+    fsutil.create_file(temp_path("a/b/c/IMG_1000.jpg"))
+    fsutil.create_file(temp_path("x/y/z/c/IMG_1001.jpg"))
+    fsutil.create_file(temp_path("a/c/IMG_1002.png"))
+    dirpaths = fsutil.iter_search_dirs(temp_path(""), "**/c")
+    assert isinstance(dirpaths, Iterator)
+    assert sorted(dirpaths) == [
+        temp_path("a/b/c"),
+        temp_path("a/c"),
+        temp_path("x/y/z/c"),
+    ]
+
+
+def test_iter_search_files(temp_path):
+    fsutil.create_file(temp_path("a/b/c/IMG_1000.jpg"))
+    fsutil.create_file(temp_path("a/b/c/IMG_1001.png"))
+    fsutil.create_file(temp_path("a/x/c/IMG_1002.png"))
+    filepaths = fsutil.iter_search_files(temp_path("a/"), "**/c/IMG_*.png")
+    assert isinstance(filepaths, Iterator)
+    assert next(filepaths) in [
+        temp_path("a/b/c/IMG_1001.png"),
+        temp_path("a/x/c/IMG_1002.png"),
+    ]
+    assert len(list(filepaths)) == 1
+
+
 def test_list_dirs(temp_path):
     for i in range(0, 5):
         fsutil.create_dir(temp_path(f"a/b/c/d-{i}"))
@@ -279,6 +659,26 @@ def test_list_files(temp_path):
     assert filenames == ["f-0.txt", "f-1.txt", "f-2.txt", "f-3.txt", "f-4.txt"]
 
 
+def test_list_dirs_and_files_without_sort(temp_path):
+    for i in range(0, 5):
+        fsutil.create_dir(temp_path(f"a/b/c/d-{i}"))
+        fsutil.create_file(temp_path(f"a/b/c/f-{i}.txt"), content=f"{i}")
+    dirpaths = fsutil.list_dirs(temp_path("a/b/c"), sort=False)
+    assert sorted(dirpaths) == fsutil.list_dirs(temp_path("a/b/c"))
+    filepaths = fsutil.list_files(temp_path("a/b/c"), sort=False)
+    assert sorted(filepaths) == fsutil.list_files(temp_path("a/b/c"))
+
+
+def test_list_dirs_and_files_without_stat_per_entry(temp_path):
+    for i in range(0, 5):
+        fsutil.create_dir(temp_path(f"a/b/c/d-{i}"))
+        fsutil.create_file(temp_path(f"a/b/c/f-{i}.txt"), content=f"{i}")
+    with patch("os.stat", wraps=os.stat) as stat_mock:
+        assert len(fsutil.list_dirs(temp_path("a/b/c"))) == 5
+        assert len(fsutil.list_files(temp_path("a/b/c"))) == 5
+    assert stat_mock.call_count == 0
+
+
 def test_make_dirs(temp_path):
     path = temp_path("a/b/c/")
     fsutil.make_dirs(path)
@@ -346,6 +746,94 @@ def test_move_dir(temp_path):
     assert fsutil.is_file(temp_path("x/y/b/c.txt"))
 
 
+def test_move_dir_with_progress(temp_path):
+    fsutil.create_file(temp_path("a/b/c.txt"), content="Hello World")
+    calls = []
+    fsutil.move_dir(temp_path("a/b"), temp_path("x/y"), progress=calls.append)
+    assert [p[:5] for p in calls] == [(0, None, 0, None, temp_path("x/y/b"))]
+
+
+def test_move_dir_across_devices_with_progress(temp_path):
+    for index in range(4):
+        fsutil.create_file(temp_path(f"a/b/f{index}.txt"), content="hello")
+    calls = []
+    with (
+        patch("fsutil.operations._is_same_device", return_value=False),
+        patch("fsutil.progress.PROGRESS_INTERVAL", 0),
+    ):
+        fsutil.move_dir(temp_path("a/b"), temp_path("x/y"), progress=calls.append)
+    assert [p.files_done for p in calls] == [1, 2, 3, 4]
+    assert calls[-1][:4] == (20, 20, 4, 4)
+
+
+@pytest.mark.parametrize("workers", [None, 4])
+def test_move_dir_across_devices(temp_path, workers):
+    for index in range(10):
+        fsutil.create_file(temp_path(f"a/b/c{index % 3}/f{index}.txt"), content="hi")
+    fsutil.create_dir(temp_path("a/b/empty"))
+    with patch("fsutil.operations._is_same_device", return_value=False):
+        with patch("os.rename") as rename_mock:
+            fsutil.move_dir(temp_path("a/b"), temp_path("x/y"), workers=workers)
+    rename_mock.assert_not_called()
+    assert not fsutil.exists(temp_path("a/b"))
+    assert fsutil.read_file(temp_path("x/y/b/c2/f8.txt")) == "hi"
+    assert fsutil.is_empty_dir(temp_path("x/y/b/empty"))
+    assert len(fsutil.search_files(temp_path("x/y/b"), "**/*")) == 10
+
+
+def test_move_dir_across_devices_with_failures_and_resume(temp_path):
+    for index in range(4):
+        fsutil.create_file(temp_path(f"a/b/f{index}.txt"), content=f"{index}")
+    copy_file_data = fsutil.operations.copy_file_data
+
+    def copy_file_data_mock(path, dest, **kwargs):
+        if path.endswith("f2.txt"):
+            raise OSError("No space left on device")
+        return copy_file_data(path, dest, **kwargs)
+
+    with patch("fsutil.operations._is_same_device", return_value=False):
+        with patch("fsutil.operations.copy_file_data", new=copy_file_data_mock):
+            with pytest.raises(shutil.Error) as error:
+                fsutil.move_dir(temp_path("a/b"), temp_path("x"))
+        assert [src for src, _, _ in error.value.args[0]] == [temp_path("a/b/f2.txt")]
+        # moved files are removed from source as soon as they are copied
+        assert fsutil.list_files(temp_path("a/b")) == [temp_path("a/b/f2.txt")]
+        assert not fsutil.exists(temp_path("x/b/f2.txt"))
+        fsutil.move_dir(temp_path("a/b"), temp_path("x"), overwrite=True)
+    assert not fsutil.exists(temp_path("a/b"))
+    assert fsutil.read_file(temp_path("x/b/f2.txt")) == "2"
+    assert len(fsutil.list_files(temp_path("x/b"))) == 4
+
+
+@pytest.mark.parametrize("same_device", [True, False])
+def test_move_dir_with_overwrite_merges_into_existing_dir(temp_path, same_device):
+    fsutil.create_file(temp_path("a/b/c.txt"), content="new")
+    fsutil.create_file(temp_path("a/b/d/e.txt"), content="new")
+    fsutil.create_file(temp_path("x/b/c.txt"), content="old")
+    fsutil.create_file(temp_path("x/b/f.txt"), content="old")
+    with patch("fsutil.operations._is_same_device", return_value=same_device):
+        fsutil.move_dir(temp_path("a/b"), temp_path("x"), overwrite=True)
+    assert not fsutil.exists(temp_path("a/b"))
+    assert fsutil.read_file(temp_path("x/b/c.txt")) == "new"
+    assert fsutil.read_file(temp_path("x/b/d/e.txt")) == "new"
+    assert fsutil.read_file(temp_path("x/b/f.txt")) == "old"
+
+
+def test_move_dir_into_itself(temp_path):
+    fsutil.create_file(temp_path("a/b/c.txt"))
+    with pytest.raises(shutil.Error):
+        fsutil.move_dir(temp_path("a"), temp_path("a/b"), overwrite=True)
+
+
+def test_move_file_stat_budget(temp_path):
+    fsutil.create_file(temp_path("a/b.txt"), content="hello")
+    fsutil.make_dirs(temp_path("x"))
+    reset_stat_count()
+    fsutil.move_file(temp_path("a/b.txt"), temp_path("x"))
+    assert get_stat_count() == 2
+    assert fsutil.read_file(temp_path("x/b.txt")) == "hello"
+
+
 def test_move_file(temp_path):
     path = temp_path("a/b/c.txt")
     fsutil.create_file(path, content="Hello World")
@@ -355,6 +843,29 @@ def test_move_file(temp_path):
     assert fsutil.is_file(temp_path("a/c.txt"))
 
 
+def test_move_file_across_devices(temp_path):
+    path = temp_path("a/b/c.txt")
+    fsutil.create_file(path, content="Hello World")
+    with patch("fsutil.operations._is_same_device", return_value=False):
+        with patch("os.replace") as replace_mock:
+            fsutil.move_file(path, temp_path("x"))
+    replace_mock.assert_not_called()
+    assert not fsutil.exists(path)
+    assert fsutil.read_file(temp_path("x/c.txt")) == "Hello World"
+
+
+def test_move_file_without_overwrite(temp_path):
+    path = temp_path("a/b/c.txt")
+    fsutil.create_file(path, content="Hello World")
+    fsutil.create_file(temp_path("x/c.txt"), content="existing")
+    for same_device in (True, False):
+        with patch("fsutil.operations._is_same_device", return_value=same_device):
+            with pytest.raises(OSError):
+                fsutil.move_file(path, temp_path("x"))
+        assert fsutil.read_file(path) == "Hello World"
+        assert fsutil.read_file(temp_path("x/c.txt")) == "existing"
+
+
 def test_rename_dir(temp_path):
     path = temp_path("a/b/c")
     fsutil.make_dirs(path)
@@ -429,6 +940,51 @@ def test_remove_dir_content(temp_path):
     assert fsutil.is_empty_dir(path)
 
 
+@pytest.mark.parametrize("workers", [None, 4])
+@pytest.mark.parametrize("with_dir_fd", [True, False])
+def test_remove_dir_content_report(temp_path, workers, with_dir_fd):
+    for index in range(5):
+        fsutil.create_file(temp_path(f"a/b{index}/c/d.txt"))
+        fsutil.create_file(temp_path(f"a/e{index}.txt"))
+    with patch(
+        "fsutil.operations.REMOVE_WITH_DIR_FD",
+        with_dir_fd and fsutil.operations.REMOVE_WITH_DIR_FD,
+    ):
+        report = fsutil.remove_dir_content(temp_path("a"), workers=workers)
+    assert report == {"dirs": 10, "files": 10, "errors": []}
+    assert fsutil.is_empty_dir(temp_path("a"))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires symlinks support")
+def test_remove_dir_content_does_not_follow_symlinks(temp_path):
+    fsutil.create_file(temp_path("x/f.txt"))
+    fsutil.create_file(temp_path("a/g.txt"))
+    os.symlink(temp_path("x"), temp_path("a/link"))
+    report = fsutil.remove_dir_content(temp_path("a"))
+    assert report == {"dirs": 0, "files": 2, "errors": []}
+    assert fsutil.is_file(temp_path("x/f.txt"))
+
+
+def test_remove_dir_content_with_errors(temp_path):
+    fsutil.create_file(temp_path("a/b/c.txt"))
+    fsutil.create_file(temp_path("a/d.txt"))
+    unlink = os.unlink
+
+    def unlink_mock(path, *args, **kwargs):
+        if os.path.basename(path) == "c.txt":
+            raise PermissionError("Permission denied")
+        return unlink(path, *args, **kwargs)
+
+    with patch("os.unlink", side_effect=unlink_mock):
+        report = fsutil.remove_dir_content(temp_path("a"))
+    assert (report["dirs"], report["files"]) == (0, 1)
+    assert [path for path, _ in report["errors"]] == [
+        temp_path("a/b/c.txt"),
+        temp_path("a/b"),
+    ]
+    assert fsutil.is_file(temp_path("a/b/c.txt"))
+
+
 def test_remove_dirs(temp_path):
     fsutil.create_file(temp_path("a/b/c/document.txt"))
     fsutil.create_file(temp_path("a/b/d/document.txt"))
@@ -473,13 +1029,46 @@ def test_remove_files(temp_path):
     assert fsutil.exists(path2)
     assert fsutil.exists(path3)
     assert fsutil.exists(path4)
-    fsutil.remove_files(path1, path2, path3, path4)
+    report = fsutil.remove_files(path1, path2, path3, path4)
+    assert report == {"dirs": 0, "files": 4, "errors": []}
     assert not fsutil.exists(path1)
     assert not fsutil.exists(path2)
     assert not fsutil.exists(path3)
     assert not fsutil.exists(path4)
 
 
+@pytest.mark.parametrize("workers", [None, 4])
+def test_remove_files_with_workers(temp_path, workers):
+    paths = [temp_path(f"a/{index % 3}/f{index}.txt") for index in range(30)]
+    for path in paths:
+        fsutil.create_file(path)
+    report = fsutil.remove_files(*paths, temp_path("a/missing.txt"), workers=workers)
+    assert report == {"dirs": 0, "files": 30, "errors": []}
+    assert not any(fsutil.exists(path) for path in paths)
+
+
+def test_remove_files_with_dir_path(temp_path):
+    path = temp_path("a/b.txt")
+    fsutil.create_file(path)
+    fsutil.create_dir(temp_path("a/dir"))
+    with pytest.raises(OSError, match="Invalid file path"):
+        fsutil.remove_files(path, temp_path("a/dir"))
+    assert fsutil.is_file(path)
+    assert fsutil.is_dir(temp_path("a/dir"))
+
+
+@pytest.mark.parametrize("autodelete, budget", [(False, 13), (True, 5)])
+def test_replace_file_stat_budget(temp_path, autodelete, budget):
+    fsutil.create_file(temp_path("a/b.txt"), content="old")
+    fsutil.create_file(temp_path("a/c.txt"), content="new")
+    reset_stat_count()
+    fsutil.replace_file(
+        temp_path("a/b.txt"), temp_path("a/c.txt"), autodelete=autodelete
+    )
+    assert get_stat_count() == budget
+    assert fsutil.read_file(temp_path("a/b.txt")) == "new"
+
+
 def test_replace_file(temp_path):
     dest = temp_path("a/b/c.txt")
     src = temp_path("d/e/f.txt")
@@ -491,6 +1080,32 @@ def test_replace_file(temp_path):
     assert fsutil.exists(src)
 
 
+def test_replace_file_with_strategy(temp_path):
+    dest = temp_path("a/b/c.txt")
+    src = temp_path("d/e/f.txt")
+    fsutil.create_file(dest, content="old")
+    fsutil.create_file(src, content="new")
+    with patch(
+        "fsutil.operations.copy_file_data", wraps=fsutil.operations.copy_file_data
+    ) as copy_file_data_mock:
+        fsutil.replace_file(dest, src, strategy="buffer")
+    assert copy_file_data_mock.call_args.kwargs["strategy"] == "buffer"
+    assert fsutil.read_file(dest) == "new"
+
+
+def test_replace_file_with_autodelete_without_copy(temp_path):
+    fsutil.create_file(temp_path("a/b/c.txt"), content="old")
+    fsutil.create_file(temp_path("d/e/f.txt"), content="new")
+    with patch("fsutil.operations.copy_file_data") as copy_file_data_mock:
+        fsutil.replace_file(
+            temp_path("a/b/c.txt"), temp_path("d/e/f.txt"), autodelete=True
+        )
+    copy_file_data_mock.assert_not_called()
+    assert fsutil.read_file(temp_path("a/b/c.txt")) == "new"
+    assert not fsutil.exists(temp_path("d/e/f.txt"))
+    assert fsutil.list_files(temp_path("a/b")) == [temp_path("a/b/c.txt")]
+
+
 def test_replace_file_with_autodelete(temp_path):
     dest_file = temp_path("a/b/c.txt")
     src_file = temp_path("d/e/f.txt")
@@ -515,6 +1130,14 @@ def test_replace_dir(temp_path):
     assert fsutil.exists(src_dir)
 
 
+def test_replace_dir_with_workers(temp_path):
+    fsutil.create_file(temp_path("a/b/c.txt"), "old")
+    fsutil.create_file(temp_path("d/e/f.txt"), "new")
+    fsutil.replace_dir(temp_path("a/b/"), temp_path("d/e/"), workers=4)
+    assert fsutil.read_file(temp_path("a/b/f.txt")) == "new"
+    assert not fsutil.exists(temp_path("a/b/c.txt"))
+
+
 def test_replace_dir_with_autodelete(temp_path):
     dest_dir = temp_path("a/b/")
     dest_file = temp_path("a/b/c.txt")
@@ -528,6 +1151,65 @@ def test_replace_dir_with_autodelete(temp_path):
     assert not fsutil.exists(src_dir)
 
 
+@pytest.mark.parametrize("exchange_errno", [None, errno.ENOSYS])
+def test_replace_dir_with_autodelete_without_copy(temp_path, exchange_errno):
+    fsutil.create_file(temp_path("a/b/c.txt"), "old")
+    fsutil.create_file(temp_path("d/e/f.txt"), "new")
+    rename_exchange = fsutil.operations.rename_exchange
+
+    def rename_exchange_mock(path, dest):
+        if exchange_errno:
+            raise OSError(exchange_errno, os.strerror(exchange_errno))
+        return rename_exchange(path, dest)
+
+    with patch(
+        "fsutil.operations.rename_exchange", side_effect=rename_exchange_mock
+    ) as rename_exchange_mock_obj:
+        with patch("fsutil.operations.copy_file_data") as copy_file_data_mock:
+            fsutil.replace_dir(temp_path("a/b/"), temp_path("d/e/"), autodelete=True)
+    rename_exchange_mock_obj.assert_called_once()
+    copy_file_data_mock.assert_not_called()
+    assert fsutil.read_file(temp_path("a/b/f.txt")) == "new"
+    assert not fsutil.exists(temp_path("a/b/c.txt"))
+    assert not fsutil.exists(temp_path("d/e"))
+    assert fsutil.list_dirs(temp_path("a")) == [temp_path("a/b")]
+
+
+def test_replace_dir_with_autodelete_and_nested_src(temp_path):
+    fsutil.create_file(temp_path("a/c.txt"), "old")
+    fsutil.create_file(temp_path("a/b/f.txt"), "new")
+    with patch("fsutil.operations.rename_exchange") as rename_exchange_mock:
+        fsutil.replace_dir(temp_path("a"), temp_path("a/b"), autodelete=True)
+    rename_exchange_mock.assert_not_called()
+    assert fsutil.read_file(temp_path("a/f.txt")) == "new"
+    assert not fsutil.exists(temp_path("a/c.txt"))
+    assert not fsutil.exists(temp_path("a/b"))
+
+
+def test_replace_dir_with_autodelete_and_rename_error(temp_path):
+    fsutil.create_file(temp_path("a/b/c.txt"), "old")
+    fsutil.create_file(temp_path("d/e/f.txt"), "new")
+    with patch(
+        "fsutil.operations.rename_exchange",
+        side_effect=OSError(errno.EPERM, os.strerror(errno.EPERM)),
+    ):
+        fsutil.replace_dir(temp_path("a/b/"), temp_path("d/e/"), autodelete=True)
+    assert fsutil.read_file(temp_path("a/b/f.txt")) == "new"
+    assert not fsutil.exists(temp_path("a/b/c.txt"))
+    assert not fsutil.exists(temp_path("d/e"))
+
+
+def test_replace_dir_with_autodelete_across_devices(temp_path):
+    fsutil.create_file(temp_path("a/b/c.txt"), "old")
+    fsutil.create_file(temp_path("d/e/f.txt"), "new")
+    with patch("fsutil.operations._is_same_device", return_value=False):
+        with patch("fsutil.operations.rename_exchange") as rename_exchange_mock:
+            fsutil.replace_dir(temp_path("a/b/"), temp_path("d/e/"), autodelete=True)
+    rename_exchange_mock.assert_not_called()
+    assert fsutil.read_file(temp_path("a/b/f.txt")) == "new"
+    assert not fsutil.exists(temp_path("d/e"))
+
+
 def test_search_files(temp_path):
     fsutil.create_file(temp_path("a/b/c/IMG_1000.jpg"))
     fsutil.create_file(temp_path("a/b/c/IMG_1001.jpg"))
@@ -563,6 +1245,174 @@ def test_search_files_with_relative_path(temp_path, monkeypatch):
     assert all(fsutil.is_file(result) for result in results)
 
 
+def test_search_files_with_dot_segments_in_pattern(temp_path):
+    fsutil.create_file(temp_path("a/b/c.txt"))
+    fsutil.create_file(temp_path("a/b/d.txt"))
+    fsutil.create_file(temp_path("a/e.txt"))
+    assert fsutil.search_files(temp_path("a"), "./b/*.txt") == [
+        temp_path("a/b/c.txt"),
+        temp_path("a/b/d.txt"),
+    ]
+    assert fsutil.search_files(temp_path("a"), "b/../e.txt") == [temp_path("a/e.txt")]
+    assert fsutil.search_files(temp_path("a"), "./**/c.txt") == [temp_path("a/b/c.txt")]
+    with pytest.raises(ValueError):
+        fsutil.search_files(temp_path("a"), "../a/e.txt")
+
+
+def test_search_files_with_multiple_patterns(temp_path):
+    fsutil.create_file(temp_path("a/b/c/IMG_1000.jpg"))
+    fsutil.create_file(temp_path("a/b/c/IMG_1001.png"))
+    fsutil.create_file(temp_path("a/b/c/IMG_1002.gif"))
+    results = fsutil.search_files(temp_path("a/"), ["**/*.jpg", "**/*.png"])
+    expected_results = [
+        temp_path("a/b/c/IMG_1000.jpg"),
+        temp_path("a/b/c/IMG_1001.png"),
+    ]
+    assert results == expected_results
+
+
+def test_search_files_with_exclude(temp_path):
+    fsutil.create_file(temp_path("a/src/index.js"))
+    fsutil.create_file(temp_path("a/src/index.min.js"))
+    fsutil.create_file(temp_path("a/src/vendor.min.js"))
+    fsutil.create_file(temp_path("a/node_modules/x/index.js"))
+    fsutil.create_file(temp_path("a/.git/index.js"))
+    results = fsutil.search_files(
+        temp_path("a/"),
+        "**/*.js",
+        exclude=["node_modules", ".git/", "*.min.js", "!vendor.min.js"],
+    )
+    expected_results = [
+        temp_path("a/src/index.js"),
+        temp_path("a/src/vendor.min.js"),
+    ]
+    assert results == expected_results
+
+
+def test_search_files_with_exclude_skips_excluded_dirs(temp_path):
+    fsutil.create_file(temp_path("a/src/index.js"))
+    fsutil.create_file(temp_path("a/node_modules/x/index.js"))
+    with patch("os.scandir", wraps=os.scandir) as scandir_mock:
+        fsutil.search_files(temp_path("a/"), "**/*.js", exclude="node_modules")
+    scanned_paths = [call.args[0] for call in scandir_mock.call_args_list]
+    assert temp_path("a/src") in scanned_paths
+    assert temp_path("a/node_modules") not in scanned_paths
+    assert temp_path("a/node_modules/x") not in scanned_paths
+
+
+def test_search_files_skips_dirs_not_matching_pattern(temp_path):
+    fsutil.create_file(temp_path("a/src/index.js"))
+    fsutil.create_file(temp_path("a/docs/index.js"))
+    with patch("os.scandir", wraps=os.scandir) as scandir_mock:
+        results = fsutil.search_files(temp_path("a/"), "src/*.js")
+    assert results == [temp_path("a/src/index.js")]
+    scanned_paths = [call.args[0] for call in scandir_mock.call_args_list]
+    assert temp_path("a/docs") not in scanned_paths
+
+
+def test_search_files_with_max_depth(temp_path):
+    fsutil.create_file(temp_path("a/b.txt"))
+    fsutil.create_file(temp_path("a/b/c.txt"))
+    fsutil.create_file(temp_path("a/b/c/d.txt"))
+    results = fsutil.search_files(temp_path("a/"), "**/*.txt", max_depth=2)
+    expected_results = [
+        temp_path("a/b.txt"),
+        temp_path("a/b/c.txt"),
+    ]
+    assert results == expected_results
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Test skipped on Windows")
+def test_search_files_with_follow_symlinks(temp_path):
+    fsutil.create_file(temp_path("a/b/c.txt"))
+    fsutil.create_dir(temp_path("x"))
+    os.symlink(temp_path("a"), temp_path("x/link"))
+    results = fsutil.search_files(temp_path("x"), "**/*.txt")
+    assert results == [temp_path("x/link/b/c.txt")]
+    results = fsutil.search_files(temp_path("x"), "**/*.txt", follow_symlinks=False)
+    assert results == []
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Test skipped on Windows")
+def test_search_files_with_symlinks_loop(temp_path):
+    fsutil.create_file(temp_path("a/b/c.txt"))
+    os.symlink(temp_path("a"), temp_path("a/b/loop"))
+    results = fsutil.search_files(temp_path("a"), "**/c.txt")
+    assert temp_path("a/b/c.txt") in results
+
+
+def test_search_files_with_workers(temp_path):
+    for i in range(0, 5):
+        fsutil.create_file(temp_path(f"a/b-{i}/c/IMG_{i}.png"))
+        fsutil.create_file(temp_path(f"a/b-{i}/c/IMG_{i}.jpg"))
+    results = fsutil.search_files(temp_path("a/"), "**/*.png", workers=4)
+    expected_results = fsutil.search_files(temp_path("a/"), "**/*.png")
+    assert len(results) == 5
+    assert results == expected_results
+
+
+def test_search_files_with_size_filters(temp_path):
+    fsutil.create_file(temp_path("a/f-1.txt"), content="a" * 10)
+    fsutil.create_file(temp_path("a/f-2.txt"), content="a" * 100)
+    fsutil.create_file(temp_path("a/b/f-3.txt"), content="a" * 2048)
+    results = fsutil.search_files(temp_path("a"), min_size=50)
+    assert results == [temp_path("a/b/f-3.txt"), temp_path("a/f-2.txt")]
+    results = fsutil.search_files(temp_path("a"), min_size=50, max_size="1 KB")
+    assert results == [temp_path("a/f-2.txt")]
+
+
+def test_search_files_with_modified_filters(temp_path):
+    fsutil.create_file(temp_path("a/f-1.txt"))
+    fsutil.create_file(temp_path("a/f-2.txt"))
+    old_timestamp = (datetime.now() - timedelta(days=10)).timestamp()
+    os.utime(temp_path("a/f-1.txt"), (old_timestamp, old_timestamp))
+    week_ago = datetime.now() - timedelta(days=7)
+    results = fsutil.search_files(temp_path("a"), modified_before=week_ago)
+    assert results == [temp_path("a/f-1.txt")]
+    results = fsutil.search_files(temp_path("a"), modified_after=week_ago)
+    assert results == [temp_path("a/f-2.txt")]
+
+
+def test_search_files_with_extensions_filter(temp_path):
+    fsutil.create_file(temp_path("a/f-1.txt"))
+    fsutil.create_file(temp_path("a/f-2.JPG"))
+    fsutil.create_file(temp_path("a/f-3.png"))
+    results = fsutil.search_files(temp_path("a"), extensions=["jpg", ".png"])
+    assert results == [temp_path("a/f-2.JPG"), temp_path("a/f-3.png")]
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Test skipped on Windows")
+def test_search_files_with_symlinks_filter(temp_path):
+    fsutil.create_file(temp_path("a/f-1.txt"))
+    os.symlink(temp_path("a/f-1.txt"), temp_path("a/f-2.txt"))
+    results = fsutil.search_files(temp_path("a"))
+    assert results == [temp_path("a/f-1.txt"), temp_path("a/f-2.txt")]
+    results = fsutil.search_files(temp_path("a"), symlinks=False)
+    assert results == [temp_path("a/f-1.txt")]
+
+
+def test_search_files_with_filters_stat_once(temp_path):
+    for i in range(0, 5):
+        fsutil.create_file(temp_path(f"a/f-{i}.txt"), content="a" * i)
+    with patch("os.stat", wraps=os.stat) as stat_mock:
+        results = fsutil.search_files(temp_path("a"), min_size=3)
+    assert results == [temp_path("a/f-3.txt"), temp_path("a/f-4.txt")]
+    # directory entries stat results are used, without extra os.stat calls
+    assert stat_mock.call_count <= 1
+
+
+def test_iter_search_entries(temp_path):
+    fsutil.create_file(temp_path("a/f-1.txt"), content="a" * 10)
+    fsutil.create_file(temp_path("a/b/f-2.txt"), content="a" * 100)
+    entries = fsutil.iter_search_entries(temp_path("a"), dirs=False, min_size=50)
+    assert isinstance(entries, Iterator)
+    entries = list(entries)
+    assert [entry.path for entry in entries] == [temp_path("a/b/f-2.txt")]
+    assert entries[0].stat().st_size == 100
+    entries = fsutil.iter_search_entries(temp_path("a"), files=False)
+    assert [entry.path for entry in entries] == [temp_path("a/b")]
+
+
 def test_search_dirs(temp_path):
     fsutil.create_file(temp_path("a/b/c/IMG_1000.jpg"))
     fsutil.create_file(temp_path("x/y/z/c/IMG_1001.jpg"))
@@ -579,5 +1429,78 @@ def test_search_dirs(temp_path):
     assert results == expected_results
 
 
+def test_search_dirs_with_recursive_pattern_excludes_path(temp_path):
+    fsutil.create_file(temp_path("a/b/c/d.txt"))
+    results = fsutil.search_dirs(temp_path("a"), "**")
+    assert results == [temp_path("a/b"), temp_path("a/b/c")]
+
+
 if __name__ == "__main__":
     pytest.main()
+
+
+def test_sync_dir(temp_path):
+    fsutil.create_file(temp_path("a/f1.txt"), content="hello")
+    fsutil.create_file(temp_path("a/b/f2.txt"), content="world")
+    report = fsutil.sync_dir(temp_path("a"), temp_path("z"))
+    assert report == {
+        "copied": 2,
+        "copied_bytes": 10,
+        "skipped": 0,
+        "skipped_bytes": 0,
+        "deleted": 0,
+        "deleted_bytes": 0,
+    }
+    assert fsutil.read_file(temp_path("z/b/f2.txt")) == "world"
+    with patch(
+        "fsutil.operations.copy_file_data", wraps=fsutil.operations.copy_file_data
+    ) as copy_file_data_mock:
+        report = fsutil.sync_dir(temp_path("a"), temp_path("z"))
+    assert copy_file_data_mock.call_count == 0
+    assert (report["copied"], report["skipped"], report["skipped_bytes"]) == (0, 2, 10)
+    fsutil.write_file(temp_path("a/b/f2.txt"), "world!")
+    report = fsutil.sync_dir(temp_path("a"), temp_path("z"), workers=2)
+    assert (report["copied"], report["copied_bytes"], report["skipped"]) == (1, 6, 1)
+    assert fsutil.read_file(temp_path("z/b/f2.txt")) == "world!"
+
+
+def test_sync_dir_with_checksum(temp_path):
+    fsutil.create_file(temp_path("a/f1.txt"), content="hello")
+    fsutil.create_file(temp_path("a/f2.txt"), content="world")
+    fsutil.sync_dir(temp_path("a"), temp_path("z"))
+    # same size and mtime, different content
+    fsutil.write_file(temp_path("z/f1.txt"), "jello")
+    shutil.copystat(temp_path("a/f1.txt"), temp_path("z/f1.txt"))
+    # same content, different mtime
+    os.utime(temp_path("z/f2.txt"), (1_000_000_000, 1_000_000_000))
+    report = fsutil.sync_dir(temp_path("a"), temp_path("z"))
+    assert (report["copied"], report["skipped"]) == (1, 1)
+    assert fsutil.read_file(temp_path("z/f1.txt")) == "jello"
+    report = fsutil.sync_dir(temp_path("a"), temp_path("z"), checksum=True)
+    assert (report["copied"], report["skipped"]) == (1, 1)
+    assert fsutil.read_file(temp_path("z/f1.txt")) == "hello"
+
+
+def test_sync_dir_with_delete(temp_path):
+    fsutil.create_file(temp_path("a/f1.txt"), content="hello")
+    fsutil.create_file(temp_path("a/b/f2.txt"), content="world")
+    fsutil.create_file(temp_path("z/f3.txt"), content="abc")
+    fsutil.create_file(temp_path("z/c/d/f4.txt"), content="de")
+    report = fsutil.sync_dir(temp_path("a"), temp_path("z"))
+    assert report["deleted"] == 0
+    assert fsutil.is_file(temp_path("z/f3.txt"))
+    report = fsutil.sync_dir(temp_path("a"), temp_path("z"), delete=True)
+    assert (report["deleted"], report["deleted_bytes"]) == (2, 5)
+    assert (report["copied"], report["skipped"]) == (0, 2)
+    assert sorted(os.listdir(temp_path("z"))) == ["b", "f1.txt"]
+
+
+def test_sync_dir_with_type_changes(temp_path):
+    fsutil.create_file(temp_path("a/x/f1.txt"), content="hello")
+    fsutil.create_file(temp_path("a/y"), content="world")
+    fsutil.create_file(temp_path("z/x"), content="file")
+    fsutil.create_file(temp_path("z/y/f2.txt"), content="dir")
+    report = fsutil.sync_dir(temp_path("a"), temp_path("z"))
+    assert report["copied"] == 2
+    assert fsutil.read_file(temp_path("z/x/f1.txt")) == "hello"
+    assert fsutil.read_file(temp_path("z/y")) == "world"
@@ -0,0 +1,90 @@
+import os
+import sys
+
+import pytest
+
+import fsutil
+from fsutil.pathinfo import PathInfo, get_stat_count, reset_stat_count
+
+
+def test_get_path_info_with_file(temp_path):
+    path = temp_path("a/b/c.txt")
+    fsutil.create_file(path, content="hello")
+    info = fsutil.get_path_info(path)
+    assert isinstance(info, PathInfo)
+    assert info.path == path
+    assert info.exists
+    assert info.is_file
+    assert not info.is_dir
+    assert not info.is_symlink
+    assert info.size == 5
+    assert info.mtime == os.stat(path).st_mtime
+    assert os.fspath(info) == path
+    assert fsutil.get_path_info(info) is info
+
+
+def test_get_path_info_with_dir(temp_path):
+    info = fsutil.get_path_info(temp_path())
+    assert info.exists
+    assert info.is_dir
+    assert not info.is_file
+
+
+def test_get_path_info_with_missing_path(temp_path):
+    info = fsutil.get_path_info(temp_path("a/b/c.txt"))
+    assert not info.exists
+    assert not info.is_dir
+    assert not info.is_file
+    with pytest.raises(OSError):
+        info.size  # noqa: B018
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires symlinks support")
+def test_get_path_info_with_symlinks(temp_path):
+    fsutil.create_file(temp_path("a/c.txt"), content="hello")
+    os.symlink(temp_path("a/c.txt"), temp_path("a/link.txt"))
+    os.symlink(temp_path("a/missing.txt"), temp_path("a/broken.txt"))
+    info = fsutil.get_path_info(temp_path("a/link.txt"))
+    assert info.is_symlink
+    assert info.is_file
+    assert info.size == 5
+    info = fsutil.get_path_info(temp_path("a/broken.txt"))
+    assert info.is_symlink
+    assert not info.exists
+
+
+def test_get_path_info_samefile(temp_path):
+    fsutil.create_file(temp_path("a/c.txt"))
+    fsutil.create_file(temp_path("a/d.txt"))
+    info = fsutil.get_path_info(temp_path("a/c.txt"))
+    assert info.samefile(fsutil.get_path_info(temp_path("a/c.txt")))
+    assert not info.samefile(fsutil.get_path_info(temp_path("a/d.txt")))
+    assert not info.samefile(fsutil.get_path_info(temp_path("a/e.txt")))
+
+
+def test_checks_with_path_info(temp_path):
+    path = temp_path("a/b/c.txt")
+    fsutil.create_file(path)
+    info = fsutil.get_path_info(path)
+    reset_stat_count()
+    fsutil.assert_file(info)
+    fsutil.assert_exists(info)
+    fsutil.assert_not_dir(info)
+    assert fsutil.exists(info)
+    assert fsutil.is_file(info)
+    assert fsutil.is_empty_file(info)
+    assert fsutil.get_file_size(info) == 0
+    assert get_stat_count() == 0
+    with pytest.raises(OSError):
+        fsutil.assert_dir(info)
+
+
+def test_stat_count(temp_path):
+    path = temp_path("a/b/c.txt")
+    fsutil.create_file(path)
+    reset_stat_count()
+    fsutil.get_path_info(path)
+    fsutil.get_path_info(temp_path("a/b/missing.txt"))
+    assert get_stat_count() == 2
+    reset_stat_count()
+    assert get_stat_count() == 0
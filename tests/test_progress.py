@@ -0,0 +1,81 @@
+import threading
+from unittest.mock import patch
+
+import fsutil
+from fsutil.progress import Progress, ProgressTracker, get_paths_totals
+
+
+def test_progress_bytes_per_second():
+    assert Progress(100, 200, 1, 2, None, 2.0).bytes_per_second == 50.0
+    assert Progress(100, 200, 1, 2, None, 0.0).bytes_per_second == 0.0
+
+
+def test_get_paths_totals(temp_path):
+    fsutil.create_file(temp_path("a/b/c.txt"), content="hello")
+    fsutil.create_file(temp_path("a/d.txt"), content="world!")
+    fsutil.create_file(temp_path("e.txt"), content="!")
+    assert get_paths_totals([temp_path("a"), temp_path("e.txt")]) == (3, 12)
+    assert get_paths_totals([temp_path("missing")]) == (0, 0)
+
+
+def test_progress_tracker_is_rate_limited():
+    calls = []
+    tracker = ProgressTracker(calls.append, bytes_total=1000, interval=3600)
+    for _ in range(100):
+        tracker.update(bytes=10)
+    assert len(calls) == 1
+    assert calls[0].bytes_done == 10
+    tracker.finish(path="done")
+    assert len(calls) == 2
+    assert calls[1][:5] == (1000, 1000, 0, None, "done")
+    tracker.finish()
+    assert len(calls) == 2
+
+
+def test_progress_tracker_without_interval():
+    calls = []
+    tracker = ProgressTracker(calls.append, interval=0)
+    for _ in range(10):
+        tracker.update(files=1)
+    tracker.finish()
+    assert [progress.files_done for progress in calls] == list(range(1, 11))
+
+
+def test_progress_tracker_is_thread_safe():
+    calls = []
+    tracker = ProgressTracker(calls.append, interval=0)
+
+    def task():
+        for _ in range(1000):
+            tracker.update(bytes=1)
+
+    threads = [threading.Thread(target=task) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert tracker.bytes_done == 8000
+    assert [progress.bytes_done for progress in calls] == list(range(1, 8001))
+
+
+def test_progress_tracker_without_callback(temp_path):
+    with patch("fsutil.progress.get_paths_totals") as get_paths_totals_mock:
+        tracker = ProgressTracker(None, paths=[temp_path()])
+    get_paths_totals_mock.assert_not_called()
+    assert not tracker.enabled
+    tracker.update(bytes=10)
+    tracker.add_file(temp_path("missing.txt"))
+    tracker.finish()
+    assert tracker.bytes_done == 0
+
+
+def test_progress_tracker_add_file(temp_path):
+    path = temp_path("a.txt")
+    fsutil.create_file(path, content="hello")
+    calls = []
+    tracker = ProgressTracker(calls.append, interval=0)
+    tracker.add_file(path)
+    tracker.add_file(temp_path("missing.txt"))
+    tracker.add_file(path, size=100)
+    assert [(p.bytes_done, p.files_done) for p in calls] == [(5, 1), (5, 2), (105, 3)]
+    assert calls[0].path == path
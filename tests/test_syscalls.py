@@ -0,0 +1,167 @@
+import errno
+import os
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+import fsutil
+from fsutil import syscalls
+from fsutil.syscalls import COPY_STRATEGIES, copy_file_data
+
+
+def _unsupported(src_fd, dest_fd, progress=None):
+    raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+
+def _partial_then_unsupported(src_fd, dest_fd, progress=None):
+    os.write(dest_fd, b"garbage")
+    os.read(src_fd, 3)
+    if progress is not None:
+        progress(7)
+    raise OSError(errno.EINVAL, "Invalid argument")
+
+
+def _no_space_left(src_fd, dest_fd, progress=None):
+    raise OSError(errno.ENOSPC, "No space left on device")
+
+
+@pytest.fixture
+def src_file(temp_path):
+    path = temp_path("a/src.bin")
+    fsutil.write_file(path, "hello world " * 10000)
+    return path
+
+
+@pytest.mark.parametrize("strategy", ["auto", *COPY_STRATEGIES])
+def test_copy_file_data(temp_path, src_file, strategy):
+    dest = temp_path("a/dest.bin")
+    try:
+        used_strategy = copy_file_data(src_file, dest, strategy=strategy)
+    except OSError as error:
+        # explicit strategy not supported by the current platform / file-system
+        assert strategy not in ("auto", "native", "buffer")
+        assert error.errno in syscalls.COPY_STRATEGIES_FALLBACK_ERRNOS
+        return
+    assert used_strategy in COPY_STRATEGIES
+    if strategy != "auto":
+        assert used_strategy == strategy
+    assert fsutil.read_file(dest) == fsutil.read_file(src_file)
+
+
+def test_copy_file_data_fallback_chain(temp_path, src_file):
+    dest = temp_path("a/dest.bin")
+    funcs = {
+        "reflink": _unsupported,
+        "copy_file_range": _partial_then_unsupported,
+        "sendfile": _unsupported,
+    }
+    with (
+        patch.dict(syscalls.COPY_STRATEGIES_FUNCS, funcs),
+        patch("fsutil.syscalls._copy_buffer") as copy_buffer_mock,
+    ):
+        assert copy_file_data(src_file, dest) == "native"
+    # the userspace copy is used only if explicitly requested
+    copy_buffer_mock.assert_not_called()
+    assert fsutil.read_file(dest) == fsutil.read_file(src_file)
+
+
+def test_copy_file_data_native_fallback_error(temp_path, src_file):
+    dest = temp_path("a/dest.bin")
+    funcs = dict.fromkeys(["reflink", "copy_file_range", "sendfile"], _unsupported)
+    with (
+        patch.dict(syscalls.COPY_STRATEGIES_FUNCS, funcs),
+        patch("shutil.copyfile", side_effect=OSError(errno.ENOSPC, "No space")),
+    ):
+        with pytest.raises(OSError):
+            copy_file_data(src_file, dest, exclusive=True)
+    assert not fsutil.exists(dest)
+
+
+def test_copy_file_data_fallback_with_explicit_strategy(temp_path, src_file):
+    dest = temp_path("a/dest.bin")
+    with patch.dict(syscalls.COPY_STRATEGIES_FUNCS, {"reflink": _unsupported}):
+        with pytest.raises(OSError):
+            copy_file_data(src_file, dest, strategy="reflink")
+
+
+def test_copy_file_data_with_unexpected_error(temp_path, src_file):
+    dest = temp_path("a/dest.bin")
+    with patch.dict(syscalls.COPY_STRATEGIES_FUNCS, {"reflink": _no_space_left}):
+        with pytest.raises(OSError) as error:
+            copy_file_data(src_file, dest)
+    assert error.value.errno == errno.ENOSPC
+
+
+def test_copy_file_data_with_empty_file(temp_path):
+    path = temp_path("a/empty.txt")
+    dest = temp_path("a/dest.txt")
+    fsutil.create_file(path)
+    assert copy_file_data(path, dest) in COPY_STRATEGIES
+    assert fsutil.read_file(dest) == ""
+
+
+def test_copy_file_data_with_same_file(src_file):
+    with pytest.raises(shutil.SameFileError):
+        copy_file_data(src_file, src_file)
+    assert fsutil.get_file_size(src_file) == 120000
+
+
+def test_copy_file_data_with_invalid_strategy(temp_path, src_file):
+    with pytest.raises(ValueError):
+        copy_file_data(src_file, temp_path("a/dest.bin"), strategy="invalid")
+
+
+def test_rename_exchange(temp_path):
+    fsutil.create_file(temp_path("a/f1.txt"), content="1")
+    fsutil.create_file(temp_path("b/f2.txt"), content="2")
+    try:
+        syscalls.rename_exchange(temp_path("a"), temp_path("b"))
+    except OSError as error:
+        assert error.errno in syscalls.RENAME_FLAGS_UNSUPPORTED_ERRNOS
+        pytest.skip("renameat2 RENAME_EXCHANGE not supported")
+    assert fsutil.read_file(temp_path("a/f2.txt")) == "2"
+    assert fsutil.read_file(temp_path("b/f1.txt")) == "1"
+
+
+def test_rename_exchange_with_missing_dest(temp_path):
+    fsutil.create_file(temp_path("a/f1.txt"), content="1")
+    with pytest.raises(OSError):
+        syscalls.rename_exchange(temp_path("a"), temp_path("b"))
+    assert fsutil.exists(temp_path("a/f1.txt"))
+
+
+@pytest.mark.parametrize("with_renameat2", [True, False])
+def test_rename_noreplace(temp_path, with_renameat2):
+    fsutil.create_file(temp_path("a/f1.txt"), content="1")
+    fsutil.create_file(temp_path("a/f2.txt"), content="2")
+    fsutil.create_dir(temp_path("a/d1"))
+    fsutil.create_dir(temp_path("a/d2"))
+    renameat2 = syscalls._get_renameat2() if with_renameat2 else None
+    with patch("fsutil.syscalls._get_renameat2", return_value=renameat2):
+        with pytest.raises(FileExistsError):
+            syscalls.rename_noreplace(temp_path("a/f1.txt"), temp_path("a/f2.txt"))
+        with pytest.raises(FileExistsError):
+            syscalls.rename_noreplace(temp_path("a/d1"), temp_path("a/d2"))
+        assert fsutil.read_file(temp_path("a/f1.txt")) == "1"
+        assert fsutil.read_file(temp_path("a/f2.txt")) == "2"
+        syscalls.rename_noreplace(temp_path("a/f1.txt"), temp_path("a/f3.txt"))
+        syscalls.rename_noreplace(temp_path("a/d1"), temp_path("a/d3"))
+    assert not fsutil.exists(temp_path("a/f1.txt"))
+    assert fsutil.read_file(temp_path("a/f3.txt")) == "1"
+    assert not fsutil.exists(temp_path("a/d1"))
+    assert fsutil.is_dir(temp_path("a/d3"))
+
+
+def test_copy_file_data_exclusive(temp_path, src_file):
+    dest = temp_path("a/dest.bin")
+    fsutil.create_file(dest, content="existing")
+    with pytest.raises(FileExistsError):
+        copy_file_data(src_file, dest, exclusive=True)
+    assert fsutil.read_file(dest) == "existing"
+    fsutil.remove_file(dest)
+    with patch.dict(syscalls.COPY_STRATEGIES_FUNCS, {"reflink": _no_space_left}):
+        with pytest.raises(OSError):
+            copy_file_data(src_file, dest, exclusive=True)
+    # the partially copied file is removed
+    assert not fsutil.exists(dest)
@@ -0,0 +1,185 @@
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import fsutil
+from fsutil.urlcache import evict_url_cache, get_url_cache_entry_path
+
+LAST_MODIFIED = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+
+class ConditionalRequestHandler(BaseHTTPRequestHandler):
+    body = b'{"debug": true}'
+    etag = '"v1"'
+    last_modified = None
+    statuses: list[int] = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=b""):
+        type(self).statuses.append(status)
+        self.send_response(status)
+        if self.etag:
+            self.send_header("ETag", self.etag)
+        if self.last_modified:
+            self.send_header("Last-Modified", self.last_modified)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/missing":
+            self._send(404)
+        elif self.etag and self.headers.get("If-None-Match") == self.etag:
+            self._send(304)
+        elif self.last_modified and (
+            self.headers.get("If-Modified-Since") == self.last_modified
+        ):
+            self._send(304)
+        else:
+            self._send(200, self.body)
+
+
+@pytest.fixture
+def server():
+    handler = type("Handler", (ConditionalRequestHandler,), {"statuses": []})
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield handler, f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_read_file_from_url_with_cache(server, temp_path):
+    handler, url = server
+    cache_dir = temp_path("cache")
+    for _ in range(3):
+        content = fsutil.read_file_from_url(f"{url}/config.json", cache_dir=cache_dir)
+        assert content == '{"debug": true}'
+    assert handler.statuses == [200, 304, 304]
+    handler.etag = '"v2"'
+    handler.body = b'{"debug": false}'
+    content = fsutil.read_file_from_url(f"{url}/config.json", cache_dir=cache_dir)
+    assert content == '{"debug": false}'
+    assert handler.statuses == [200, 304, 304, 200]
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_read_file_from_url_with_cache_and_last_modified(server, temp_path):
+    handler, url = server
+    handler.etag = None
+    handler.last_modified = LAST_MODIFIED
+    cache_dir = temp_path("cache")
+    for _ in range(2):
+        content = fsutil.read_file_from_url(f"{url}/config.json", cache_dir=cache_dir)
+        assert content == '{"debug": true}'
+    assert handler.statuses == [200, 304]
+
+
+def test_read_file_from_url_with_cache_without_validators(server, temp_path):
+    handler, url = server
+    handler.etag = None
+    cache_dir = temp_path("cache")
+    for _ in range(2):
+        content = fsutil.read_file_from_url(f"{url}/config.json", cache_dir=cache_dir)
+        assert content == '{"debug": true}'
+    assert handler.statuses == [200, 200]
+    assert not os.path.exists(cache_dir)
+
+
+def test_read_file_from_url_with_cache_and_error(server, temp_path):
+    handler, url = server
+    with pytest.raises(OSError):
+        fsutil.read_file_from_url(f"{url}/missing", cache_dir=temp_path("cache"))
+
+
+def test_read_file_from_url_with_corrupted_cache_entry(server, temp_path):
+    handler, url = server
+    cache_dir = temp_path("cache")
+    fsutil.read_file_from_url(f"{url}/config.json", cache_dir=cache_dir)
+    entry_path = get_url_cache_entry_path(cache_dir, f"{url}/config.json")
+    with open(entry_path, "ab") as file:
+        file.write(b"garbage")
+    content = fsutil.read_file_from_url(f"{url}/config.json", cache_dir=cache_dir)
+    assert content == '{"debug": true}'
+    assert handler.statuses == [200, 200]
+
+
+def test_download_file_with_cache(server, temp_path):
+    handler, url = server
+    cache_dir = temp_path("cache")
+    for index in range(2):
+        path = fsutil.download_file(
+            f"{url}/config.json", dirpath=temp_path(f"out-{index}"), cache_dir=cache_dir
+        )
+        assert path == temp_path(f"out-{index}/config.json")
+        with open(path, "rb") as file:
+            assert file.read() == b'{"debug": true}'
+    assert handler.statuses == [200, 304]
+
+
+def test_download_file_with_cache_and_progress(server, temp_path):
+    handler, url = server
+    progress_calls = []
+    for _ in range(2):
+        filepath = fsutil.download_file(
+            f"{url}/config.json",
+            dirpath=temp_path("downloads"),
+            cache_dir=temp_path("cache"),
+            progress=progress_calls.append,
+        )
+        assert fsutil.read_file(filepath) == '{"debug": true}'
+    assert handler.statuses == [200, 304]
+    assert progress_calls[-1].bytes_done == progress_calls[-1].bytes_total == 15
+    assert progress_calls[-1].files_done == 1
+
+
+@pytest.mark.parametrize("options", [{"workers": 4}, {"resume": True}])
+def test_download_file_with_cache_and_unsupported_options(server, temp_path, options):
+    handler, url = server
+    with pytest.raises(ValueError):
+        fsutil.download_file(
+            f"{url}/config.json", cache_dir=temp_path("cache"), **options
+        )
+    assert handler.statuses == []
+
+
+def test_url_cache_lru_eviction(server, temp_path):
+    handler, url = server
+    handler.body = b"x" * 1000
+    cache_dir = temp_path("cache")
+    for name in ["a", "b", "c"]:
+        fsutil.read_file_from_url(
+            f"{url}/{name}", cache_dir=cache_dir, cache_max_size=2500
+        )
+        time.sleep(0.01)
+    # revalidating a makes b the least recently used entry
+    fsutil.read_file_from_url(f"{url}/a", cache_dir=cache_dir, cache_max_size=2500)
+    time.sleep(0.01)
+    fsutil.read_file_from_url(f"{url}/d", cache_dir=cache_dir, cache_max_size=2500)
+    entries = {
+        name
+        for name in ["a", "b", "c", "d"]
+        if os.path.exists(get_url_cache_entry_path(cache_dir, f"{url}/{name}"))
+    }
+    assert entries == {"a", "d"}
+
+
+def test_evict_url_cache(temp_path):
+    cache_dir = temp_path("cache")
+    for index in range(5):
+        path = get_url_cache_entry_path(cache_dir, f"https://example.com/{index}")
+        fsutil.write_file(path, b"x" * 100)
+        os.utime(path, ns=(index * 10**9, index * 10**9))
+    fsutil.write_file(temp_path("cache/other.txt"), "x" * 1000)
+    assert evict_url_cache(cache_dir, 250) == 3
+    assert evict_url_cache(cache_dir, 250) == 0
+    assert len(os.listdir(cache_dir)) == 3
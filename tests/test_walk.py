@@ -0,0 +1,134 @@
+import pytest
+
+import fsutil
+from fsutil.walk import compile_matcher, walk_entries
+
+
+def test_compile_matcher_cache():
+    matcher = compile_matcher("**/*.py", exclude=["node_modules", ".git"])
+    assert matcher is compile_matcher("**/*.py", exclude=["node_modules", ".git"])
+    assert matcher is compile_matcher(["**/*.py"], exclude=("node_modules", ".git"))
+
+
+@pytest.mark.parametrize(
+    "pattern, relpath, is_dir, expected",
+    [
+        ("*.py", "a.py", False, True),
+        ("*.py", "a/b.py", False, False),
+        ("**/*.py", "a.py", False, True),
+        ("**/*.py", "a/b/c.py", False, True),
+        ("**/*.py", ".a/b.py", False, False),
+        ("**/*.py", "a/.b.py", False, False),
+        ("**/.b.py", "a/.b.py", False, True),
+        ("a/**", "a", False, False),
+        ("a/**", "a", True, True),
+        ("a/**", "a/b/c", False, True),
+        ("a/*/", "a/b", False, False),
+        ("a/*/", "a/b", True, True),
+        ("[ab]?.txt", "b1.txt", False, True),
+        ("[!ab]?.txt", "b1.txt", False, False),
+    ],
+)
+def test_compile_matcher_match(pattern, relpath, is_dir, expected):
+    matcher = compile_matcher(pattern)
+    assert matcher.match(relpath, is_dir=is_dir) == expected
+
+
+@pytest.mark.parametrize(
+    "pattern, relpath, expected",
+    [
+        ("*.py", "a", False),
+        ("a/*.py", "a", True),
+        ("a/*.py", "b", False),
+        ("a/*.py", "a/b", False),
+        ("**/*.py", "a/b/c", True),
+        ("**/*.py", "a/.b", False),
+        ("a/**/*.py", "a/b/c", True),
+        ("a/**/*.py", "b/a", False),
+    ],
+)
+def test_compile_matcher_match_walk(pattern, relpath, expected):
+    matcher = compile_matcher(pattern)
+    assert matcher.match_walk(relpath) == expected
+
+
+@pytest.mark.parametrize(
+    "exclude, relpath, is_dir, expected",
+    [
+        (["node_modules"], "node_modules", True, True),
+        (["node_modules"], "a/b/node_modules", True, True),
+        (["/node_modules"], "a/node_modules", True, False),
+        (["build/"], "a/build", True, True),
+        (["build/"], "a/build", False, False),
+        (["*.log"], "a/.b.log", False, True),
+        (["*.log", "!keep.log"], "a/keep.log", False, False),
+        (["*.log", "!keep.log", "a/*.log"], "a/keep.log", False, True),
+    ],
+)
+def test_compile_matcher_exclude(exclude, relpath, is_dir, expected):
+    matcher = compile_matcher("**/*", exclude=exclude)
+    assert matcher.exclude(relpath, is_dir=is_dir) == expected
+
+
+def test_walk_entries(temp_path):
+    fsutil.create_file(temp_path("a/b/c.txt"))
+    fsutil.create_file(temp_path("a/d.txt"))
+    fsutil.create_file(temp_path("e/f.txt"))
+    matcher = compile_matcher("a/**/*.txt")
+    paths = sorted(entry.path for entry in walk_entries(temp_path(), matcher))
+    assert paths == [temp_path("a/b/c.txt"), temp_path("a/d.txt")]
+
+
+def test_walk_entries_all(temp_path):
+    fsutil.create_file(temp_path("a/b/c.txt"))
+    fsutil.create_file(temp_path("a/.d.txt"))
+    paths = sorted(entry.path for entry in walk_entries(temp_path()))
+    assert paths == [
+        temp_path("a"),
+        temp_path("a/.d.txt"),
+        temp_path("a/b"),
+        temp_path("a/b/c.txt"),
+    ]
+
+
+def test_walk_entries_with_workers(temp_path):
+    for i in range(0, 5):
+        for j in range(0, 5):
+            fsutil.create_file(temp_path(f"a-{i}/b-{j}/c.txt"))
+    paths = [entry.path for entry in walk_entries(temp_path())]
+    paths_parallel = [entry.path for entry in walk_entries(temp_path(), workers=4)]
+    assert len(paths) == 55
+    assert sorted(paths_parallel) == sorted(paths)
+
+
+def test_walk_entries_with_workers_and_sort(temp_path):
+    for i in range(0, 5):
+        for j in range(0, 5):
+            fsutil.create_file(temp_path(f"a-{i}/b-{j}/c.txt"))
+    paths = [entry.path for entry in walk_entries(temp_path(), sort=True)]
+    for _ in range(0, 5):
+        paths_parallel = [
+            entry.path for entry in walk_entries(temp_path(), sort=True, workers=4)
+        ]
+        assert paths_parallel == paths
+    assert paths[:7] == [
+        temp_path("a-0"),
+        temp_path("a-1"),
+        temp_path("a-2"),
+        temp_path("a-3"),
+        temp_path("a-4"),
+        temp_path("a-0/b-0"),
+        temp_path("a-0/b-1"),
+    ]
+
+
+def test_walk_entries_with_workers_early_close(temp_path):
+    for i in range(0, 5):
+        fsutil.create_file(temp_path(f"a-{i}/b/c.txt"))
+    entries = walk_entries(temp_path(), workers=4)
+    next(entries)
+    entries.close()
+
+
+if __name__ == "__main__":
+    pytest.main()